@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+from orator.benchmarks import Benchmark
+
+
+class CompileSelect(Benchmark):
+
+    name = "grammar.compile_select"
+
+    number = 1000
+
+    def setup(self):
+        self.query = (
+            self.db.table("bench_users")
+            .select("id", "name", "email")
+            .join("bench_posts", "bench_users.id", "=", "bench_posts.user_id")
+            .where("votes", ">", 10)
+            .where_in("bench_users.id", list(range(20)))
+            .or_where_null("email")
+            .group_by("bench_users.id")
+            .order_by("name")
+            .limit(10)
+            .offset(20)
+        )
+        self.grammar = self.query.get_grammar()
+
+    def run(self):
+        self.grammar.compile_select(self.query)
+
+
+class CompileInsert(Benchmark):
+
+    name = "grammar.compile_insert"
+
+    number = 1000
+
+    def setup(self):
+        self.query = self.db.table("bench_users")
+        self.grammar = self.query.get_grammar()
+        self.values = [
+            {"name": "User %d" % i, "email": "user%d@example.com" % i, "votes": i}
+            for i in range(50)
+        ]
+
+    def run(self):
+        self.grammar.compile_insert(self.query, self.values)
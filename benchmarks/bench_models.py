@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import pendulum
+from orator.benchmarks import Benchmark
+from .models import BenchUser
+
+
+def _records(count):
+    now = pendulum.utcnow()
+
+    return [
+        {
+            "id": i,
+            "name": "User %d" % i,
+            "email": "user%d@example.com" % i,
+            "votes": i,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+class Hydrate(Benchmark):
+
+    name = "model.hydrate"
+
+    def setup(self):
+        self.records = _records(100)
+
+    def run(self):
+        BenchUser.hydrate(self.records)
+
+
+class AttributesToDict(Benchmark):
+
+    name = "model.attributes_to_dict"
+
+    def setup(self):
+        self.users = BenchUser.hydrate(_records(100))
+
+    def run(self):
+        for user in self.users:
+            user.attributes_to_dict()
+
+
+class ToJson(Benchmark):
+
+    name = "model.to_json"
+
+    def setup(self):
+        self.users = BenchUser.hydrate(_records(100))
+
+    def run(self):
+        self.users.to_json()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+from orator.benchmarks import Benchmark
+from .models import BenchUser, BenchPhoto, create_tables, drop_tables, seed
+
+
+class EagerLoadBenchmark(Benchmark):
+
+    number = 10
+
+    def setup(self):
+        drop_tables(self.schema)
+        create_tables(self.schema)
+        seed(self.db)
+
+    def teardown(self):
+        drop_tables(self.schema)
+
+
+class EagerLoadHasMany(EagerLoadBenchmark):
+
+    name = "eager_load.has_many"
+
+    def run(self):
+        BenchUser.with_("posts").get()
+
+
+class EagerLoadBelongsToMany(EagerLoadBenchmark):
+
+    name = "eager_load.belongs_to_many"
+
+    def run(self):
+        BenchUser.with_("roles").get()
+
+
+class EagerLoadMorphTo(EagerLoadBenchmark):
+
+    name = "eager_load.morph_to"
+
+    def run(self):
+        BenchPhoto.with_("imageable").get()
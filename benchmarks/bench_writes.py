@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+from orator.benchmarks import Benchmark
+from .models import create_tables, drop_tables, seed
+
+
+class BulkInsert(Benchmark):
+
+    name = "write.bulk_insert"
+
+    number = 20
+
+    def setup(self):
+        drop_tables(self.schema)
+        create_tables(self.schema)
+
+        self.rows = [
+            {"name": "User %d" % i, "email": "user%d@example.com" % i, "votes": i}
+            for i in range(100)
+        ]
+
+    def run(self):
+        self.db.table("bench_users").insert(self.rows)
+
+    def teardown(self):
+        drop_tables(self.schema)
+
+
+class ChunkStreaming(Benchmark):
+
+    name = "read.chunk"
+
+    number = 10
+
+    def setup(self):
+        drop_tables(self.schema)
+        create_tables(self.schema)
+        seed(self.db, users=1000, posts=1, roles=1, photos=0)
+
+    def run(self):
+        for users in self.db.table("bench_users").chunk(100):
+            pass
+
+    def teardown(self):
+        drop_tables(self.schema)
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+from orator import Model
+from orator.orm import has_many, belongs_to_many, morph_to, morph_many
+
+
+class BenchUser(Model):
+
+    __table__ = "bench_users"
+    __guarded__ = []
+
+    @has_many("user_id")
+    def posts(self):
+        return BenchPost
+
+    @belongs_to_many("bench_roles_users", "user_id", "role_id")
+    def roles(self):
+        return BenchRole
+
+
+class BenchPost(Model):
+
+    __table__ = "bench_posts"
+    __guarded__ = []
+
+    @morph_many("imageable")
+    def photos(self):
+        return BenchPhoto
+
+
+class BenchRole(Model):
+
+    __table__ = "bench_roles"
+    __guarded__ = []
+
+
+class BenchPhoto(Model):
+
+    __table__ = "bench_photos"
+    __guarded__ = []
+
+    @morph_to
+    def imageable(self):
+        return
+
+
+def create_tables(schema):
+    with schema.create("bench_users") as table:
+        table.increments("id")
+        table.string("name")
+        table.string("email")
+        table.integer("votes").default(0)
+        table.timestamps()
+
+    with schema.create("bench_posts") as table:
+        table.increments("id")
+        table.integer("user_id")
+        table.string("title")
+        table.text("content")
+        table.timestamps()
+
+    with schema.create("bench_roles") as table:
+        table.increments("id")
+        table.string("name")
+        table.timestamps()
+
+    with schema.create("bench_roles_users") as table:
+        table.integer("user_id")
+        table.integer("role_id")
+
+    with schema.create("bench_photos") as table:
+        table.increments("id")
+        table.morphs("imageable")
+        table.string("name")
+        table.timestamps()
+
+
+def drop_tables(schema):
+    for table in [
+        "bench_photos",
+        "bench_roles_users",
+        "bench_roles",
+        "bench_posts",
+        "bench_users",
+    ]:
+        schema.drop_if_exists(table)
+
+
+def insert(db, table, rows, chunk_size=100):
+    for i in range(0, len(rows), chunk_size):
+        db.table(table).insert(rows[i : i + chunk_size])
+
+
+def seed(db, users=100, posts=5, roles=5, photos=2):
+    """
+    Fill the benchmark tables.
+    """
+    insert(
+        db,
+        "bench_users",
+        [
+            {"name": "User %d" % i, "email": "user%d@example.com" % i, "votes": i}
+            for i in range(1, users + 1)
+        ],
+    )
+    insert(
+        db,
+        "bench_posts",
+        [
+            {
+                "user_id": i % users + 1,
+                "title": "Post %d" % i,
+                "content": "Content of post %d" % i,
+            }
+            for i in range(users * posts)
+        ],
+    )
+    insert(db, "bench_roles", [{"name": "Role %d" % i} for i in range(1, roles + 1)])
+    insert(
+        db,
+        "bench_roles_users",
+        [
+            {"user_id": user, "role_id": role}
+            for user in range(1, users + 1)
+            for role in range(1, roles + 1)
+        ],
+    )
+    insert(
+        db,
+        "bench_photos",
+        [
+            {
+                "imageable_id": i % (users * posts) + 1,
+                "imageable_type": "bench_posts",
+                "name": "Photo %d" % i,
+            }
+            for i in range(users * posts * photos)
+        ],
+    )
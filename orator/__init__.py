@@ -2,8 +2,23 @@
 
 __version__ = "0.9.9"
 
-from .orm import Model, SoftDeletes, Collection, accessor, mutator, scope
-from .database_manager import DatabaseManager
-from .query.expression import QueryExpression
-from .schema import Schema
-from .pagination import Paginator, LengthAwarePaginator
+from .utils.lazy import lazy_module
+
+# The ORM, the drivers and their dependencies are only imported on first use
+lazy_module(
+    __name__,
+    globals(),
+    {
+        "Model": ".orm",
+        "SoftDeletes": ".orm",
+        "Collection": ".orm",
+        "accessor": ".orm",
+        "mutator": ".orm",
+        "scope": ".orm",
+        "DatabaseManager": ".database_manager",
+        "QueryExpression": ".query.expression",
+        "Schema": ".schema",
+        "Paginator": ".pagination",
+        "LengthAwarePaginator": ".pagination",
+    },
+)
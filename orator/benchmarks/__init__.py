@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from .benchmark import Benchmark
+from .runner import BenchmarkRunner, BenchmarkResult
+from .baseline import Baseline, Regression
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+import os
+import platform
+import simplejson as json
+from collections import OrderedDict
+
+
+class Regression(object):
+    """
+    A metric slower than its baseline.
+    """
+
+    def __init__(self, name, database, baseline, current):
+        """
+        :param name: The benchmark name
+        :type name: str
+
+        :param database: The database name
+        :type database: str
+
+        :param baseline: The baseline time in seconds
+        :type baseline: float
+
+        :param current: The current time in seconds
+        :type current: float
+        """
+        self.name = name
+        self.database = database
+        self.baseline = baseline
+        self.current = current
+
+    @property
+    def change(self):
+        """
+        The slowdown in percent.
+
+        :rtype: float
+        """
+        return (self.current / self.baseline - 1) * 100
+
+    def __repr__(self):
+        return "<Regression %s [%s] +%.1f%%>" % (self.name, self.database, self.change)
+
+
+class Baseline(object):
+    """
+    The reference times of the benchmarks, by database.
+    """
+
+    def __init__(self, metrics=None):
+        """
+        :param metrics: The times in seconds by database and benchmark name
+        :type metrics: dict or None
+        """
+        self._metrics = metrics or OrderedDict()
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a baseline file, an empty baseline if it does not exist.
+
+        :param path: The path to the file
+        :type path: str
+
+        :rtype: Baseline
+        """
+        if not os.path.exists(path):
+            return cls()
+
+        with open(path) as fh:
+            data = json.load(fh, object_pairs_hook=OrderedDict)
+
+        return cls(data.get("metrics"))
+
+    def save(self, path):
+        """
+        Save the baseline to a file.
+
+        :param path: The path to the file
+        :type path: str
+        """
+        from .. import __version__
+
+        data = OrderedDict(
+            [
+                ("orator", __version__),
+                ("python", platform.python_version()),
+                ("metrics", self._metrics),
+            ]
+        )
+
+        with open(path, "w") as fh:
+            json.dump(data, fh, indent=4)
+            fh.write("\n")
+
+    def get(self, name, database):
+        """
+        Get the reference time of a benchmark.
+
+        :rtype: float or None
+        """
+        return self._metrics.get(database, {}).get(name)
+
+    def update(self, results):
+        """
+        Use the times of benchmark results as reference.
+
+        :param results: The benchmark results
+        :type results: list
+        """
+        for result in results:
+            self._metrics.setdefault(result.database, OrderedDict())[
+                result.name
+            ] = result.time
+
+    def compare(self, results, threshold=10):
+        """
+        Compare benchmark results to the baseline.
+
+        :param results: The benchmark results
+        :type results: list
+
+        :param threshold: The slowdown, in percent, above which a metric regresses
+        :type threshold: float
+
+        :rtype: list of Regression
+        """
+        regressions = []
+
+        for result in results:
+            baseline = self.get(result.name, result.database)
+
+            if not baseline:
+                continue
+
+            if result.time > baseline * (1 + threshold / 100.0):
+                regressions.append(
+                    Regression(result.name, result.database, baseline, result.time)
+                )
+
+        return regressions
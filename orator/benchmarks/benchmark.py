@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import inflection
+
+
+class Benchmark(object):
+    """
+    A benchmark measuring an operation against a database.
+
+    Only the run() method is timed: it is called ``number`` times
+    per measure and the best of ``repeat`` measures is kept.
+    """
+
+    # The name of the benchmark, derived from the class name if None
+    name = None
+
+    # The number of calls of run() per measure
+    number = 100
+
+    # The number of measures
+    repeat = 5
+
+    # The names of the databases to run against, all of them if None
+    databases = None
+
+    def __init__(self, db):
+        """
+        :param db: The database manager of the benchmarked database
+        :type db: orator.DatabaseManager
+        """
+        self._db = db
+
+    @classmethod
+    def get_name(cls):
+        """
+        Get the name of the benchmark.
+
+        :rtype: str
+        """
+        return cls.name or inflection.underscore(cls.__name__)
+
+    @classmethod
+    def supports(cls, database):
+        """
+        Determine if the benchmark can run against a database.
+
+        :param database: The database name
+        :type database: str
+
+        :rtype: bool
+        """
+        return cls.databases is None or database in cls.databases
+
+    @property
+    def db(self):
+        return self._db
+
+    @property
+    def schema(self):
+        return self._db.connection().get_schema_builder()
+
+    def setup(self):
+        """
+        Prepare the benchmark, before the measures.
+        """
+        pass
+
+    def run(self):
+        """
+        Run the benchmarked operation.
+        """
+        raise NotImplementedError()
+
+    def teardown(self):
+        """
+        Clean up after the measures.
+        """
+        pass
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+from collections import OrderedDict
+from timeit import default_timer
+
+from ..database_manager import DatabaseManager
+from ..orm import Model
+
+
+class BenchmarkResult(object):
+    """
+    The measures of a benchmark against a database.
+    """
+
+    def __init__(self, name, database, number, timings):
+        """
+        :param name: The benchmark name
+        :type name: str
+
+        :param database: The database name
+        :type database: str
+
+        :param number: The number of calls per measure
+        :type number: int
+
+        :param timings: The duration of each measure in seconds
+        :type timings: list
+        """
+        self.name = name
+        self.database = database
+        self.number = number
+        self.timings = timings
+
+    @property
+    def time(self):
+        """
+        The best time of a single call, in seconds.
+
+        :rtype: float
+        """
+        return min(self.timings) / self.number
+
+    @property
+    def ops(self):
+        """
+        The number of calls per second.
+
+        :rtype: float
+        """
+        return 1 / self.time if self.time else float("inf")
+
+    def __repr__(self):
+        return "<BenchmarkResult %s [%s] %.3fus>" % (
+            self.name,
+            self.database,
+            self.time * 1000000,
+        )
+
+
+class BenchmarkRunner(object):
+    """
+    Runs benchmarks against the available databases.
+    """
+
+    def __init__(self, databases=None):
+        """
+        :param databases: The configuration of the databases by name,
+                          the default ones if None
+        :type databases: dict or None
+        """
+        if databases is None:
+            databases = self.get_default_databases()
+
+        self._databases = databases
+
+    @classmethod
+    def get_default_databases(cls):
+        """
+        Get the default databases: in-memory and file SQLite,
+        and the local PostgreSQL and MySQL servers of the test suite.
+
+        :rtype: OrderedDict
+        """
+        return OrderedDict(
+            [
+                ("sqlite", {"driver": "sqlite", "database": ":memory:"}),
+                ("sqlite-file", {"driver": "sqlite", "database": None}),
+                (
+                    "postgres",
+                    {
+                        "driver": "pgsql",
+                        "database": "orator_test",
+                        "user": "orator",
+                        "password": "orator",
+                    },
+                ),
+                (
+                    "mysql",
+                    {
+                        "driver": "mysql",
+                        "database": "orator_test",
+                        "user": "orator",
+                        "password": "orator",
+                    },
+                ),
+            ]
+        )
+
+    def get_databases(self):
+        return list(self._databases.keys())
+
+    def run(self, benchmarks, databases=None, callback=None):
+        """
+        Run benchmarks against the databases that can be reached.
+
+        :param benchmarks: The Benchmark classes
+        :type benchmarks: list
+
+        :param databases: The names of the databases to run against, all if None
+        :type databases: list or None
+
+        :param callback: A callback receiving each result
+        :type callback: callable or None
+
+        :return: The results and the names of the unreachable databases
+        :rtype: tuple
+        """
+        results = []
+        skipped = []
+
+        for name, config in self._databases.items():
+            if databases and name not in databases:
+                continue
+
+            with _DatabaseContext(name, config) as db:
+                if db is None:
+                    skipped.append(name)
+
+                    continue
+
+                for benchmark in benchmarks:
+                    if not benchmark.supports(name):
+                        continue
+
+                    result = self.measure(benchmark, name, db)
+                    results.append(result)
+
+                    if callback is not None:
+                        callback(result)
+
+        return results, skipped
+
+    def measure(self, benchmark, database, db):
+        """
+        Measure a benchmark against a database.
+
+        :param benchmark: The Benchmark class
+        :type benchmark: class
+
+        :param database: The database name
+        :type database: str
+
+        :param db: The database manager
+        :type db: orator.DatabaseManager
+
+        :rtype: BenchmarkResult
+        """
+        previous = Model.get_connection_resolver()
+        Model.set_connection_resolver(db)
+
+        instance = benchmark(db)
+        instance.setup()
+
+        try:
+            # Warming up
+            instance.run()
+
+            timings = []
+            for _ in range(benchmark.repeat):
+                start = default_timer()
+
+                for _ in range(benchmark.number):
+                    instance.run()
+
+                timings.append(default_timer() - start)
+        finally:
+            instance.teardown()
+
+            Model.set_connection_resolver(previous)
+
+        return BenchmarkResult(benchmark.get_name(), database, benchmark.number, timings)
+
+
+class _DatabaseContext(object):
+    """
+    Connects to a benchmarked database, yielding None if it can't be reached.
+    """
+
+    def __init__(self, name, config):
+        self._name = name
+        self._config = dict(config)
+        self._path = None
+        self._db = None
+
+    def __enter__(self):
+        if self._config.get("driver") == "sqlite" and self._config["database"] is None:
+            fd, self._path = tempfile.mkstemp(suffix=".db")
+            os.close(fd)
+
+            self._config["database"] = self._path
+
+        db = DatabaseManager({"default": self._name, self._name: self._config})
+
+        try:
+            db.connection().select("SELECT 1")
+        except Exception:
+            return
+
+        self._db = db
+
+        return db
+
+    def __exit__(self, *exc_info):
+        if self._db is not None:
+            self._db.disconnect()
+
+        if self._path is not None:
+            os.remove(self._path)
@@ -1,36 +1,107 @@
 # -*- coding: utf-8 -*-
 
-from cleo import Application
+from collections import OrderedDict
+from cleo import Application as BaseApplication
 from .. import __version__
+from ..utils.lazy import load_object
+
+
+class Application(BaseApplication):
+    """
+    An application whose commands are only imported when they are needed.
+    """
+
+    def __init__(self, name="UNKNOWN", version="UNKNOWN", complete=True):
+        self._lazy_commands = OrderedDict()
+
+        super(Application, self).__init__(name, version, complete)
+
+    def add_lazy(self, name, path):
+        """
+        Register a command without importing it.
+
+        :param name: The command name
+        :type name: str
+
+        :param path: The "module:class" path of the command
+        :type path: str
+        """
+        self._lazy_commands[name] = path
+
+    def get(self, name):
+        self._load_command(name)
+
+        return super(Application, self).get(name)
+
+    def has(self, name):
+        return name in self._lazy_commands or super(Application, self).has(name)
+
+    def find(self, name):
+        # An exact name only needs its own command,
+        # abbreviations and suggestions need all of them
+        if name in self._lazy_commands:
+            self._load_command(name)
+        else:
+            self._load_commands()
+
+        return super(Application, self).find(name)
+
+    def all(self, namespace=None):
+        self._load_commands()
+
+        return super(Application, self).all(namespace)
+
+    def get_namespaces(self):
+        self._load_commands()
+
+        return super(Application, self).get_namespaces()
+
+    def _load_command(self, name):
+        path = self._lazy_commands.pop(name, None)
+
+        if path is not None:
+            self.add(load_object(path)())
+
+    def _load_commands(self):
+        for name in list(self._lazy_commands):
+            self._load_command(name)
+
 
 application = Application("Orator", __version__, complete=True)
 
 # Migrations
-from .migrations import (
-    InstallCommand,
-    MigrateCommand,
-    MigrateMakeCommand,
-    RollbackCommand,
-    StatusCommand,
-    ResetCommand,
-    RefreshCommand,
-)
-
-application.add(InstallCommand())
-application.add(MigrateCommand())
-application.add(MigrateMakeCommand())
-application.add(RollbackCommand())
-application.add(StatusCommand())
-application.add(ResetCommand())
-application.add(RefreshCommand())
+application.add_lazy(
+    "migrate:install", "orator.commands.migrations.install_command:InstallCommand"
+)
+application.add_lazy(
+    "migrate", "orator.commands.migrations.migrate_command:MigrateCommand"
+)
+application.add_lazy(
+    "make:migration", "orator.commands.migrations.make_command:MigrateMakeCommand"
+)
+application.add_lazy(
+    "migrate:rollback", "orator.commands.migrations.rollback_command:RollbackCommand"
+)
+application.add_lazy(
+    "migrate:status", "orator.commands.migrations.status_command:StatusCommand"
+)
+application.add_lazy(
+    "migrate:reset", "orator.commands.migrations.reset_command:ResetCommand"
+)
+application.add_lazy(
+    "migrate:refresh", "orator.commands.migrations.refresh_command:RefreshCommand"
+)
 
 # Seeds
-from .seeds import SeedersMakeCommand, SeedCommand
-
-application.add(SeedersMakeCommand())
-application.add(SeedCommand())
+application.add_lazy(
+    "make:seed", "orator.commands.seeds.make_command:SeedersMakeCommand"
+)
+application.add_lazy("db:seed", "orator.commands.seeds.seed_command:SeedCommand")
 
 # Models
-from .models import ModelMakeCommand
+application.add_lazy(
+    "make:model", "orator.commands.models.make_command:ModelMakeCommand"
+)
 
-application.add(ModelMakeCommand())
+# Benchmarks
+application.add_lazy("bench", "orator.commands.benchmarks.bench_command:BenchCommand")
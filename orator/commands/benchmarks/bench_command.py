@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+import os
+from ..command import Command
+from ...benchmarks import Benchmark, BenchmarkRunner, Baseline
+from ...utils import load_module
+
+
+class BenchCommand(Command):
+    """
+    Run the benchmarks and compare them to a baseline.
+
+    bench
+        {--p|path= : The path to the benchmarks.
+                     Defaults to <comment>./benchmarks</comment>.}
+        {--d|database=* : The databases to run against.
+                          Defaults to all the reachable ones.}
+        {--f|filter= : Only run the benchmarks whose name contains the filter.}
+        {--b|baseline= : The baseline file.
+                         Defaults to <comment>baseline.json</comment> in the benchmarks path.}
+        {--t|threshold=10 : The slowdown, in percent, above which a benchmark fails.}
+        {--s|save : Save the results as the new baseline.}
+    """
+
+    needs_config = False
+
+    def handle(self):
+        """
+        Executes the command.
+        """
+        benchmarks = self._get_benchmarks()
+
+        if not benchmarks:
+            self.line("<comment>No benchmarks found</comment>")
+
+            return
+
+        baseline_path = self._get_baseline_path()
+        baseline = Baseline.load(baseline_path)
+        threshold = float(self.option("threshold"))
+
+        results, skipped = self._get_runner().run(
+            benchmarks,
+            self.option("database") or None,
+            lambda result: self._report(result, baseline),
+        )
+
+        for database in skipped:
+            self.line("<comment>Skipped:</comment> %s is not reachable" % database)
+
+        if self.option("save"):
+            baseline.update(results)
+            baseline.save(baseline_path)
+
+            self.info("Baseline saved to %s" % baseline_path)
+
+            return
+
+        regressions = baseline.compare(results, threshold)
+
+        if regressions:
+            for regression in regressions:
+                self.line(
+                    "<error>Regression:</error> %s [%s] is %.1f%% slower"
+                    % (regression.name, regression.database, regression.change)
+                )
+
+            return 1
+
+    def _report(self, result, baseline):
+        line = "<info>%s</info> [%s] <fg=cyan>%.3fus</> (%d ops/s)" % (
+            result.name,
+            result.database,
+            result.time * 1000000,
+            result.ops,
+        )
+
+        reference = baseline.get(result.name, result.database)
+        if reference:
+            line += " %+.1f%%" % ((result.time / reference - 1) * 100)
+
+        self.line(line)
+
+    def _get_runner(self):
+        return BenchmarkRunner()
+
+    def _get_benchmarks(self):
+        """
+        Load the benchmark classes of the bench_*.py files.
+
+        :rtype: list
+        """
+        path = self._get_path()
+
+        if not os.path.isdir(path):
+            return []
+
+        # Loading parent module
+        if os.path.exists(os.path.join(path, "__init__.py")):
+            load_module("benchmarks", os.path.join(path, "__init__.py"))
+
+        name_filter = self.option("filter")
+        benchmarks = []
+
+        for filename in sorted(os.listdir(path)):
+            if not filename.startswith("bench_") or not filename.endswith(".py"):
+                continue
+
+            name = "benchmarks.%s" % filename[:-3]
+            mod = load_module(name, os.path.join(path, filename))
+
+            for value in list(vars(mod).values()):
+                if not isinstance(value, type) or not issubclass(value, Benchmark):
+                    continue
+
+                # Skipping the imported and the abstract benchmarks
+                if value.__module__ != name or value.run == Benchmark.run:
+                    continue
+
+                if name_filter and name_filter not in value.get_name():
+                    continue
+
+                benchmarks.append(value)
+
+        return benchmarks
+
+    def _get_path(self):
+        path = self.option("path")
+        if path is None:
+            path = os.path.join(os.getcwd(), "benchmarks")
+
+        return path
+
+    def _get_baseline_path(self):
+        path = self.option("baseline")
+        if path is None:
+            path = os.path.join(self._get_path(), "baseline.json")
+
+        return path
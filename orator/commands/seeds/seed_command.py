@@ -3,6 +3,7 @@
 import importlib
 import inflection
 import os
+import time
 from cleo import InputOption
 from orator import DatabaseManager
 from .base_command import BaseCommand
@@ -32,9 +33,11 @@ class SeedCommand(BaseCommand):
 
         self.resolver.set_default_connection(self.option("database"))
 
+        start = time.time()
+
         self._get_seeder().run()
 
-        self.info("Database seeded!")
+        self.info("Database seeded! (%.2fs)" % (time.time() - start))
 
     def _get_seeder(self):
         name = self._parse_name(self.option("seeder"))
@@ -1,6 +1,14 @@
 # -*- coding: utf-8 -*-
 
-from .connection import Connection
-from .mysql_connection import MySQLConnection
-from .postgres_connection import PostgresConnection
-from .sqlite_connection import SQLiteConnection
+from ..utils.lazy import lazy_module
+
+lazy_module(
+    __name__,
+    globals(),
+    {
+        "Connection": ".connection",
+        "MySQLConnection": ".mysql_connection",
+        "PostgresConnection": ".postgres_connection",
+        "SQLiteConnection": ".sqlite_connection",
+    },
+)
@@ -4,14 +4,19 @@ import time
 import logging
 from functools import wraps
 from contextlib import contextmanager
+from collections import OrderedDict
 from .connection_interface import ConnectionInterface
+from .pipeline import Pipeline
 from ..query.grammars.grammar import QueryGrammar
 from ..query import QueryBuilder
+from ..query.counters import CounterBuffer
+from ..query.budget import QueryBudget
 from ..query.expression import QueryExpression
 from ..query.processors.processor import QueryProcessor
 from ..schema.builder import SchemaBuilder
 from ..dbal.schema_manager import SchemaManager
 from ..exceptions.query import QueryException
+from ..exceptions import ArgumentError
 
 
 query_logger = logging.getLogger("orator.connection.queries")
@@ -43,6 +48,28 @@ def run(wrapped):
     return _run
 
 
+def pipelined(wrapped):
+    """
+    Queue the statement in the active pipeline instead of executing it.
+    """
+
+    @wraps(wrapped)
+    def _pipelined(self, query, bindings=None, *args, **kwargs):
+        pipeline = self.get_pipeline()
+
+        if pipeline is None:
+            return wrapped(self, query, bindings, *args, **kwargs)
+
+        return pipeline.queue(
+            lambda: wrapped(self, query, bindings, *args, **kwargs),
+            wrapped.__name__,
+            query,
+            bindings,
+        )
+
+    return _pipelined
+
+
 class Connection(ConnectionInterface):
 
     name = None
@@ -90,6 +117,12 @@ class Connection(ConnectionInterface):
 
         self._transactions = 0
 
+        self._before_commit = OrderedDict()
+
+        self._counters = {}
+
+        self._pipeline = None
+
         self._pretending = False
 
         self._builder_class = builder_class
@@ -101,6 +134,7 @@ class Connection(ConnectionInterface):
 
         self._logging_queries = config.get("log_queries", False)
         self._logged_queries = []
+        self._query_listeners = []
 
         # Setting the marker based on config
         self._marker = None
@@ -119,6 +153,7 @@ class Connection(ConnectionInterface):
 
     def use_default_query_grammar(self):
         self._query_grammar = self.get_default_query_grammar()
+        self._query_grammar.set_native_dates(self._config.get("native_dates", False))
 
     def get_default_query_grammar(self):
         return QueryGrammar()
@@ -163,6 +198,38 @@ class Connection(ConnectionInterface):
 
         return query.from_(table)
 
+    def counters(self, table, column, key="id", interval=1.0, max_keys=1000):
+        """
+        Get a buffer aggregating the increments of a counter column in memory.
+
+        The same buffer is returned for a given table, column and key.
+
+        :param table: The database table
+        :type table: str
+
+        :param column: The counter column
+        :type column: str
+
+        :param key: The key column
+        :type key: str
+
+        :param interval: The maximum delay, in seconds, between two flushes
+        :type interval: float or None
+
+        :param max_keys: The number of keys above which the buffer is flushed
+        :type max_keys: int or None
+
+        :rtype: CounterBuffer
+        """
+        name = (table, column, key)
+
+        if name not in self._counters:
+            self._counters[name] = CounterBuffer(
+                self, table, column, key, interval, max_keys
+            )
+
+        return self._counters[name]
+
     def query(self):
         """
         Begin a fluent query
@@ -201,6 +268,9 @@ class Connection(ConnectionInterface):
 
     @run
     def select(self, query, bindings=None, use_read_connection=True):
+        if self._pipeline is not None:
+            self._pipeline.flush()
+
         if self.pretending():
             return []
 
@@ -213,6 +283,9 @@ class Connection(ConnectionInterface):
     def select_many(
         self, size, query, bindings=None, use_read_connection=True, abort=False
     ):
+        if self._pipeline is not None:
+            self._pipeline.flush()
+
         if self.pretending():
             yield []
         else:
@@ -255,6 +328,7 @@ class Connection(ConnectionInterface):
     def delete(self, query, bindings=None):
         return self.affecting_statement(query, bindings)
 
+    @pipelined
     @run
     def statement(self, query, bindings=None):
         if self.pretending():
@@ -264,6 +338,7 @@ class Connection(ConnectionInterface):
 
         return self._new_cursor().execute(query, bindings)
 
+    @pipelined
     @run
     def affecting_statement(self, query, bindings=None):
         if self.pretending():
@@ -276,6 +351,112 @@ class Connection(ConnectionInterface):
 
         return cursor.rowcount
 
+    @contextmanager
+    def pipeline(self):
+        """
+        Queue the write statements executed in the context
+        and send them together when leaving it.
+
+        The statements return PipelineResult handles instead of their results.
+        The pending statements are sent before any select.
+
+        :rtype: Pipeline
+        """
+        if self._pipeline is not None:
+            yield self._pipeline
+
+            return
+
+        pipeline = self._pipeline = Pipeline(self)
+
+        try:
+            yield pipeline
+
+            pipeline.flush()
+        except Exception as e:
+            pipeline.discard(e)
+
+            raise
+        finally:
+            self._pipeline = None
+
+    def get_pipeline(self):
+        """
+        Get the pipeline in which the statements must be queued.
+
+        :rtype: Pipeline or None
+        """
+        if self._pipeline is None or self._pipeline.is_flushing():
+            return None
+
+        return self._pipeline
+
+    def execute_pipeline(self, entries):
+        """
+        Execute the statements of a pipeline within a single transaction.
+
+        :param entries: The queued statements
+        :type entries: list of orator.connections.pipeline.PipelineEntry
+        """
+        results = []
+
+        self.begin_transaction()
+
+        try:
+            for batch in self._group_pipeline_entries(entries):
+                if len(batch) == 1:
+                    results.append((batch[0], batch[0].callback()))
+                else:
+                    self._execute_statements(batch)
+
+                    results += [(entry, True) for entry in batch]
+
+            self.commit()
+        except Exception as e:
+            self.rollback()
+
+            for entry in entries:
+                entry.result.set_exception(e)
+
+            raise
+
+        for entry, result in results:
+            entry.result.set_result(result)
+
+    def _group_pipeline_entries(self, entries):
+        """
+        Group the consecutive statements that can be sent in a single request.
+
+        :rtype: list
+        """
+        if not self._supports_multi_statements() or self.pretending():
+            return [[entry] for entry in entries]
+
+        batches = []
+        for entry in entries:
+            if (
+                batches
+                and entry.kind == "statement"
+                and batches[-1][-1].kind == "statement"
+            ):
+                batches[-1].append(entry)
+            else:
+                batches.append([entry])
+
+        return batches
+
+    def _supports_multi_statements(self):
+        return False
+
+    def _execute_statements(self, entries):
+        """
+        Execute several statements in a single request.
+
+        :param entries: The queued statements
+        :type entries: list
+        """
+        raise NotImplementedError()
+
     def _new_cursor(self):
         self._cursor = self.get_connection().cursor()
 
@@ -297,8 +478,71 @@ class Connection(ConnectionInterface):
 
         return bindings
 
+    def transaction(self, callback=None, retries=0, backoff=None):
+        """
+        Execute operations within a transaction.
+
+        Without a callback, a context manager is returned. With a callback,
+        the callback is executed within the transaction and, if it fails
+        because of a deadlock or a serialization failure, the whole
+        transaction is replayed up to the given number of retries.
+
+        :param callback: The callback to execute within the transaction
+        :type callback: callable or None
+
+        :param retries: The number of times to retry on concurrency errors
+        :type retries: int
+
+        :param backoff: The delay between retries, in seconds. Either a base
+                        delay that is doubled after each attempt or a callable
+                        receiving the attempt number.
+        :type backoff: float or callable or None
+
+        :return: A context manager or the result of the callback
+        """
+        if callback is None:
+            if retries:
+                raise ArgumentError("Retrying a transaction requires a callback")
+
+            return self._transaction()
+
+        attempt = 0
+
+        while True:
+            self.begin_transaction()
+
+            try:
+                result = callback(self)
+
+                self.commit()
+            except Exception as e:
+                self.rollback()
+
+                # Retrying only makes sense for the outermost transaction since
+                # a concurrency error aborts the whole unit of work, savepoints
+                # included, so nested transactions let the error bubble up.
+                if (
+                    attempt < retries
+                    and self._transactions == 0
+                    and self._caused_by_concurrency_error(e)
+                ):
+                    attempt += 1
+
+                    connection_logger.debug(
+                        "Retrying transaction (attempt %d of %d): %s"
+                        % (attempt, retries, e)
+                    )
+
+                    self._sleep_before_retry(attempt, backoff)
+
+                    continue
+
+                raise
+
+            return result
+
     @contextmanager
-    def transaction(self):
+    def _transaction(self):
         self.begin_transaction()
 
         try:
@@ -313,23 +557,135 @@ class Connection(ConnectionInterface):
             self.rollback()
             raise
 
+    def _sleep_before_retry(self, attempt, backoff):
+        if not backoff:
+            return
+
+        if callable(backoff):
+            delay = backoff(attempt)
+        else:
+            delay = backoff * 2 ** (attempt - 1)
+
+        if delay:
+            time.sleep(delay)
+
     def begin_transaction(self):
+        # The statements of a transaction, savepoints included, would be queued
+        # while its boundaries run immediately. Pipelines run in a transaction anyway.
+        if self.get_pipeline() is not None:
+            raise RuntimeError("Transactions can't be started inside a pipeline")
+
+        if self._transactions == 0:
+            self._reconnect_if_missing_connection()
+
+            self._create_transaction()
+        elif self._query_grammar.supports_savepoints():
+            self._create_savepoint()
+
         self._transactions += 1
 
     def commit(self):
         if self._transactions == 1:
-            self._connection.commit()
+            self._run_before_commit_callbacks()
 
-        self._transactions -= 1
+            self._commit_transaction()
+        elif self._transactions > 1 and self._query_grammar.supports_savepoints():
+            self._release_savepoint()
+
+        self._transactions = max(0, self._transactions - 1)
 
     def rollback(self):
         if self._transactions == 1:
             self._transactions = 0
+            self._before_commit.clear()
+
+            self._rollback_transaction()
+        elif self._transactions > 1:
+            if self._query_grammar.supports_savepoints():
+                self._rollback_to_savepoint()
 
-            self._connection.rollback()
-        else:
             self._transactions -= 1
 
+    def before_commit(self, callback, key=None):
+        """
+        Register a callback to run within the current transaction,
+        right before the outermost transaction is committed.
+
+        The callbacks are discarded if the transaction is rolled back
+        and called immediately if no transaction is active.
+
+        :param callback: The callback
+        :type callback: callable
+
+        :param key: The key identifying the callback. A callback is not
+                    registered if one was already registered with the same key.
+        :type key: mixed
+
+        :return: The callback registered with the key
+        :rtype: callable
+        """
+        if self._transactions == 0:
+            callback()
+
+            return callback
+
+        if key is None:
+            key = callback
+
+        if key not in self._before_commit:
+            self._before_commit[key] = callback
+
+        return self._before_commit[key]
+
+    def _run_before_commit_callbacks(self):
+        # Callbacks may register new callbacks
+        while self._before_commit:
+            _, callback = self._before_commit.popitem(last=False)
+
+            callback()
+
+    def _create_transaction(self):
+        """
+        Start the outermost transaction on the underlying connection.
+        """
+        pass
+
+    def _commit_transaction(self):
+        """
+        Commit the outermost transaction on the underlying connection.
+        """
+        self._connection.commit()
+
+    def _rollback_transaction(self):
+        """
+        Rollback the outermost transaction on the underlying connection.
+        """
+        self._connection.rollback()
+
+    def _create_savepoint(self):
+        self.statement(
+            self._query_grammar.compile_savepoint(
+                self._get_savepoint_name(self._transactions + 1)
+            )
+        )
+
+    def _release_savepoint(self):
+        self.statement(
+            self._query_grammar.compile_savepoint_release(
+                self._get_savepoint_name(self._transactions)
+            )
+        )
+
+    def _rollback_to_savepoint(self):
+        self.statement(
+            self._query_grammar.compile_savepoint_rollback(
+                self._get_savepoint_name(self._transactions)
+            )
+        )
+
+    def _get_savepoint_name(self, level):
+        return "trans%d" % level
+
     def transaction_level(self):
         return self._transactions
 
@@ -377,15 +733,46 @@ class Connection(ConnectionInterface):
 
         return False
 
+    def _caused_by_concurrency_error(self, e):
+        """
+        Determine if the given exception was caused by a deadlock
+        or a serialization failure.
+
+        :param e: The exception
+        :type e: Exception
+
+        :rtype: bool
+        """
+        message = str(getattr(e, "previous", e)).lower()
+
+        for s in [
+            "deadlock detected",
+            "deadlock found when trying to get lock",
+            "could not serialize access",
+            "lock wait timeout exceeded",
+            "database is locked",
+            "database table is locked",
+        ]:
+            if s in message:
+                return True
+
+        return False
+
     def disconnect(self):
         connection_logger.debug("%s is disconnecting" % self.__class__.__name__)
-        if self._connection:
-            self._connection.close()
+        try:
+            if self._connection:
+                for counters in self._counters.values():
+                    counters.flush()
+        finally:
+            # The connections are closed even if pending increments can't be written
+            if self._connection:
+                self._connection.close()
 
-        if self._read_connection and self._connection != self._read_connection:
-            self._read_connection.close()
+            if self._read_connection and self._connection != self._read_connection:
+                self._read_connection.close()
 
-        self.set_connection(None).set_read_connection(None)
+            self.set_connection(None).set_read_connection(None)
 
         connection_logger.debug("%s disconnected" % self.__class__.__name__)
 
@@ -404,6 +791,9 @@ class Connection(ConnectionInterface):
         if self.pretending():
             self._logged_queries.append(self._get_cursor_query(query, bindings))
 
+        for listener in self._query_listeners:
+            listener(query, bindings, time_)
+
         if not self._logging_queries:
             return
 
@@ -431,6 +821,47 @@ class Connection(ConnectionInterface):
     def get_logged_queries(self):
         return self._logged_queries
 
+    def listen(self, callback):
+        """
+        Register a callback executed each time a query is run.
+
+        :param callback: A callable receiving the query, its bindings
+                         and the elapsed time in milliseconds
+        :type callback: callable
+        """
+        self._query_listeners.append(callback)
+
+    def query_budget(self, max_queries=None, max_time_ms=None, allow_duplicates=True):
+        """
+        Get a context manager checking that the queries run on the connection
+        stay within a budget.
+
+        :param max_queries: The maximum number of queries
+        :type max_queries: int or None
+
+        :param max_time_ms: The maximum total duration of the queries in milliseconds
+        :type max_time_ms: float or None
+
+        :param allow_duplicates: Whether running the same query with the same bindings
+                                 more than once is allowed
+        :type allow_duplicates: bool
+
+        :rtype: orator.query.budget.QueryBudget
+        """
+        return QueryBudget(
+            max_queries, max_time_ms, allow_duplicates, connections=[self]
+        )
+
+    def remove_listener(self, callback):
+        """
+        Remove a previously registered query callback.
+
+        :param callback: The callback to remove
+        :type callback: callable
+        """
+        if callback in self._query_listeners:
+            self._query_listeners.remove(callback)
+
     def get_connection(self):
         return self._connection
 
@@ -469,6 +900,15 @@ class Connection(ConnectionInterface):
     def get_config(self, option):
         return self._config.get(option)
 
+    def is_thread_safe(self):
+        """
+        Determine whether the connection can be used
+        from other threads than the one which opened it.
+
+        :rtype: bool
+        """
+        return True
+
     def get_query_grammar(self):
         return self._query_grammar
 
@@ -167,6 +167,14 @@ class ConnectionInterface(object):
     def transaction_level(self):
         raise NotImplementedError()
 
+    def get_pipeline(self):
+        """
+        Get the pipeline in which the statements must be queued.
+
+        :rtype: orator.connections.pipeline.Pipeline or None
+        """
+        return None
+
     def pretend(self):
         raise NotImplementedError()
 
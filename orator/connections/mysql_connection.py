@@ -37,9 +37,7 @@ class MySQLConnection(Connection):
     def get_schema_manager(self):
         return MySQLSchemaManager(self)
 
-    def begin_transaction(self):
-        self._reconnect_if_missing_connection()
-
+    def _create_transaction(self):
         try:
             self._connection.autocommit(False)
         except Exception as e:
@@ -49,23 +47,23 @@ class MySQLConnection(Connection):
             else:
                 raise
 
-        super(MySQLConnection, self).begin_transaction()
+    def _commit_transaction(self):
+        self._connection.commit()
+        self._connection.autocommit(True)
 
-    def commit(self):
-        if self._transactions == 1:
-            self._connection.commit()
-            self._connection.autocommit(True)
+    def _rollback_transaction(self):
+        self._connection.rollback()
+        self._connection.autocommit(True)
 
-        self._transactions -= 1
+    def _caused_by_concurrency_error(self, e):
+        previous = getattr(e, "previous", e)
+        args = getattr(previous, "args", ())
 
-    def rollback(self):
-        if self._transactions == 1:
-            self._transactions = 0
+        # ER_LOCK_DEADLOCK and ER_LOCK_WAIT_TIMEOUT
+        if args and args[0] in (1213, 1205):
+            return True
 
-            self._connection.rollback()
-            self._connection.autocommit(True)
-        else:
-            self._transactions -= 1
+        return super(MySQLConnection, self)._caused_by_concurrency_error(e)
 
     def _get_cursor_query(self, query, bindings):
         if not hasattr(self._cursor, "_last_executed") or self._pretending:
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+
+class PipelineResult(object):
+    """
+    A handle on the result of a statement queued in a pipeline.
+
+    The result is available once the pipeline has been sent.
+    Asking for it before that sends the pending statements.
+    """
+
+    def __init__(self, pipeline):
+        """
+        :param pipeline: The pipeline
+        :type pipeline: Pipeline
+        """
+        self._pipeline = pipeline
+        self._done = False
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+
+    def done(self):
+        """
+        Determine if the statement has been executed or has failed.
+
+        :rtype: bool
+        """
+        return self._done
+
+    def result(self):
+        """
+        Get the result of the statement, sending the pipeline if needed.
+
+        :raises: The exception raised by the statement
+        """
+        if not self._done:
+            self._pipeline.flush()
+
+        if self._exception is not None:
+            raise self._exception
+
+        return self._result
+
+    def exception(self):
+        """
+        Get the exception raised by the statement, sending the pipeline if needed.
+
+        :rtype: Exception or None
+        """
+        if not self._done:
+            try:
+                self._pipeline.flush()
+            except Exception:
+                pass
+
+        return self._exception
+
+    def add_done_callback(self, callback):
+        """
+        Register a callback called with the handle once the statement is done.
+
+        :param callback: The callback
+        :type callback: callable
+        """
+        if self._done:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+
+    def set_result(self, result):
+        self._result = result
+        self._finish()
+
+    def set_exception(self, exception):
+        self._exception = exception
+        self._finish()
+
+    def _finish(self):
+        self._done = True
+
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def __repr__(self):
+        if not self._done:
+            return "<PipelineResult pending>"
+
+        if self._exception is not None:
+            return "<PipelineResult exception=%r>" % self._exception
+
+        return "<PipelineResult result=%r>" % self._result
+
+
+class PipelineEntry(object):
+    """
+    A statement queued in a pipeline.
+    """
+
+    def __init__(self, kind, callback, query, bindings, result):
+        """
+        :param kind: The connection method queuing the statement
+        :type kind: str
+
+        :param callback: The function executing the statement
+        :type callback: callable
+
+        :param query: The SQL statement
+        :type query: str
+
+        :param bindings: The statement bindings
+        :type bindings: list
+
+        :param result: The handle on the result
+        :type result: PipelineResult
+        """
+        self.kind = kind
+        self.callback = callback
+        self.query = query
+        self.bindings = bindings
+        self.result = result
+
+
+class Pipeline(object):
+    """
+    Queues the write statements run against a connection
+    to send them together.
+    """
+
+    def __init__(self, connection):
+        """
+        :param connection: The connection
+        :type connection: orator.connections.Connection
+        """
+        self._connection = connection
+        self._entries = []
+        self._flushing = False
+
+    def queue(self, callback, kind="statement", query=None, bindings=None):
+        """
+        Queue a statement.
+
+        :param callback: The function executing the statement
+        :type callback: callable
+
+        :param kind: The kind of statement
+        :type kind: str
+
+        :param query: The SQL statement
+        :type query: str
+
+        :param bindings: The statement bindings
+        :type bindings: list
+
+        :rtype: PipelineResult
+        """
+        result = PipelineResult(self)
+
+        self._entries.append(PipelineEntry(kind, callback, query, bindings, result))
+
+        return result
+
+    def is_flushing(self):
+        return self._flushing
+
+    def flush(self):
+        """
+        Send the queued statements.
+        """
+        if self._flushing or not self._entries:
+            return
+
+        entries, self._entries = self._entries, []
+
+        self._flushing = True
+
+        try:
+            self._connection.execute_pipeline(entries)
+        finally:
+            self._flushing = False
+
+    def discard(self, exception):
+        """
+        Drop the queued statements, failing their handles.
+
+        :param exception: The exception set on the handles
+        :type exception: Exception
+        """
+        entries, self._entries = self._entries, []
+
+        for entry in entries:
+            entry.result.set_exception(exception)
+
+    def __len__(self):
+        return len(self._entries)
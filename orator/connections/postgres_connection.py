@@ -2,11 +2,12 @@
 
 from __future__ import division
 from ..utils import PY2
-from .connection import Connection, run
+from .connection import Connection, run, pipelined
 from ..query.grammars.postgres_grammar import PostgresQueryGrammar
 from ..query.processors.postgres_processor import PostgresQueryProcessor
 from ..schema.grammars import PostgresSchemaGrammar
 from ..dbal.postgres_schema_manager import PostgresSchemaManager
+from ..connectors.postgres_connector import BaseDictCursor
 
 
 class PostgresConnection(Connection):
@@ -25,6 +26,7 @@ class PostgresConnection(Connection):
     def get_schema_manager(self):
         return PostgresSchemaManager(self)
 
+    @pipelined
     @run
     def statement(self, query, bindings=None):
         if self.pretending():
@@ -36,26 +38,53 @@ class PostgresConnection(Connection):
 
         return True
 
-    def begin_transaction(self):
+    def _supports_multi_statements(self):
+        # The statements are interpolated client-side,
+        # which requires the queries to use the default placeholder.
+        return self._marker is None
+
+    def _execute_statements(self, entries):
+        # A cursor not converting placeholders,
+        # since the interpolated values may contain some.
+        cursor = self.get_connection().cursor(cursor_factory=BaseDictCursor)
+
+        queries = []
+        for entry in entries:
+            query = cursor.mogrify(entry.query, self.prepare_bindings(entry.bindings))
+
+            if not PY2:
+                query = query.decode()
+
+            queries.append(query)
+
+        self._execute_raw("; ".join(queries))
+
+    @run
+    def _execute_raw(self, query, bindings=None):
+        self._cursor = self.get_connection().cursor(cursor_factory=BaseDictCursor)
+        self._cursor.execute(query)
+
+        return True
+
+    def _create_transaction(self):
         self._connection.autocommit = False
 
-        super(PostgresConnection, self).begin_transaction()
+    def _commit_transaction(self):
+        self._connection.commit()
+        self._connection.autocommit = True
 
-    def commit(self):
-        if self._transactions == 1:
-            self._connection.commit()
-            self._connection.autocommit = True
+    def _rollback_transaction(self):
+        self._connection.rollback()
+        self._connection.autocommit = True
 
-        self._transactions -= 1
+    def _caused_by_concurrency_error(self, e):
+        previous = getattr(e, "previous", e)
 
-    def rollback(self):
-        if self._transactions == 1:
-            self._transactions = 0
+        # serialization_failure and deadlock_detected
+        if getattr(previous, "pgcode", None) in ("40001", "40P01"):
+            return True
 
-            self._connection.rollback()
-            self._connection.autocommit = True
-        else:
-            self._transactions -= 1
+        return super(PostgresConnection, self)._caused_by_concurrency_error(e)
 
     def _get_cursor_query(self, query, bindings):
         if self._pretending:
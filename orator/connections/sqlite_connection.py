@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
 
+import os
+import threading
+from contextlib import contextmanager
+
 from ..utils import PY2, decode
+from ..exceptions import ArgumentError
+from ..connectors.sqlite_connector import SQLiteConnector
 from .connection import Connection
 from ..query.processors.sqlite_processor import SQLiteQueryProcessor
 from ..query.grammars.sqlite_grammar import SQLiteQueryGrammar
@@ -8,10 +14,203 @@ from ..schema.grammars.sqlite_grammar import SQLiteSchemaGrammar
 from ..dbal.sqlite_schema_manager import SQLiteSchemaManager
 
 
+class SQLiteReadPool(object):
+    """
+    A fixed set of read-only connections to a database file.
+
+    Each thread is bound to one of the connections, assigned in turn,
+    so that concurrent reads are spread across the connections.
+
+    A single pool is shared by all the connections of the process
+    to the same database file, along with the lock serializing their writes.
+    """
+
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, size, factory):
+        """
+        :param size: The maximum number of connections
+        :type size: int
+
+        :param factory: The function creating a connection
+        :type factory: callable
+        """
+        self._size = size
+        self._factory = factory
+        self._connections = []
+        self._next = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._key = None
+        self._users = 0
+
+        self.write_lock = threading.RLock()
+
+    @classmethod
+    def acquire(cls, database, size, factory):
+        """
+        Get the pool of a database file, creating it if needed.
+
+        :param database: The path of the database file
+        :type database: str
+
+        :param size: The maximum number of connections of a new pool
+        :type size: int
+
+        :param factory: The function creating a connection of a new pool
+        :type factory: callable
+
+        :rtype: SQLiteReadPool
+        """
+        # Connections can't be used across a fork
+        key = (os.getpid(), os.path.abspath(database))
+
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+
+            if pool is None:
+                pool = cls(size, factory)
+                pool._key = key
+                cls._pools[key] = pool
+
+            pool._users += 1
+
+        return pool
+
+    def release(self):
+        """
+        Release the pool, closing it once it is not used anymore.
+        """
+        with self._pools_lock:
+            self._users -= 1
+
+            if self._users > 0:
+                return
+
+            self._pools.pop(self._key, None)
+
+        self.close()
+
+    def get_connection(self):
+        """
+        Get the connection of the current thread.
+
+        :rtype: orator.connectors.Connector
+        """
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            with self._lock:
+                if len(self._connections) < self._size:
+                    connection = self._factory()
+                    self._connections.append(connection)
+                else:
+                    connection = self._connections[self._next % self._size]
+                    self._next += 1
+
+            self._local.connection = connection
+
+        return connection
+
+    def get_connections(self):
+        return self._connections
+
+    def close(self):
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+
+            self._connections = []
+            self._local = threading.local()
+
+
 class SQLiteConnection(Connection):
 
     name = "sqlite"
 
+    def __init__(self, *args, **kwargs):
+        super(SQLiteConnection, self).__init__(*args, **kwargs)
+
+        self._read_pool = None
+        self._holds_write_lock = False
+
+        if self._config.get("read_pool") and self._database in ["", ":memory:"]:
+            raise ArgumentError("In-memory SQLite databases can't use a read pool")
+
+    def get_read_connection(self):
+        """
+        Get the connection used for reads.
+
+        When the "read_pool" option is set, reads happening
+        outside transactions use a pool of read-only connections,
+        writes staying on the main connection.
+        """
+        size = self._config.get("read_pool")
+
+        if not size or self._transactions >= 1 or self._connection is None:
+            return super(SQLiteConnection, self).get_read_connection()
+
+        return self._get_read_pool().get_connection()
+
+    def _get_read_pool(self):
+        if self._read_pool is None and self._config.get("read_pool"):
+            self._read_pool = SQLiteReadPool.acquire(
+                self._database, self._config["read_pool"], self._create_read_connection
+            )
+
+        return self._read_pool
+
+    def _create_read_connection(self):
+        config = dict(self._config, check_same_thread=False, query_only=True)
+
+        return SQLiteConnector().connect(config)
+
+    def get_read_pool(self):
+        return self._read_pool
+
+    def is_thread_safe(self):
+        # The driver refuses to use a connection outside of its thread by default
+        return not self._config.get("check_same_thread", True)
+
+    @contextmanager
+    def _writing(self):
+        pool = self._get_read_pool()
+
+        if pool is None:
+            yield
+        else:
+            with pool.write_lock:
+                yield
+
+    def statement(self, query, bindings=None):
+        with self._writing():
+            return super(SQLiteConnection, self).statement(query, bindings)
+
+    def affecting_statement(self, query, bindings=None):
+        with self._writing():
+            return super(SQLiteConnection, self).affecting_statement(query, bindings)
+
+    def _acquire_write_lock(self):
+        pool = self._get_read_pool()
+
+        if pool is not None:
+            pool.write_lock.acquire()
+            self._holds_write_lock = True
+
+    def _release_write_lock(self):
+        if self._holds_write_lock:
+            self._holds_write_lock = False
+            self._read_pool.write_lock.release()
+
+    def disconnect(self):
+        if self._read_pool is not None:
+            self._release_write_lock()
+            self._read_pool.release()
+            self._read_pool = None
+
+        super(SQLiteConnection, self).disconnect()
+
     def get_default_query_grammar(self):
         return self.with_table_prefix(SQLiteQueryGrammar())
 
@@ -24,26 +223,36 @@ class SQLiteConnection(Connection):
     def get_schema_manager(self):
         return SQLiteSchemaManager(self)
 
-    def begin_transaction(self):
-        self._connection.isolation_level = "DEFERRED"
+    def _create_transaction(self):
+        # With a read pool, the transactions of all the threads
+        # are serialized so that a single one writes at a time
+        self._acquire_write_lock()
 
-        super(SQLiteConnection, self).begin_transaction()
+        self._connection.isolation_level = "DEFERRED"
 
-    def commit(self):
-        if self._transactions == 1:
+    def _commit_transaction(self):
+        try:
             self._connection.commit()
             self._connection.isolation_level = None
+        finally:
+            self._release_write_lock()
 
-        self._transactions -= 1
-
-    def rollback(self):
-        if self._transactions == 1:
-            self._transactions = 0
-
+    def _rollback_transaction(self):
+        try:
             self._connection.rollback()
             self._connection.isolation_level = None
-        else:
-            self._transactions -= 1
+        finally:
+            self._release_write_lock()
+
+    def _create_savepoint(self):
+        # The outermost transaction is only started lazily by the driver
+        # on the first write so we make sure it is actually open, otherwise
+        # the savepoint would start its own transaction and releasing it
+        # would commit the work of the enclosing transaction.
+        if not self._connection.in_transaction:
+            self._connection.execute("BEGIN")
+
+        super(SQLiteConnection, self)._create_savepoint()
 
     def prepare_bindings(self, bindings):
         bindings = super(SQLiteConnection, self).prepare_bindings(bindings)
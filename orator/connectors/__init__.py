@@ -1,6 +1,15 @@
 # -*- coding: utf-8 -*-
 
-from .connector import Connector
-from .mysql_connector import MySQLConnector
-from .postgres_connector import PostgresConnector
-from .sqlite_connector import SQLiteConnector
+from ..utils.lazy import lazy_module
+
+# The drivers are only imported, and their adapters registered, on first use
+lazy_module(
+    __name__,
+    globals(),
+    {
+        "Connector": ".connector",
+        "MySQLConnector": ".mysql_connector",
+        "PostgresConnector": ".postgres_connector",
+        "SQLiteConnector": ".sqlite_connector",
+    },
+)
@@ -3,26 +3,26 @@
 import random
 from ..exceptions import ArgumentError
 from ..exceptions.connectors import UnsupportedDriver
-from .mysql_connector import MySQLConnector
-from .postgres_connector import PostgresConnector
-from .sqlite_connector import SQLiteConnector
-from ..connections import MySQLConnection, PostgresConnection, SQLiteConnection
+from ..utils import basestring
+from ..utils.lazy import load_object
 
 
 class ConnectionFactory(object):
 
+    # The connectors and connections are registered by "module:class" path
+    # so that a driver is only imported when a connection uses it.
     CONNECTORS = {
-        "sqlite": SQLiteConnector,
-        "mysql": MySQLConnector,
-        "postgres": PostgresConnector,
-        "pgsql": PostgresConnector,
+        "sqlite": "orator.connectors.sqlite_connector:SQLiteConnector",
+        "mysql": "orator.connectors.mysql_connector:MySQLConnector",
+        "postgres": "orator.connectors.postgres_connector:PostgresConnector",
+        "pgsql": "orator.connectors.postgres_connector:PostgresConnector",
     }
 
     CONNECTIONS = {
-        "sqlite": SQLiteConnection,
-        "mysql": MySQLConnection,
-        "postgres": PostgresConnection,
-        "pgsql": PostgresConnection,
+        "sqlite": "orator.connections.sqlite_connection:SQLiteConnection",
+        "mysql": "orator.connections.mysql_connection:MySQLConnection",
+        "postgres": "orator.connections.postgres_connection:PostgresConnection",
+        "pgsql": "orator.connections.postgres_connection:PostgresConnection",
     }
 
     def make(self, config, name=None):
@@ -84,16 +84,47 @@ class ConnectionFactory(object):
         if driver not in self.CONNECTORS:
             raise UnsupportedDriver(driver)
 
-        return self.CONNECTORS[driver](driver)
+        return self._resolve(self.CONNECTORS, driver)(driver)
 
     @classmethod
     def register_connector(cls, name, connector):
-        cls.CONNECTORS[connector] = connector
+        """
+        Register a connector for a driver.
+
+        :param name: The driver name
+        :type name: str
+
+        :param connector: The connector class or its "module:class" path
+        :type connector: type or str
+        """
+        cls.CONNECTORS[name] = connector
 
     @classmethod
     def register_connection(cls, name, connection):
+        """
+        Register a connection for a driver.
+
+        :param name: The driver name
+        :type name: str
+
+        :param connection: The connection class or its "module:class" path
+        :type connection: type or str
+        """
         cls.CONNECTIONS[name] = connection
 
+    @classmethod
+    def _resolve(cls, registry, driver):
+        """
+        Get a registered class, importing it on first use.
+        """
+        value = registry[driver]
+
+        if isinstance(value, basestring):
+            value = load_object(value)
+            registry[driver] = value
+
+        return value
+
     def _create_connection(self, driver, connection, database, prefix="", config=None):
         if config is None:
             config = {}
@@ -101,4 +132,6 @@ class ConnectionFactory(object):
         if driver not in self.CONNECTIONS:
             raise UnsupportedDriver(driver)
 
-        return self.CONNECTIONS[driver](connection, database, prefix, config)
+        return self._resolve(self.CONNECTIONS, driver)(
+            connection, database, prefix, config
+        )
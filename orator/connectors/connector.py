@@ -6,7 +6,7 @@ from ..exceptions.connectors import MissingPackage
 
 class Connector(object):
 
-    RESERVED_KEYWORDS = ["log_queries", "driver", "prefix", "name"]
+    RESERVED_KEYWORDS = ["log_queries", "driver", "prefix", "name", "native_dates"]
 
     SUPPORTED_PACKAGES = []
 
@@ -85,6 +85,7 @@ class MySQLConnector(Connector):
         "collation",
         "name",
         "use_qmark",
+        "native_dates",
     ]
 
     SUPPORTED_PACKAGES = ["PyMySQL", "mysqlclient"]
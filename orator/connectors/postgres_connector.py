@@ -83,6 +83,7 @@ class PostgresConnector(Connector):
         "name",
         "register_unicode",
         "use_qmark",
+        "native_dates",
     ]
 
     SUPPORTED_PACKAGES = ["psycopg2"]
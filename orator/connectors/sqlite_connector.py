@@ -12,7 +12,10 @@ try:
 except ImportError:
     sqlite3 = None
 
+from collections import OrderedDict
+
 from ..dbal.platforms import SQLitePlatform
+from ..exceptions import ArgumentError
 from ..utils.helpers import serialize
 from .connector import Connector
 
@@ -46,8 +49,43 @@ class SQLiteConnector(Connector):
         "name",
         "foreign_keys",
         "use_qmark",
+        "native_dates",
+        "profile",
+        "read_pool",
+        "busy_timeout",
+        "journal_mode",
+        "synchronous",
+        "cache_size",
+        "mmap_size",
+        "temp_store",
+        "query_only",
     ]
 
+    # The supported pragmas, in the order they are applied,
+    # with their type or their allowed values
+    PRAGMAS = OrderedDict(
+        [
+            ("busy_timeout", int),
+            ("journal_mode", ["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]),
+            ("synchronous", ["OFF", "NORMAL", "FULL", "EXTRA"]),
+            ("cache_size", int),
+            ("mmap_size", int),
+            ("temp_store", ["DEFAULT", "FILE", "MEMORY"]),
+            ("query_only", bool),
+        ]
+    )
+
+    PROFILES = {
+        "performance": {
+            "busy_timeout": 5000,
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "cache_size": -64000,
+            "mmap_size": 268435456,
+            "temp_store": "MEMORY",
+        }
+    }
+
     def _do_connect(self, config):
         connection = self.get_api().connect(**self.get_config(config))
         connection.isolation_level = None
@@ -57,8 +95,58 @@ class SQLiteConnector(Connector):
         if config.get("foreign_keys", True):
             connection.execute("PRAGMA foreign_keys = ON")
 
+        for name, value in self.get_pragmas(config).items():
+            connection.execute("PRAGMA %s = %s" % (name, value))
+
         return connection
 
+    def get_pragmas(self, config):
+        """
+        Get the pragmas to apply to new connections,
+        the ones of the profile being overridden by the explicit ones.
+
+        :param config: The connection configuration
+        :type config: dict
+
+        :rtype: OrderedDict
+        """
+        values = {}
+
+        profile = config.get("profile")
+        if profile is not None:
+            if profile not in self.PROFILES:
+                raise ArgumentError("Unsupported SQLite profile [%s]" % profile)
+
+            values.update(self.PROFILES[profile])
+
+        values.update(
+            (name, config[name])
+            for name in self.PRAGMAS
+            if config.get(name) is not None
+        )
+
+        pragmas = OrderedDict()
+        for name, type in self.PRAGMAS.items():
+            if name in values:
+                pragmas[name] = self._get_pragma_value(name, type, values[name])
+
+        return pragmas
+
+    def _get_pragma_value(self, name, type, value):
+        # Pragmas can't be bound so their values are strictly validated
+        if type is bool:
+            return "ON" if value else "OFF"
+
+        if type is int:
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                pass
+        elif str(value).upper() in type:
+            return str(value).upper()
+
+        raise ArgumentError("Invalid value [%s] for the %s pragma" % (value, name))
+
     def get_api(self):
         return sqlite3
 
@@ -5,6 +5,7 @@ import logging
 from .connections.connection_resolver_interface import ConnectionResolverInterface
 from .connectors.connection_factory import ConnectionFactory
 from .exceptions import ArgumentError
+from .query.budget import QueryBudget
 
 logger = logging.getLogger("orator.database_manager")
 
@@ -25,6 +26,10 @@ class BaseDatabaseManager(ConnectionResolverInterface):
 
         self._extensions = {}
 
+        self._shard_maps = {}
+
+        self._query_budgets = []
+
     def connection(self, name=None):
         """
         Get a database connection instance
@@ -45,6 +50,9 @@ class BaseDatabaseManager(ConnectionResolverInterface):
 
             self._connections[name] = self._prepare(connection)
 
+            for budget in self._query_budgets:
+                budget.watch(connection)
+
         return self._connections[name]
 
     def _parse_connection_name(self, name):
@@ -82,6 +90,22 @@ class BaseDatabaseManager(ConnectionResolverInterface):
         if name in self._connections:
             del self._connections[name]
 
+    def forget(self, name=None):
+        """
+        Remove the given connection from the local cache without disconnecting,
+        like in a forked process where the connection belongs to the parent.
+
+        :param name: The name of the connection
+        :type name: str
+
+        :rtype: None
+        """
+        if name is None:
+            name = self.get_default_connection()
+
+        if name in self._connections:
+            del self._connections[name]
+
     def disconnect(self, name=None):
         if name is None:
             name = self.get_default_connection()
@@ -178,6 +202,89 @@ class BaseDatabaseManager(ConnectionResolverInterface):
     def get_connections(self):
         return self._connections
 
+    def query_budget(self, max_queries=None, max_time_ms=None, allow_duplicates=True):
+        """
+        Get a context manager checking that the queries run on all the connections
+        stay within a budget.
+
+        It can also decorate functions, like tests:
+
+            @db.query_budget(max_queries=2)
+            def test_index():
+                ...
+
+        :param max_queries: The maximum number of queries
+        :type max_queries: int or None
+
+        :param max_time_ms: The maximum total duration of the queries in milliseconds
+        :type max_time_ms: float or None
+
+        :param allow_duplicates: Whether running the same query with the same bindings
+                                 more than once is allowed
+        :type allow_duplicates: bool
+
+        :rtype: orator.query.budget.QueryBudget
+        """
+        return QueryBudget(max_queries, max_time_ms, allow_duplicates, resolver=self)
+
+    def set_shard_map(self, name, shard_map):
+        """
+        Register a shard map, to be used by the models
+        having it as connection name.
+
+        :param name: The name of the shard map
+        :type name: str
+
+        :param shard_map: The shard map
+        :type shard_map: orator.sharding.ShardMap
+        """
+        self._shard_maps[name] = shard_map
+
+    def get_shard_map(self, name):
+        """
+        Get a registered shard map.
+
+        :param name: The name of the shard map
+        :type name: str
+
+        :rtype: orator.sharding.ShardMap or None
+        """
+        return self._shard_maps.get(name)
+
+    def shard(self, name, value):
+        """
+        Get the connection of the shard holding the given shard key value.
+
+        :param name: The name of the shard map
+        :type name: str
+
+        :param value: The shard key value
+        :type value: mixed
+
+        :rtype: orator.connections.Connection
+        """
+        return self.connection(self._get_shard_map(name).get_shard(value))
+
+    def shards(self, name):
+        """
+        Get the connections of all the shards of a shard map.
+
+        :param name: The name of the shard map
+        :type name: str
+
+        :rtype: list
+        """
+        return [
+            self.connection(shard) for shard in self._get_shard_map(name).get_shards()
+        ]
+
+    def _get_shard_map(self, name):
+        shard_map = self._shard_maps.get(name)
+        if shard_map is None:
+            raise ArgumentError("Shard map [%s] not configured" % name)
+
+        return shard_map
+
     def __getattr__(self, item):
         return getattr(self.connection(), item)
 
@@ -88,6 +88,7 @@ class MySQLSchemaManager(SchemaManager):
 
     def _get_portable_table_indexes_list(self, table_indexes, table_name):
         new = []
+        expressions = {}
         for v in table_indexes:
             v = dict((k.lower(), value) for k, value in v.items())
             if v["key_name"] == "PRIMARY":
@@ -100,8 +101,22 @@ class MySQLSchemaManager(SchemaManager):
             else:
                 v["flags"] = {"SPATIAL": True}
 
+            # B-trees are the default index method
+            if v["index_type"] == "HASH":
+                v["using"] = "hash"
+
+            # Functional key parts have no column name
+            if v["column_name"] is None and v.get("expression"):
+                v["column_name"] = v["expression"]
+                expressions.setdefault(v["key_name"], []).append(v["expression"])
+
             new.append(v)
 
+        # Index options are read from the first key part,
+        # so it has to know about the expressions of the later ones
+        for v in new:
+            v["expressions"] = expressions.get(v["key_name"])
+
         return super(MySQLSchemaManager, self)._get_portable_table_indexes_list(
             new, table_name
         )
@@ -67,18 +67,15 @@ class MySQLPlatform(Platform):
         )
 
     def get_list_table_indexes_sql(self, table, current_database=None):
-        sql = """
-            SELECT TABLE_NAME AS `Table`, NON_UNIQUE AS Non_Unique, INDEX_NAME AS Key_name,
-            SEQ_IN_INDEX AS Seq_in_index, COLUMN_NAME AS Column_Name, COLLATION AS Collation,
-            CARDINALITY AS Cardinality, SUB_PART AS Sub_Part, PACKED AS Packed,
-            NULLABLE AS `Null`, INDEX_TYPE AS Index_Type, COMMENT AS Comment
-            FROM information_schema.STATISTICS WHERE TABLE_NAME = '%s'
-        """
+        # Unlike information_schema.STATISTICS on older servers, SHOW INDEX
+        # describes the functional key parts, in an Expression column,
+        # whenever the server supports them (MySQL 8.0.13+)
+        sql = "SHOW INDEX FROM `%s`" % table
 
         if current_database:
-            sql += " AND TABLE_SCHEMA = '%s'" % current_database
+            sql += " FROM `%s`" % current_database
 
-        return sql % table
+        return sql
 
     def get_list_table_foreign_keys_sql(self, table, database=None):
         sql = (
@@ -439,18 +439,48 @@ class Platform(object):
         if index.is_primary():
             return self.get_create_primary_key_sql(index, table)
 
-        query = "CREATE %sINDEX %s ON %s" % (
+        query = "CREATE %sINDEX %s ON %s%s" % (
             self.get_create_index_sql_flags(index),
             name,
             table,
+            self.get_index_method_sql(index),
         )
-        query += " (%s)%s" % (
+        query += " (%s)%s%s" % (
             self.get_index_field_declaration_list_sql(columns),
+            self.get_index_include_sql(index),
             self.get_partial_index_sql(index),
         )
 
         return query
 
+    def get_index_method_sql(self, index):
+        """
+        Adds the method of the index, like gin or brin.
+
+        :param index: The index
+        :type index: Index
+
+        :rtype: str
+        """
+        if self.supports_index_methods() and index.has_option("using"):
+            return " USING %s" % index.get_option("using")
+
+        return ""
+
+    def get_index_include_sql(self, index):
+        """
+        Adds the non-key columns of a covering index.
+
+        :param index: The index
+        :type index: Index
+
+        :rtype: str
+        """
+        if self.supports_covering_indexes() and index.has_option("include"):
+            return " INCLUDE (%s)" % ", ".join(index.get_option("include"))
+
+        return ""
+
     def get_partial_index_sql(self, index):
         """
         Adds condition for partial index.
@@ -694,6 +724,12 @@ class Platform(object):
     def supports_partial_indexes(self):
         return False
 
+    def supports_index_methods(self):
+        return False
+
+    def supports_covering_indexes(self):
+        return False
+
     def supports_alter_table(self):
         return True
 
@@ -91,8 +91,9 @@ class PostgresPlatform(Platform):
     def get_list_table_indexes_sql(self, table):
         sql = """
               SELECT quote_ident(relname) as relname, pg_index.indisunique, pg_index.indisprimary,
-                     pg_index.indkey, pg_index.indrelid,
-                     pg_get_expr(indpred, indrelid) AS where
+                     pg_index.indkey, pg_index.indrelid, pg_index.indexrelid,
+                     pg_get_expr(indpred, indrelid) AS where,
+                     pg_get_indexdef(indexrelid) AS definition
               FROM pg_class, pg_index
               WHERE oid IN (
                   SELECT indexrelid
@@ -427,6 +428,15 @@ class PostgresPlatform(Platform):
     def supports_foreign_key_constraints(self):
         return True
 
+    def supports_partial_indexes(self):
+        return True
+
+    def supports_index_methods(self):
+        return True
+
+    def supports_covering_indexes(self):
+        return True
+
     def has_native_json_type(self):
         return True
 
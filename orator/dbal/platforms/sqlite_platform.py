@@ -397,9 +397,15 @@ class SQLitePlatform(Platform):
 
             changed = False
             index_columns = []
+            expressions = []
+            if index.has_option("expressions"):
+                expressions = index.get_option("expressions")
+
             for column_name in index.get_columns():
                 normalized_column_name = column_name.lower()
-                if normalized_column_name not in column_names:
+                if column_name in expressions:
+                    index_columns.append(column_name)
+                elif normalized_column_name not in column_names:
                     del indexes[key]
                     break
                 else:
@@ -414,6 +420,7 @@ class SQLitePlatform(Platform):
                     index.is_unique(),
                     index.is_primary(),
                     index.get_flags(),
+                    index.get_options(),
                 )
 
             for index in diff.removed_indexes.values():
@@ -532,6 +539,9 @@ class SQLitePlatform(Platform):
     def supports_foreign_key_constraints(self):
         return True
 
+    def supports_partial_indexes(self):
+        return True
+
     def get_boolean_type_declaration_sql(self, column):
         return "BOOLEAN"
 
@@ -118,7 +118,34 @@ class PostgresSchemaManager(SchemaManager):
         buffer = []
 
         for row in table_indexes:
+            definition = row.get("definition") or ""
+
+            using = None
+            match = re.search(r" USING (\w+) \(", definition)
+            if match and match.group(1) != "btree":
+                using = match.group(1)
+
+            include = []
+            match = re.search(r" INCLUDE \((.+?)\)", definition)
+            if match:
+                include = [c.strip() for c in match.group(1).split(",")]
+
             col_numbers = row["indkey"].split(" ")
+
+            # Included columns are listed after the key columns
+            if include:
+                col_numbers = col_numbers[: -len(include)]
+
+            expressions = []
+            for position, col_num in enumerate(col_numbers):
+                if col_num == "0":
+                    expressions.append(
+                        self._connection.select(
+                            "SELECT pg_get_indexdef(%s, %d, true) AS expression"
+                            % (row["indexrelid"], position + 1)
+                        )[0]["expression"]
+                    )
+
             col_numbers_sql = "IN (%s)" % ", ".join(col_numbers)
             column_name_sql = (
                 "SELECT attnum, attname FROM pg_attribute "
@@ -129,18 +156,29 @@ class PostgresSchemaManager(SchemaManager):
             index_columns = self._connection.select(column_name_sql)
 
             # required for getting the order of the columns right.
+            remaining_expressions = list(expressions)
             for col_num in col_numbers:
+                column_names = []
+                if col_num == "0":
+                    column_names.append(remaining_expressions.pop(0))
+
                 for col_row in index_columns:
                     if int(col_num) == col_row["attnum"]:
-                        buffer.append(
-                            {
-                                "key_name": row["relname"],
-                                "column_name": col_row["attname"].strip(),
-                                "non_unique": not row["indisunique"],
-                                "primary": row["indisprimary"],
-                                "where": row["where"],
-                            }
-                        )
+                        column_names.append(col_row["attname"].strip())
+
+                for column_name in column_names:
+                    buffer.append(
+                        {
+                            "key_name": row["relname"],
+                            "column_name": column_name,
+                            "non_unique": not row["indisunique"],
+                            "primary": row["indisprimary"],
+                            "where": row["where"],
+                            "using": using,
+                            "include": include,
+                            "expressions": expressions,
+                        }
+                    )
 
         return super(PostgresSchemaManager, self)._get_portable_table_indexes_list(
             buffer, table_name
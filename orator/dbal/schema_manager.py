@@ -86,8 +86,9 @@ class SchemaManager(object):
 
             if key_name not in result:
                 options = {}
-                if "where" in table_index:
-                    options["where"] = table_index["where"]
+                for option in ["where", "using", "include", "expressions"]:
+                    if table_index.get(option):
+                        options[option] = table_index[option]
 
                 result[key_name] = {
                     "name": index_name,
@@ -101,15 +101,72 @@ class SQLiteSchemaManager(SchemaManager):
                     "non_unique": not bool(index["unique"]),
                 }
 
+                # Partial and expression indexes are only described
+                # by the statement that created them.
+                sql = self._connection.select(
+                    "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = '%s'"
+                    % key_name
+                )
+                definition = self._parse_index_definition(sql[0]["sql"] if sql else None)
+                idx["where"] = definition["where"]
+
                 info = self._connection.select("PRAGMA INDEX_INFO ('%s')" % key_name)
-                for row in info:
-                    idx["column_name"] = row["name"]
-                    index_buffer.append(idx)
+                for i, row in enumerate(info):
+                    column_name = row["name"]
+                    if column_name is None and i < len(definition["columns"]):
+                        column_name = definition["columns"][i]
+                        idx.setdefault("expressions", []).append(column_name)
+
+                    index_buffer.append(dict(idx, column_name=column_name))
 
         return super(SQLiteSchemaManager, self)._get_portable_table_indexes_list(
             index_buffer, table_name
         )
 
+    def _parse_index_definition(self, sql):
+        """
+        Extract the columns and the condition from a CREATE INDEX statement.
+
+        :param sql: The CREATE INDEX statement
+        :type sql: str or None
+
+        :rtype: dict
+        """
+        definition = {"columns": [], "where": None}
+
+        if not sql:
+            return definition
+
+        start = sql.find("(")
+        if start == -1:
+            return definition
+
+        depth = 0
+        column = ""
+        for i in range(start, len(sql)):
+            char = sql[i]
+            if char == "(":
+                depth += 1
+                if depth == 1:
+                    continue
+            elif char == ")":
+                depth -= 1
+                if depth == 0:
+                    definition["columns"].append(column.strip())
+                    break
+            elif char == "," and depth == 1:
+                definition["columns"].append(column.strip())
+                column = ""
+                continue
+
+            column += char
+
+        match = re.search(r"\)\s+WHERE\s+(.+)$", sql[i:], re.IGNORECASE | re.DOTALL)
+        if match:
+            definition["where"] = match.group(1).strip()
+
+        return definition
+
     def _get_portable_table_foreign_keys_list(self, table_foreign_keys):
         foreign_keys = OrderedDict()
 
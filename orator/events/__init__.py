@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import weakref
+
 from blinker import Namespace
 
 
@@ -7,6 +9,10 @@ class Event(object):
 
     events = Namespace()
 
+    # Incremented whenever a listener is added or removed,
+    # so that tables of listeners built from the signals can be invalidated.
+    version = 0
+
     @classmethod
     def fire(cls, name, *args, **kwargs):
         name = "orator.%s" % name
@@ -23,13 +29,38 @@ class Event(object):
 
         signal.connect(callback, weak=False, *args, **kwargs)
 
+        Event.version += 1
+
     @classmethod
     def forget(cls, name, *args, **kwargs):
         name = "orator.%s" % name
         signal = cls.events.signal(name)
 
-        for receiver in signal.receivers:
-            signal.disconnect(receiver, *args, **kwargs)
+        for receiver in list(signal.receivers.values()):
+            if isinstance(receiver, weakref.ref):
+                receiver = receiver()
+
+            if receiver is not None:
+                signal.disconnect(receiver, *args, **kwargs)
+
+        Event.version += 1
+
+    @classmethod
+    def get_signal(cls, name):
+        """
+        Get the signal of an event if it has listeners.
+
+        :param name: The event name
+        :type name: str
+
+        :rtype: blinker.Signal or None
+        """
+        signal = cls.events.get("orator.%s" % name)
+
+        if signal is None or not signal.receivers:
+            return None
+
+        return signal
 
 
 def event(name, *args, **kwargs):
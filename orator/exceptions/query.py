@@ -16,3 +16,11 @@ class QueryException(Exception):
 
     def __str__(self):
         return self.message
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    Raised when the queries run inside a query budget exceed it.
+    """
+
+    pass
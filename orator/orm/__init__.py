@@ -1,23 +1,29 @@
 # -*- coding: utf-8 -*-
 
-from .builder import Builder
-from .model import Model
-from .mixins import SoftDeletes
-from .collection import Collection
-from .factory import Factory
-from .utils import (
-    mutator,
-    accessor,
-    column,
-    has_one,
-    morph_one,
-    belongs_to,
-    morph_to,
-    has_many,
-    has_many_through,
-    morph_many,
-    belongs_to_many,
-    morph_to_many,
-    morphed_by_many,
-    scope,
+from ..utils.lazy import lazy_module
+
+lazy_module(
+    __name__,
+    globals(),
+    {
+        "Builder": ".builder",
+        "Model": ".model",
+        "SoftDeletes": ".mixins",
+        "Collection": ".collection",
+        "Factory": ".factory",
+        "mutator": ".utils",
+        "accessor": ".utils",
+        "column": ".utils",
+        "has_one": ".utils",
+        "morph_one": ".utils",
+        "belongs_to": ".utils",
+        "morph_to": ".utils",
+        "has_many": ".utils",
+        "has_many_through": ".utils",
+        "morph_many": ".utils",
+        "belongs_to_many": ".utils",
+        "morph_to_many": ".utils",
+        "morphed_by_many": ".utils",
+        "scope": ".utils",
+    },
 )
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import re
 import copy
+import types
 from collections import OrderedDict
 from ..exceptions.orm import ModelNotFound
 from ..utils import Null, basestring
@@ -8,6 +10,8 @@ from ..query.expression import QueryExpression
 from ..pagination import Paginator, LengthAwarePaginator
 from ..support import Collection
 from .scopes import Scope
+from .deferred import DeferredColumns
+from .parallel import ParallelChunk
 
 
 class Builder(object):
@@ -17,6 +21,7 @@ class Builder(object):
         "lists",
         "insert",
         "insert_get_id",
+        "upsert",
         "pluck",
         "count",
         "min",
@@ -24,10 +29,15 @@ class Builder(object):
         "avg",
         "sum",
         "exists",
+        "explain",
         "get_bindings",
         "raw",
     ]
 
+    # The forwarders of the dynamic methods, by model class and query class.
+    # A method missing from the query class is mapped to None.
+    _dispatch_tables = {}
+
     def __init__(self, query):
         """
         Constructor
@@ -44,6 +54,9 @@ class Builder(object):
 
         self._on_delete = None
 
+        self._defer = []
+        self._only = None
+
     def with_global_scope(self, identifier, scope):
         """
         Register a new global scope.
@@ -60,6 +73,19 @@ class Builder(object):
 
         return self
 
+    def with_global_scopes(self, scopes):
+        """
+        Register several global scopes.
+
+        :param scopes: The scopes by identifier
+        :type scopes: dict
+
+        :rtype: Builder
+        """
+        self._scopes.update(scopes)
+
+        return self
+
     def without_global_scope(self, scope):
         """
         Remove a registered global scope.
@@ -257,6 +283,59 @@ class Builder(object):
 
             yield collection
 
+    def chunk_by_id(self, count, column=None):
+        """
+        Chunk the results of the query using ranges of primary keys.
+
+        Unlike chunk(), each chunk is fetched by an independent query
+        using the primary key index.
+
+        :param count: The chunk size
+        :type count: int
+
+        :param column: The column to use instead of the primary key
+        :type column: str
+
+        :return: The current chunk
+        :rtype: Collection
+        """
+        column = column or self._model.get_qualified_key_name()
+
+        connection = self._model.get_connection_name()
+        for results in self.apply_scopes().get_query().chunk_by_id(count, column):
+            models = self._model.hydrate(results, connection)
+
+            if len(models) > 0:
+                models = self.eager_load_relations(models)
+
+            yield self._model.new_collection(models)
+
+    def parallel_chunk(self, callback, count=1000, workers=4, executor="thread"):
+        """
+        Process the results of the query in parallel.
+
+        The range of primary keys is split in one partition per worker,
+        each worker processing the chunks of its partition on its own connection.
+
+        :param callback: The function called with each chunk
+        :type callback: callable
+
+        :param count: The chunk size
+        :type count: int
+
+        :param workers: The number of workers
+        :type workers: int
+
+        :param executor: "thread" or "process"
+        :type executor: str
+
+        :return: The values returned by the callback and the errors
+        :rtype: orator.orm.parallel.ParallelResult
+        """
+        job = ParallelChunk(self.apply_scopes(), callback, count, executor)
+
+        return job.run(workers)
+
     def lists(self, column, key=None):
         """
         Get a list with the values of a given column
@@ -286,7 +365,9 @@ class Builder(object):
 
                 results[i] = self._model.new_from_builder(fill).column
 
-    def paginate(self, per_page=None, current_page=None, columns=None):
+    def paginate(
+        self, per_page=None, current_page=None, columns=None, total="exact", ttl=60
+    ):
         """
         Paginate the given query.
 
@@ -299,18 +380,26 @@ class Builder(object):
         :param columns: The columns to return
         :type columns: list
 
+        :param total: How to count the results: "exact", "estimate" or "cached"
+        :type total: str
+
+        :param ttl: The number of seconds a cached total is kept
+        :type ttl: int
+
         :return: The paginator
         """
         if columns is None:
             columns = ["*"]
 
-        total = self.to_base().get_count_for_pagination()
+        count, approximate = self.to_base().get_total_for_pagination(total, ttl)
 
         page = current_page or Paginator.resolve_current_page()
         per_page = per_page or self._model.get_per_page()
         self._query.for_page(page, per_page)
 
-        return LengthAwarePaginator(self.get(columns).all(), total, per_page, page)
+        return LengthAwarePaginator(
+            self.get(columns).all(), count, per_page, page, approximate=approximate
+        )
 
     def simple_paginate(self, per_page=None, current_page=None, columns=None):
         """
@@ -452,14 +541,109 @@ class Builder(object):
         :return: A list of models
         :rtype: orator.orm.collection.Collection
         """
-        results = self.apply_scopes().get_query().get(columns).all()
+        query = self.apply_scopes().get_query()
+
+        deferred = self._get_deferred_columns()
+        original = query.columns
+
+        if deferred:
+            selected = query.columns or columns or ["*"]
+            projected = self._project_columns(selected, deferred)
+
+            if projected == selected:
+                deferred = []
+            else:
+                query.columns = projected
+
+        try:
+            results = query.get(columns).all()
+        finally:
+            query.columns = original
 
         connection = self._model.get_connection_name()
 
         models = self._model.hydrate(results, connection)
 
+        if deferred and len(models) > 0:
+            DeferredColumns(models.all(), deferred)
+
         return models
 
+    def defer(self, *columns):
+        """
+        Do not load the given columns until they are accessed.
+
+        :param columns: The columns to defer
+        :type columns: tuple
+
+        :rtype: Builder
+        """
+        self._defer += list(columns)
+
+        return self
+
+    def only(self, *columns):
+        """
+        Only load the given columns and the primary key,
+        the other columns are deferred.
+
+        :param columns: The columns to load
+        :type columns: tuple
+
+        :rtype: Builder
+        """
+        self._only = list(columns)
+
+        return self
+
+    def _get_deferred_columns(self):
+        """
+        Get the columns of the model that should not be loaded.
+
+        :rtype: list
+        """
+        deferred = self._model.__deferred__ + self._defer
+
+        if not deferred and self._only is None:
+            return []
+
+        key_name = self._model.get_key_name()
+
+        if self._only is not None:
+            return [
+                c
+                for c in self._model.get_column_listing()
+                if c not in self._only and c != key_name
+            ]
+
+        return [
+            c
+            for c in self._model.get_column_listing()
+            if c in deferred and c != key_name
+        ]
+
+    def _project_columns(self, columns, deferred):
+        """
+        Replace the wildcards of a select clause
+        by the columns of the model that are not deferred.
+
+        :rtype: list
+        """
+        table = self._model.get_table()
+
+        projected = []
+        for column in columns:
+            if column in ["*", "%s.*" % table]:
+                projected += [
+                    "%s.%s" % (table, c)
+                    for c in self._model.get_column_listing()
+                    if c not in deferred
+                ]
+            else:
+                projected.append(column)
+
+        return projected
+
     def eager_load_relations(self, models):
         """
         Eager load the relationship of the models.
@@ -822,6 +1006,20 @@ class Builder(object):
 
         :rtype: Builder
         """
+        exists = self._get_has_exists_type(operator, count)
+
+        if exists is not None:
+            # Checking for the existence of at least one related record
+            # does not require counting them all, so we use an EXISTS clause
+            # which lets the database stop at the first match.
+            self._merge_model_defined_relation_wheres_to_has_query(
+                has_query, relation, False
+            )
+
+            has_query.select("*")
+
+            return self.where_exists(has_query, boolean, exists == "not_exists")
+
         self._merge_model_defined_relation_wheres_to_has_query(has_query, relation)
 
         if isinstance(count, basestring) and count.isdigit():
@@ -831,7 +1029,34 @@ class Builder(object):
             QueryExpression("(%s)" % has_query.to_sql()), operator, count, boolean
         )
 
-    def _merge_model_defined_relation_wheres_to_has_query(self, has_query, relation):
+    def _get_has_exists_type(self, operator, count):
+        """
+        Get the type of exists clause equivalent to a relationship count condition.
+
+        :param operator: The operator
+        :type operator: str
+
+        :param count: The count
+        :type count: int
+
+        :return: "exists", "not_exists" or None if the condition needs a count
+        :rtype: str or None
+        """
+        if isinstance(count, basestring):
+            if not count.isdigit():
+                return
+
+            count = int(count)
+
+        if (operator, count) in [(">=", 1), (">", 0), ("!=", 0), ("<>", 0)]:
+            return "exists"
+
+        if (operator, count) in [("<", 1), ("<=", 0), ("=", 0)]:
+            return "not_exists"
+
+    def _merge_model_defined_relation_wheres_to_has_query(
+        self, has_query, relation, merge_bindings=True
+    ):
         """
         Merge the "wheres" from a relation query to a has query.
 
@@ -840,12 +1065,16 @@ class Builder(object):
 
         :param relation: The relation to count
         :type relation: orator.orm.relations.Relation
+
+        :param merge_bindings: Whether to add the has query bindings to the query
+        :type merge_bindings: bool
         """
         relation_query = relation.get_base_query()
 
         has_query.merge_wheres(relation_query.wheres, relation_query.get_bindings())
 
-        self._query.add_binding(has_query.get_query().get_bindings(), "where")
+        if merge_bindings:
+            self._query.add_binding(has_query.get_query().get_bindings(), "where")
 
     def _get_has_relation_query(self, relation):
         """
@@ -860,6 +1089,158 @@ class Builder(object):
         with Relation.no_constraints(True):
             return getattr(self.get_model(), relation)()
 
+    def with_count(self, *relations):
+        """
+        Add subselect queries to count the relations.
+
+        The counts are available as "<relation>_count" attributes
+        unless aliased with the "relation as alias" syntax.
+
+        :param relations: The relations to count
+        :type relations: tuple
+
+        :rtype: Builder
+        """
+        return self._with_aggregate(relations, "count")
+
+    def with_sum(self, relation, column):
+        """
+        Add a subselect query to sum a column of the relation.
+
+        The sum is available as a "<relation>_sum_<column>" attribute.
+
+        :param relation: The relation
+        :type relation: str or dict
+
+        :param column: The column to sum
+        :type column: str
+
+        :rtype: Builder
+        """
+        return self._with_aggregate([relation], "sum", column)
+
+    def with_min(self, relation, column):
+        """
+        Add a subselect query to get the minimum value of a column of the relation.
+
+        :param relation: The relation
+        :type relation: str or dict
+
+        :param column: The column
+        :type column: str
+
+        :rtype: Builder
+        """
+        return self._with_aggregate([relation], "min", column)
+
+    def with_max(self, relation, column):
+        """
+        Add a subselect query to get the maximum value of a column of the relation.
+
+        :param relation: The relation
+        :type relation: str or dict
+
+        :param column: The column
+        :type column: str
+
+        :rtype: Builder
+        """
+        return self._with_aggregate([relation], "max", column)
+
+    def with_avg(self, relation, column):
+        """
+        Add a subselect query to get the average value of a column of the relation.
+
+        :param relation: The relation
+        :type relation: str or dict
+
+        :param column: The column
+        :type column: str
+
+        :rtype: Builder
+        """
+        return self._with_aggregate([relation], "avg", column)
+
+    def _with_aggregate(self, relations, function, column=None):
+        """
+        Add subselect queries to aggregate the given relations.
+
+        :param relations: The relations, optionally mapped to constraints
+        :type relations: list
+
+        :param function: The aggregate function
+        :type function: str
+
+        :param column: The column to aggregate
+        :type column: str or None
+
+        :rtype: Builder
+        """
+        if not self._query.columns:
+            self._query.select("%s.*" % self._query.from__)
+
+        for name, alias, constraints in self._parse_aggregate_relations(relations):
+            relation = self._get_has_relation_query(name)
+
+            query = relation.get_relation_count_query(
+                relation.get_related().new_query(), self
+            )
+
+            if column is not None:
+                if column.find(".") < 0:
+                    column = "%s.%s" % (relation.get_related().get_table(), column)
+
+                query.select(
+                    QueryExpression(
+                        "%s(%s)" % (function.upper(), relation.wrap(column))
+                    )
+                )
+
+            if callable(constraints):
+                constraints(query)
+
+            relation_query = relation.get_base_query()
+            query.merge_wheres(relation_query.wheres, relation_query.get_bindings())
+
+            if alias is None and column is None:
+                alias = "%s_%s" % (name, function)
+            elif alias is None:
+                alias = "%s_%s_%s" % (name, function, column.split(".")[-1])
+
+            self._query.select_sub(query.apply_scopes().get_query(), alias)
+
+        return self
+
+    def _parse_aggregate_relations(self, relations):
+        """
+        Parse a list of relations to aggregate into (name, alias, constraints) tuples.
+
+        A relation can be aliased with the "relation as alias" syntax.
+
+        :param relations: The relations
+        :type relations: list
+
+        :rtype: list
+        """
+        results = []
+
+        for relation in relations:
+            if isinstance(relation, dict):
+                items = relation.items()
+            else:
+                items = [(relation, None)]
+
+            for name, constraints in items:
+                alias = None
+
+                segments = re.split(r"\s+as\s+", name, flags=re.IGNORECASE)
+                if len(segments) == 2:
+                    name, alias = segments
+
+                results.append((name, alias, constraints))
+
+        return results
+
     def with_(self, *relations):
         """
         Set the relationships that should be eager loaded.
@@ -1143,50 +1524,132 @@ class Builder(object):
         """
         return self._macros.get(name)
 
+    @classmethod
+    def flush_dispatch_tables(cls, model=None):
+        """
+        Forget the forwarders of the dynamic methods.
+
+        :param model: The model class whose forwarders to forget, all if None
+        :type model: class or None
+        """
+        if model is None:
+            cls._dispatch_tables.clear()
+
+            return
+
+        for key in list(cls._dispatch_tables):
+            if issubclass(key[0], model):
+                del cls._dispatch_tables[key]
+
     def __dynamic(self, method):
+        key = (self._model.__class__, self._query.__class__)
+
+        table = self._dispatch_tables.get(key)
+        if table is None:
+            table = self._dispatch_tables[key] = {}
+
+        forwarder = table.get(method, False)
+        if forwarder is False:
+            forwarder = table[method] = self._make_forwarder(
+                key[0], key[1], method
+            )
+
+        if forwarder is None:
+            if method in self._macros:
+                macro = self._macros[method]
+
+                return lambda *args, **kwargs: macro(self, *args, **kwargs)
+
+            attribute = getattr(self._query, method)
+
+            if not callable(attribute):
+                return attribute
+
+            # Set on the query builder instance, so it can't be cached
+            return types.MethodType(self._make_query_forwarder(method), self)
+
+        # Later accesses are plain attribute lookups
+        bound = self.__dict__[method] = types.MethodType(forwarder, self)
+
+        return bound
+
+    @classmethod
+    def _make_forwarder(cls, model, query, method):
+        """
+        Make the function forwarding a dynamic method
+        to a scope of the model or to the query builder.
+
+        :param model: The model class
+        :type model: class
+
+        :param query: The query builder class
+        :type query: class
+
+        :param method: The method name
+        :type method: str
+
+        :rtype: callable or None
+        """
         from .utils import scope
 
-        scope_method = "scope_%s" % method
-        is_scope = False
-        is_macro = False
+        # The class dictionaries are read directly since looking up
+        # a missing attribute on a model class builds a query.
+        attributes = {}
+        for klass in reversed(model.__mro__):
+            attributes.update(klass.__dict__)
 
-        # New scope definition check
-        if hasattr(self._model, method) and isinstance(
-            getattr(self._model, method), scope
-        ):
-            is_scope = True
-            attribute = getattr(self._model, method)
+        if isinstance(attributes.get(method), scope):
             scope_method = method
-        # Old scope definition check
-        elif hasattr(self._model, scope_method):
-            is_scope = True
-            attribute = getattr(self._model, scope_method)
-        elif method in self._macros:
-            is_macro = True
-            attribute = self._macros[method]
+        elif "scope_%s" % method in attributes:
+            scope_method = "scope_%s" % method
         else:
-            if method in self._passthru:
-                attribute = getattr(self.apply_scopes().get_query(), method)
-            else:
-                attribute = getattr(self._query, method)
+            scope_method = None
 
-        def call(*args, **kwargs):
-            if is_scope:
-                return self._call_scope(scope_method, *args, **kwargs)
-            if is_macro:
-                return attribute(self, *args, **kwargs)
+        if scope_method is not None:
 
-            result = attribute(*args, **kwargs)
+            def call_scope(builder, *args, **kwargs):
+                return builder._call_scope(scope_method, *args, **kwargs)
 
-            if method in self._passthru:
-                return result
-            else:
-                return self
+            return call_scope
+
+        if not callable(getattr(query, method, None)):
+            return None
+
+        return cls._make_query_forwarder(method)
+
+    @classmethod
+    def _make_query_forwarder(cls, method):
+        """
+        Make the function forwarding a dynamic method to the query builder.
+
+        :param method: The method name
+        :type method: str
+
+        :rtype: callable
+        """
+        if method in cls._passthru:
+
+            def passthru(builder, *args, **kwargs):
+                macro = builder._macros.get(method)
+                if macro is not None:
+                    return macro(builder, *args, **kwargs)
+
+                return getattr(builder.apply_scopes().get_query(), method)(
+                    *args, **kwargs
+                )
+
+            return passthru
+
+        def forward(builder, *args, **kwargs):
+            macro = builder._macros.get(method)
+            if macro is not None:
+                return macro(builder, *args, **kwargs)
+
+            getattr(builder._query, method)(*args, **kwargs)
 
-        if not callable(attribute):
-            return attribute
+            return builder
 
-        return call
+        return forward
 
     def __getattr__(self, item, *args):
         return self.__dynamic(item)
@@ -1194,5 +1657,7 @@ class Builder(object):
     def __copy__(self):
         new = self.__class__(copy.copy(self._query))
         new.set_model(self._model)
+        new._defer = list(self._defer)
+        new._only = self._only
 
         return new
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from ..support.collection import Collection as BaseCollection
+from .packer import ModelPacker
 
 
 class Collection(BaseCollection):
@@ -32,3 +33,26 @@ class Collection(BaseCollection):
         :rtype: list
         """
         return map(lambda m: m.get_key(), self.items)
+
+    def dumps(self):
+        """
+        Encode the models of the collection in a compact binary format.
+
+        The attributes, relations and exists flag of the models are kept,
+        like when pickling them.
+
+        :rtype: bytes
+        """
+        return ModelPacker.dumps(self)
+
+    @classmethod
+    def loads(cls, data):
+        """
+        Decode a collection of models encoded by dumps().
+
+        :param data: The encoded collection
+        :type data: bytes
+
+        :rtype: Collection
+        """
+        return ModelPacker.loads(data)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import weakref
+
+
+class DeferredColumns(object):
+    """
+    Loads the deferred columns of models retrieved together.
+
+    The first access to a deferred attribute of one of the models
+    loads it for all the models still alive with a single query.
+    """
+
+    chunk_size = 500
+
+    def __init__(self, models, columns):
+        """
+        :param models: The models retrieved together
+        :type models: list
+
+        :param columns: The columns left out of the query
+        :type columns: list
+        """
+        self._models = [weakref.ref(model) for model in models]
+        self._columns = set(columns)
+
+        for model in models:
+            model._deferred = self
+
+    def is_deferred(self, column):
+        return column in self._columns
+
+    def get_columns(self):
+        return list(self._columns)
+
+    def load(self, column):
+        """
+        Load a deferred column for all the models.
+
+        Values already set on a model are not overwritten.
+
+        :param column: The column to load
+        :type column: str
+        """
+        self._columns.discard(column)
+
+        models = [m for m in (ref() for ref in self._models) if m is not None]
+        if not models:
+            return
+
+        model = models[0]
+        key_name = model.get_key_name()
+        keys = [m.get_key() for m in models]
+
+        values = {}
+        for i in range(0, len(keys), self.chunk_size):
+            query = model.new_query_without_scopes().get_query()
+            results = query.where_in(
+                model.get_qualified_key_name(), keys[i : i + self.chunk_size]
+            ).get([key_name, column])
+
+            for result in results:
+                values[result[key_name]] = result[column]
+
+        for m in models:
+            value = values.get(m.get_key())
+
+            if column not in m._original:
+                m._original[column] = value
+
+            if column not in m._attributes:
+                m._attributes[column] = value
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+from ..events import Event
+
+
+class ModelEventTable(object):
+    """
+    The listeners of the events of a model class.
+
+    The signals are resolved once, when the table is built,
+    so firing an event nobody listens to is a single dictionary lookup.
+    """
+
+    # The events whose models can be collected and sent once per batch.
+    batchable = ["created", "updated", "saved", "deleted", "restored"]
+
+    def __init__(self, model, dispatcher, batch=None):
+        """
+        :param model: The model class
+        :type model: type
+
+        :param dispatcher: The event dispatcher of the model
+        :type dispatcher: Event
+
+        :param batch: The models collected for each event while batching
+        :type batch: dict or None
+        """
+        self.version = Event.version
+        self.dispatcher = dispatcher
+        self.batch = batch
+        self._name = model.__name__
+        self._listeners = {}
+        self._dispatcher = None
+
+        if not dispatcher:
+            return
+
+        if not isinstance(dispatcher, Event):
+            # Other dispatchers may have listeners we can't see,
+            # so they are notified of every event.
+            self._dispatcher = dispatcher
+
+            return
+
+        for event in ["booting", "booted"] + model.get_observable_events():
+            signal = dispatcher.get_signal("%s: %s" % (event, self._name))
+            batch_signal = dispatcher.get_signal("%s_batch: %s" % (event, self._name))
+
+            if batch_signal is not None:
+                self._listeners["%s_batch" % event] = self._sender(batch_signal)
+
+            if batch is not None and batch_signal and event in self.batchable:
+                self._listeners[event] = self._collector(
+                    signal, batch.setdefault(event, [])
+                )
+            elif signal is not None:
+                self._listeners[event] = self._sender(signal)
+
+    def fire(self, event, payload):
+        """
+        Fire an event.
+
+        :param event: The event name
+        :type event: str
+
+        :param payload: The model or the collection of models
+        :type payload: Model or Collection
+
+        :return: False if a listener cancelled the event
+        :rtype: bool
+        """
+        if self._dispatcher is not None:
+            return self._dispatcher.fire("%s: %s" % (event, self._name), payload)
+
+        listener = self._listeners.get(event)
+
+        if listener is None:
+            return True
+
+        return listener(payload)
+
+    def _sender(self, signal):
+        def send(payload):
+            for _, response in signal.send(payload):
+                if response is False:
+                    return False
+
+            return True
+
+        return send
+
+    def _collector(self, signal, models):
+        send = self._sender(signal) if signal is not None else None
+
+        def collect(model):
+            models.append(model)
+
+            if send is not None:
+                return send(model)
+
+            return True
+
+        return collect
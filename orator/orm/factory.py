@@ -20,6 +20,7 @@ class Factory(object):
 
         self._definitions = {}
         self._resolver = resolver
+        self._progress = None
 
     @classmethod
     def construct(cls, faker, path_to_factories=None):
@@ -223,7 +224,12 @@ class Factory(object):
         :return: orator.orm.factory_builder.FactoryBuilder
         """
         return FactoryBuilder(
-            klass, name, self._definitions, self._faker, self._resolver
+            klass,
+            name,
+            self._definitions,
+            self._faker,
+            self._resolver,
+            self._progress,
         )
 
     def build(self, klass, name="default", amount=None):
@@ -280,6 +286,15 @@ class Factory(object):
     def set_connection_resolver(self, resolver):
         self._resolver = resolver
 
+    def set_progress_listener(self, callback):
+        """
+        Set the callback receiving the progress of the bulk inserts.
+
+        :param callback: The callback
+        :type callback: callable or None
+        """
+        self._progress = callback
+
     def __getitem__(self, item):
         return self.make(item)
 
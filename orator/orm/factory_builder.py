@@ -1,10 +1,33 @@
 # -*- coding: utf-8 -*-
 
+import time
+import random
+import multiprocessing
+
 from .collection import Collection
+from ..utils import PY2
+
+
+# The builder generating rows in the worker processes of insert(),
+# inherited by the forked workers.
+_builder = None
+
+
+def _generate_rows(args):
+    amount, attributes, timestamps = args
+
+    # The forked workers share the random state of the parent
+    random.seed()
+    if hasattr(_builder._faker, "seed_instance"):
+        _builder._faker.seed_instance()
+
+    return _builder._make_rows(amount, attributes, timestamps)
 
 
 class FactoryBuilder(object):
-    def __init__(self, klass, name, definitions, faker, resolver=None):
+    def __init__(
+        self, klass, name, definitions, faker, resolver=None, progress=None
+    ):
         """
         :param klass: The class
         :type klass: class
@@ -17,6 +40,9 @@ class FactoryBuilder(object):
 
         :param faker: The faker generator instance
         :type faker: faker.Generator
+
+        :param progress: The default progress callback of insert()
+        :type progress: callable or None
         """
         self._name = name
         self._klass = klass
@@ -24,6 +50,7 @@ class FactoryBuilder(object):
         self._definitions = definitions
         self._amount = 1
         self._resolver = resolver
+        self._progress = progress
 
     def times(self, amount):
         """
@@ -63,6 +90,151 @@ class FactoryBuilder(object):
 
         return results
 
+    def insert(
+        self,
+        batch_size=1000,
+        events=False,
+        timestamps=True,
+        processes=None,
+        progress=None,
+        **attributes
+    ):
+        """
+        Insert the models in batches without keeping them in memory.
+
+        Without events, each batch is inserted with a single multi-row insert.
+        With events, the models of each batch are saved one by one
+        within a transaction and their batch events are fired.
+
+        :param batch_size: The number of models per batch,
+                           split in several inserts beyond the limits of the database
+        :type batch_size: int
+
+        :param events: Whether to fire the model events
+        :type events: bool
+
+        :param timestamps: Whether to set the timestamps of the models
+        :type timestamps: bool
+
+        :param processes: The number of processes generating the definitions,
+                          which requires the fork start method
+        :type processes: int or None
+
+        :param progress: A callback receiving the model class, the number of
+                         models inserted, the total and the elapsed seconds
+                         after each batch
+        :type progress: callable or None
+
+        :param attributes: The models attributes
+        :type attributes: dict
+
+        :return: The number of models inserted
+        :rtype: int
+        """
+        global _builder
+
+        if progress is None:
+            progress = self._progress
+
+        if self._resolver:
+            self._klass.set_connection_resolver(self._resolver)
+
+        batches = [
+            (min(batch_size, self._amount - i), attributes, timestamps and not events)
+            for i in range(0, self._amount, batch_size)
+        ]
+
+        pool = None
+
+        if processes and processes > 1 and len(batches) > 1:
+            # The workers inherit the builder, which requires forking them
+            if PY2:
+                context = multiprocessing
+            else:
+                context = multiprocessing.get_context("fork")
+
+            _builder = self
+            pool = context.Pool(processes)
+            rows = pool.imap(_generate_rows, batches)
+        else:
+            rows = (self._make_rows(*batch) for batch in batches)
+
+        start = time.time()
+        inserted = 0
+
+        try:
+            for batch in rows:
+                if events:
+                    self._save_rows(batch, timestamps)
+                else:
+                    self._insert_rows(batch)
+
+                inserted += len(batch)
+
+                if progress is not None:
+                    progress(self._klass, inserted, self._amount, time.time() - start)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                _builder = None
+
+        return inserted
+
+    def _make_rows(self, amount, attributes, timestamps):
+        """
+        Make the attributes of a batch of models.
+
+        :rtype: list
+        """
+        models = self._make_instances(amount, attributes)
+
+        if timestamps and models and models[0].uses_timestamps():
+            time_ = models[0].fresh_timestamp()
+
+            for model in models:
+                model.set_created_at(time_)
+                model.set_updated_at(time_)
+
+        return [model.get_attributes() for model in models]
+
+    def _insert_rows(self, rows):
+        """
+        Insert a batch of models, with as few statements as the database allows.
+
+        :param rows: The attributes of the models
+        :type rows: list
+        """
+        query = self._klass().new_query_without_scopes()
+        size = query.get_query().get_grammar().get_max_insert_rows(len(rows[0]))
+
+        if len(rows) <= size:
+            query.insert(rows)
+
+            return
+
+        with self._klass().get_connection().transaction():
+            for start in range(0, len(rows), size):
+                self._klass().new_query_without_scopes().insert(
+                    rows[start : start + size]
+                )
+
+    def _save_rows(self, rows, timestamps):
+        """
+        Save a batch of models, firing their events.
+
+        :param rows: The attributes of the models
+        :type rows: list
+
+        :param timestamps: Whether to set the timestamps of the models
+        :type timestamps: bool
+        """
+        with self._klass().get_connection().transaction():
+            with self._klass.batch_events():
+                for row in rows:
+                    model = self._klass()
+                    model.set_raw_attributes(row)
+                    model.save({"timestamps": timestamps})
+
     def make(self, **attributes):
         """
         Create a collection of models.
@@ -74,13 +246,23 @@ class FactoryBuilder(object):
         """
         if self._amount == 1:
             return self._make_instance(**attributes)
-        else:
-            results = []
 
-            for _ in range(self._amount):
-                results.append(self._make_instance(**attributes))
+        return Collection(self._make_instances(self._amount, attributes))
 
-            return Collection(results)
+    def _make_instances(self, amount, attributes):
+        """
+        Make the given number of models, lifting the mass assignment
+        restrictions once for all of them.
+
+        :rtype: list
+        """
+        unguarded = self._klass.__unguarded__
+        self._klass.unguard()
+
+        try:
+            return [self._fill_instance(attributes) for _ in range(amount)]
+        finally:
+            self._klass.__unguarded__ = unguarded
 
     def _make_instance(self, **attributes):
         """
@@ -91,11 +273,14 @@ class FactoryBuilder(object):
 
         :return: mixed
         """
+        return self._make_instances(1, attributes)[0]
+
+    def _fill_instance(self, attributes):
         definition = self._definitions[self._klass][self._name](self._faker)
         definition.update(attributes)
 
         instance = self._klass()
-        instance.force_fill(**definition)
+        instance.fill(**definition)
 
         return instance
 
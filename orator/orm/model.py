@@ -6,14 +6,20 @@ import inflection
 import inspect
 import uuid
 import datetime
+import threading
 from warnings import warn
 from six import add_metaclass
 from collections import OrderedDict
-from ..utils import basestring, deprecated
+from contextlib import contextmanager
+from ..utils import basestring, deprecated, fast_json
 from ..exceptions.orm import MassAssignmentError, RelatedClassNotFound
 from ..query import QueryBuilder
 from .builder import Builder
 from .collection import Collection
+from .serializer import ModelSerializer
+from .events import ModelEventTable
+from .touches import TouchBuffer
+from .templates import QueryTemplate
 from .relations import (
     Relation,
     HasOne,
@@ -27,9 +33,10 @@ from .relations import (
     MorphToMany,
 )
 from .relations.wrapper import Wrapper, BelongsToManyWrapper
-from .utils import mutator, accessor
+from .utils import mutator, accessor, scope
 from .scopes import Scope
 from ..events import Event
+from ..connections.pipeline import PipelineResult
 
 
 class ModelRegister(dict):
@@ -67,6 +74,14 @@ class MetaModel(type):
 
             return getattr(query, item)
 
+    def __setattr__(cls, key, value):
+        super(MetaModel, cls).__setattr__(key, value)
+
+        if isinstance(value, scope) or key.startswith("scope_"):
+            Builder.flush_dispatch_tables(cls)
+        elif key in ("_with", "__attributes__"):
+            cls._flush_query_templates()
+
 
 @add_metaclass(MetaModel)
 class Model(object):
@@ -87,6 +102,8 @@ class Model(object):
     __visible__ = []
     __appends__ = []
 
+    __deferred__ = []
+
     __timestamps__ = True
     __dates__ = []
 
@@ -96,10 +113,16 @@ class Model(object):
 
     __morph_name__ = None
 
+    __shard_key__ = None
+
     _per_page = 15
 
     _with = []
 
+    _deferred = None
+
+    _date_cache = None
+
     _booted = {}
     _global_scopes = {}
     _registered = []
@@ -113,6 +136,13 @@ class Model(object):
     __dispatcher__ = Event()
     __observables__ = []
 
+    _event_tables = {}
+
+    # The models collected by batch_events(), per thread
+    _event_batches = threading.local()
+
+    _query_templates = {}
+
     _register = ModelRegister()
 
     __attributes__ = {}
@@ -165,6 +195,9 @@ class Model(object):
         cls._accessor_cache[cls] = {}
         cls._mutator_cache[cls] = {}
 
+        Builder.flush_dispatch_tables(cls)
+        cls._flush_query_templates()
+
         for name, method in cls.__dict__.items():
             if isinstance(method, accessor):
                 cls._accessor_cache[cls][method.attribute] = method
@@ -177,9 +210,27 @@ class Model(object):
     def _boot_columns(cls):
         connection = cls.resolve_connection()
         columns = connection.get_schema_manager().list_table_columns(
-            cls.__table__ or inflection.tableize(cls.__name__)
+            connection.get_table_prefix()
+            + (cls.__table__ or inflection.tableize(cls.__name__))
         )
-        cls.__columns__ = list(columns.keys())
+        cls.__columns__ = [column.get_name() for column in columns.values()]
+
+        return cls.__columns__
+
+    @classmethod
+    def get_column_listing(cls):
+        """
+        Get the columns of the model's table.
+
+        The columns are read from the database the first time
+        unless the model defines them in __columns__.
+
+        :rtype: list
+        """
+        if not cls.__dict__.get("__columns__"):
+            cls.__columns__ = list(cls._boot_columns())
+
+        return cls.__columns__
 
     @classmethod
     def _boot_mixins(cls):
@@ -191,8 +242,14 @@ class Model(object):
             #    continue
 
             method = "boot_%s" % inflection.underscore(mixin.__name__)
-            if hasattr(mixin, method):
-                getattr(mixin, method)(cls)
+
+            # Looking the method up through type avoids the query fallback of models
+            try:
+                boot = type.__getattribute__(mixin, method)
+            except AttributeError:
+                continue
+
+            boot(cls)
 
     @classmethod
     def add_global_scope(cls, scope, implementation=None):
@@ -217,6 +274,8 @@ class Model(object):
         else:
             raise Exception("Global scope must be an instance of Scope or a callable")
 
+        cls._query_templates.pop(cls, None)
+
     @classmethod
     def has_global_scope(cls, scope):
         """
@@ -258,6 +317,11 @@ class Model(object):
             if hasattr(observer, event):
                 cls._register_model_event(event, getattr(observer, event))
 
+            if hasattr(observer, "%s_batch" % event):
+                cls._register_model_event(
+                    "%s_batch" % event, getattr(observer, "%s_batch" % event)
+                )
+
     def fill(self, _attributes=None, **attributes):
         """
         Fill the model with attributes.
@@ -501,6 +565,146 @@ class Model(object):
 
         return instance
 
+    @classmethod
+    def upsert_many(
+        cls,
+        records,
+        unique_by,
+        update=None,
+        timestamps=True,
+        batch_size=None,
+        return_keys=False,
+    ):
+        """
+        Insert records or update the existing ones, with one statement per batch.
+
+        The model events are not fired. Records sharing the same unique values
+        are collapsed beforehand, the last one winning, since a statement
+        can't update a row twice.
+
+        :param records: The attributes of the records
+        :type records: list
+
+        :param unique_by: The columns of the unique index identifying the records
+        :type unique_by: list or str
+
+        :param update: The columns to update on existing records,
+                       all the columns but the unique ones if None
+        :type update: list or None
+
+        :param timestamps: Whether to set the timestamps of the records
+        :type timestamps: bool
+
+        :param batch_size: The maximum number of records per statement,
+                           the parameters limit of the database being always enforced
+        :type batch_size: int or None
+
+        :param return_keys: Whether to return the primary keys of the records
+        :type return_keys: bool
+
+        :return: The number of distinct records upserted
+                 or the keys of all the records, in order
+        :rtype: int or list
+        """
+        if isinstance(unique_by, basestring):
+            unique_by = [unique_by]
+
+        instance = cls()
+        records = [dict(record) for record in records]
+        upserted = cls._collapse_upserted_records(records, unique_by)
+
+        if timestamps and instance.uses_timestamps():
+            time = instance.from_datetime(instance.fresh_timestamp())
+
+            for column in (cls.CREATED_AT, cls.UPDATED_AT):
+                if instance._should_set_timestamp(column):
+                    for record in upserted:
+                        record.setdefault(column, time)
+
+        # Records are upserted in groups having the same columns
+        groups = OrderedDict()
+        for record in upserted:
+            groups.setdefault(tuple(sorted(record)), []).append(record)
+
+        query = instance.new_query_without_scopes().get_query()
+        max_parameters = query.get_grammar().get_max_parameters()
+
+        with instance.get_connection().transaction():
+            for columns, group in groups.items():
+                if update is None:
+                    updates = [
+                        c for c in columns if c not in unique_by and c != cls.CREATED_AT
+                    ]
+                else:
+                    updates = list(update)
+
+                    if cls.UPDATED_AT in columns and cls.UPDATED_AT not in updates:
+                        updates.append(cls.UPDATED_AT)
+
+                size = max(1, max_parameters // len(columns))
+                if batch_size:
+                    size = min(size, batch_size)
+
+                for start in range(0, len(group), size):
+                    query.upsert(unique_by, updates, group[start : start + size])
+
+        if not return_keys:
+            return len(upserted)
+
+        return instance._get_upserted_keys(records, unique_by, max_parameters)
+
+    @classmethod
+    def _collapse_upserted_records(cls, records, unique_by):
+        """
+        Keep the last of the records sharing the same unique values.
+
+        :rtype: list
+        """
+        collapsed = OrderedDict()
+
+        for i, record in enumerate(records):
+            key = tuple(record.get(c) for c in unique_by)
+
+            # Null values never conflict
+            if None in key:
+                key = i
+
+            collapsed.pop(key, None)
+            collapsed[key] = record
+
+        return list(collapsed.values())
+
+    def _get_upserted_keys(self, records, unique_by, max_parameters):
+        """
+        Get the primary keys of upserted records.
+
+        :rtype: list
+        """
+        key_name = self.get_key_name()
+        keys = {}
+
+        size = max(1, max_parameters // len(unique_by))
+
+        # Each composite key deepens the chain of "or" conditions,
+        # which SQLite limits to an expression depth of 1000
+        if len(unique_by) > 1:
+            size = min(size, 500)
+
+        for start in range(0, len(records), size):
+            query = self.new_query_without_scopes().get_query()
+            chunk = records[start : start + size]
+
+            if len(unique_by) == 1:
+                query.where_in(unique_by[0], [r[unique_by[0]] for r in chunk])
+            else:
+                for record in chunk:
+                    query.or_where(dict((c, record[c]) for c in unique_by))
+
+            for row in query.get([key_name] + unique_by):
+                keys[tuple(row[c] for c in unique_by)] = row[key_name]
+
+        return [keys.get(tuple(r[c] for c in unique_by)) for r in records]
+
     @classmethod
     def query(cls):
         """
@@ -522,7 +726,7 @@ class Model(object):
         :return: A Builder instance
         :rtype: orator.orm.Builder
         """
-        instance = cls()
+        instance = cls._get_query_template().new_model()
 
         instance.set_connection(connection)
 
@@ -536,7 +740,7 @@ class Model(object):
         :return: A Builder instance
         :rtype: QueryBuilder
         """
-        instance = cls()
+        instance = cls._get_query_template().new_model()
 
         return instance.new_query().use_write_connection()
 
@@ -551,7 +755,7 @@ class Model(object):
         :return: A Collection instance
         :rtype: Collection
         """
-        instance = cls()
+        instance = cls._get_query_template().new_model()
 
         return instance.new_query().get(columns)
 
@@ -1455,6 +1659,9 @@ class Model(object):
 
         for event in cls.get_observable_events():
             cls.__dispatcher__.forget("%s: %s" % (event, cls.__name__))
+            cls.__dispatcher__.forget("%s_batch: %s" % (event, cls.__name__))
+
+        cls._event_tables.pop(cls, None)
 
     @classmethod
     def _register_model_event(cls, event, callback):
@@ -1470,6 +1677,106 @@ class Model(object):
         if cls.__dispatcher__:
             cls.__dispatcher__.listen("%s: %s" % (event, cls.__name__), callback)
 
+        cls._event_tables.pop(cls, None)
+
+    @classmethod
+    def listen_batch(cls, event, callback):
+        """
+        Register a listener called once per batch of models
+        with the collection of the models of the batch.
+
+        :param event: The event
+        :type event: str
+
+        :param callback: The callback
+        :type callback: callable
+        """
+        cls._register_model_event("%s_batch" % event, callback)
+
+    @classmethod
+    @contextmanager
+    def batch_events(cls):
+        """
+        Collect the models saved or deleted in the context
+        and notify the batch listeners once per event when leaving it.
+
+        The listeners of the individual models are still notified immediately.
+        """
+        batches = cls._get_event_batches()
+
+        if cls in batches:
+            yield
+            return
+
+        batch = batches[cls] = OrderedDict()
+
+        try:
+            yield
+        finally:
+            del batches[cls]
+            cls._event_batches.tables.pop(cls, None)
+
+        for event, models in batch.items():
+            if models:
+                cls.fire_batch_event(event, models)
+
+    @classmethod
+    def fire_batch_event(cls, event, models):
+        """
+        Notify the batch listeners of an event for a list of models.
+
+        :param event: The event
+        :type event: str
+
+        :param models: The models
+        :type models: list
+
+        :return: False if a listener cancelled the event
+        :rtype: bool
+        """
+        return cls._get_event_table().fire(
+            "%s_batch" % event, Collection(list(models))
+        )
+
+    @classmethod
+    def _get_event_batches(cls):
+        local = cls._event_batches
+
+        if not hasattr(local, "batches"):
+            local.batches = {}
+            local.tables = {}
+
+        return local.batches
+
+    @classmethod
+    def _get_event_table(cls):
+        """
+        Get the table of the event listeners of the model,
+        building it if the listeners, the dispatcher or the batch
+        of the current thread changed since it was last built.
+
+        :rtype: ModelEventTable
+        """
+        batch = cls._get_event_batches().get(cls)
+
+        # Tables collecting a batch are only used by the thread of the batch
+        if batch is None:
+            tables = cls._event_tables
+        else:
+            tables = cls._event_batches.tables
+
+        table = tables.get(cls)
+
+        if (
+            table is None
+            or table.version != Event.version
+            or table.dispatcher is not cls.__dispatcher__
+            or table.batch is not batch
+        ):
+            table = tables[cls] = ModelEventTable(cls, cls.__dispatcher__, batch)
+
+        return table
+
     @classmethod
     def get_observable_events(cls):
         """
@@ -1722,20 +2029,60 @@ class Model(object):
 
         id = query.insert_get_id(attributes, key_name)
 
+        if isinstance(id, PipelineResult):
+            # Within a pipeline, the ID is known once the insert is sent
+            def set_id(result):
+                if result.exception() is None:
+                    self.set_attribute(key_name, result.result())
+                    self._original[key_name] = self._attributes[key_name]
+
+            id.add_done_callback(set_id)
+
+            return
+
         self.set_attribute(key_name, id)
 
     def touch_owners(self):
         """
         Touch the owning relations of the model.
+
+        Within a transaction or a batch_touches() block, the touches are
+        deferred and each owner is only updated once.
         """
+        if not self.__touches__:
+            return
+
+        buffer = TouchBuffer.current(self.get_connection())
+
         for relation in self.__touches__:
             if hasattr(self, relation):
                 _relation = getattr(self, relation)
 
-                if _relation:
+                if not _relation:
+                    continue
+
+                if buffer is not None:
+                    buffer.touch(_relation)
+                else:
                     _relation.touch()
                     _relation.touch_owners()
 
+    @classmethod
+    @contextmanager
+    def batch_touches(cls):
+        """
+        Defer the touches of the owner models until the end of the block
+        and update them with a single query per table.
+        """
+        buffer = TouchBuffer.push()
+
+        try:
+            yield buffer
+        finally:
+            TouchBuffer.pop()
+
+        buffer.flush()
+
     def touches(self, relation):
         """
         Determine if a model touches a given relation.
@@ -1753,15 +2100,18 @@ class Model(object):
 
         :type event: str
         """
-        if not self.__dispatcher__:
-            return True
+        if "__dispatcher__" in self.__dict__:
+            if not self.__dispatcher__:
+                return True
 
-        # We will append the names of the class to the event to distinguish it from
-        # other model events that are fired, allowing us to listen on each model
-        # event set individually instead of catching event for all the models.
-        event = "%s: %s" % (event, self.__class__.__name__)
+            # We will append the names of the class to the event to distinguish it from
+            # other model events that are fired, allowing us to listen on each model
+            # event set individually instead of catching event for all the models.
+            event = "%s: %s" % (event, self.__class__.__name__)
 
-        return self.__dispatcher__.fire(event, self)
+            return self.__dispatcher__.fire(event, self)
+
+        return self._get_event_table().fire(event, self)
 
     def _set_keys_for_save_query(self, query):
         """
@@ -1890,8 +2240,9 @@ class Model(object):
         """
         builder = self.new_query_without_scopes()
 
-        for identifier, scope in self.get_global_scopes().items():
-            builder.with_global_scope(identifier, scope)
+        scopes = self._get_query_template().scopes
+        if scopes:
+            builder.with_global_scopes(scopes)
 
         return builder
 
@@ -1914,12 +2265,43 @@ class Model(object):
         :rtype: Builder
         """
         builder = self.new_orm_builder(self._new_base_query_builder())
+        builder.set_model(self)
+
+        template = self._get_query_template()
+
+        if self._with is template.with_:
+            return builder.set_eager_loads(dict(template.eager_load))
 
-        return builder.set_model(self).with_(*self._with)
+        return builder.with_(*self._with)
 
     @classmethod
     def query(cls):
-        return cls().new_query()
+        return cls._get_query_template().new_model().new_query()
+
+    @classmethod
+    def _get_query_template(cls):
+        """
+        Get the query template of the model class.
+
+        :rtype: QueryTemplate
+        """
+        template = cls._query_templates.get(cls)
+
+        if template is None:
+            template = cls._query_templates[cls] = QueryTemplate(
+                cls, fast_init=cls.__init__ is Model.__init__
+            )
+
+        return template
+
+    @classmethod
+    def _flush_query_templates(cls):
+        """
+        Forget the query templates of the model class and its subclasses.
+        """
+        for klass in list(cls._query_templates):
+            if issubclass(klass, cls):
+                del cls._query_templates[klass]
 
     def new_orm_builder(self, query):
         """
@@ -1940,6 +2322,15 @@ class Model(object):
         :return: A QueryBuilder instance
         :rtype: QueryBuilder
         """
+        if self.__shard_key__ is not None and self._get_shard_key_value() is None:
+            from ..sharding import ShardedQueryBuilder
+
+            return ShardedQueryBuilder(
+                self.get_connection_resolver(),
+                self._get_shard_map_name(),
+                self.__shard_key__,
+            )
+
         conn = self.get_connection()
 
         return conn.query()
@@ -2263,7 +2654,7 @@ class Model(object):
         :return: The JSON encoded model instance
         :rtype: str
         """
-        return json.dumps(self.to_dict(), **options)
+        return fast_json.dumps(self.serialize(), **options)
 
     def serialize(self):
         """
@@ -2272,11 +2663,7 @@ class Model(object):
         :return: The dictionary version of the model instance
         :rtype: dict
         """
-        attributes = self.attributes_to_dict()
-
-        attributes.update(self.relations_to_dict())
-
-        return attributes
+        return ModelSerializer.for_model(self.__class__).serialize(self)
 
     @deprecated
     def to_dict(self):
@@ -2301,7 +2688,12 @@ class Model(object):
             if not key in attributes or key in mutated_attributes:
                 continue
 
-            attributes[key] = self._format_date(attributes[key])
+            value = attributes[key]
+
+            if isinstance(value, basestring):
+                value = self._get_date_attribute(key, value)
+
+            attributes[key] = self._format_date(value)
 
         for key in mutated_attributes:
             if key not in attributes:
@@ -2406,6 +2798,11 @@ class Model(object):
         if in_attributes:
             return self._get_attribute_value(key)
 
+        if self._deferred is not None and self._deferred.is_deferred(key):
+            self._deferred.load(key)
+
+            return self._get_attribute_value(key)
+
         if key in self._relations:
             return self._relations[key]
 
@@ -2438,10 +2835,36 @@ class Model(object):
             value = self._cast_attribute(key, value)
         elif key in self.get_dates():
             if value is not None:
-                return self.as_datetime(value)
+                return self._get_date_attribute(key, value)
 
         return value
 
+    def _get_date_attribute(self, key, value):
+        """
+        Get a date attribute, the parsed value being kept
+        until the raw value changes.
+
+        :param key: The attribute
+        :type key: str
+
+        :param value: The raw value
+        :type value: mixed
+
+        :rtype: pendulum.Pendulum or pendulum.Date
+        """
+        cache = self._date_cache
+        if cache is None:
+            cache = self._date_cache = {}
+
+        cached = cache.get(key)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+
+        date = self.as_datetime(value)
+        cache[key] = (value, date)
+
+        return date
+
     def _get_attribute_from_dict(self, key):
         return self._attributes.get(key)
 
@@ -2587,14 +3010,20 @@ class Model(object):
 
     def from_datetime(self, value):
         """
-        Convert datetime to a storable string.
+        Convert datetime to a storable string,
+        or to a native date if the connection uses native dates.
 
         :param value: The datetime value
         :type value: pendulum.Pendulum or datetime.date or datetime.datetime
 
-        :rtype: str
+        :rtype: str or datetime.date or datetime.datetime
         """
-        date_format = self.get_connection().get_query_grammar().get_date_format()
+        grammar = self.get_connection().get_query_grammar()
+
+        if grammar.uses_native_dates() and isinstance(value, datetime.date):
+            return grammar.prepare_date(value)
+
+        date_format = grammar.get_date_format()
 
         if isinstance(value, pendulum.Pendulum):
             return value.format(date_format)
@@ -2883,8 +3312,35 @@ class Model(object):
 
         :rtype: orator.connections.Connection
         """
+        if self.__shard_key__ is not None:
+            return self._get_shard_connection()
+
         return self.resolve_connection(self.__connection__)
 
+    def _get_shard_connection(self):
+        resolver = self.get_connection_resolver()
+        name = self._get_shard_map_name()
+        value = self._get_shard_key_value()
+
+        # Without a shard key value, the first shard is used
+        if value is None:
+            return resolver.shards(name)[0]
+
+        return resolver.shard(name, value)
+
+    def _get_shard_map_name(self):
+        if self.__connection__ is not None:
+            return self.__connection__
+
+        return self.get_connection_resolver().get_default_connection()
+
+    def _get_shard_key_value(self):
+        # Existing records stay on the shard they were loaded from
+        if self._exists and self.__shard_key__ in self._original:
+            return self._original[self.__shard_key__]
+
+        return self._attributes.get(self.__shard_key__)
+
     def get_connection_name(self):
         """
         Get the database connection name for the model.
@@ -2962,6 +3418,8 @@ class Model(object):
             "_exists",
             "_relations",
             "_original",
+            "_deferred",
+            "_date_cache",
         ] or key.startswith("__"):
             return object.__setattr__(self, key, value)
 
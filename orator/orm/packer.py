@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+import importlib
+from ..utils import PY2, fast_pack
+
+# The version of the packed format
+FORMAT = 1
+
+# The kinds of relation values
+NONE = 0
+MODEL = 1
+COLLECTION = 2
+VALUE = 3
+
+
+class ModelPacker(object):
+    """
+    Converts collections of models to compact structures and back.
+
+    The attributes of the models are stored as tuples of values
+    following the column order of a schema shared by all the models
+    of a class having the same columns. Relations are packed recursively.
+
+    Like pickling, packing keeps the attributes, the relations
+    and the exists flag of the models, the original attributes
+    being synced with the current ones when unpacking.
+    """
+
+    _classes = {}
+
+    _kinds = {}
+
+    def __init__(self):
+        self._class_indexes = {}
+        self._class_paths = []
+        self._schema_indexes = {}
+        self._schemas = []
+
+    @classmethod
+    def dumps(cls, collection):
+        """
+        Encode a collection of models.
+
+        :param collection: The collection of models
+        :type collection: orator.orm.Collection
+
+        :rtype: bytes
+        """
+        return fast_pack.dumps(cls().pack(collection))
+
+    @classmethod
+    def loads(cls, data):
+        """
+        Decode a collection of models encoded by dumps().
+
+        :param data: The encoded collection
+        :type data: bytes
+
+        :rtype: orator.orm.Collection
+        """
+        return cls().unpack(fast_pack.loads(data))
+
+    def pack(self, collection):
+        """
+        Convert a collection of models to a plain structure.
+
+        :param collection: The collection of models
+        :type collection: orator.orm.Collection
+
+        :rtype: tuple
+        """
+        collection_class = self._get_class_index(collection.__class__)
+        rows = self._pack_models(collection.all())
+
+        return (
+            FORMAT,
+            tuple(self._class_paths),
+            tuple(self._schemas),
+            collection_class,
+            rows,
+        )
+
+    def unpack(self, state):
+        """
+        Convert a structure built by pack() back to a collection of models.
+
+        :param state: The packed collection
+        :type state: tuple
+
+        :rtype: orator.orm.Collection
+        """
+        version, paths, schemas, collection_class, rows = state
+
+        if version != FORMAT:
+            raise ValueError("Unsupported packed format [%s]" % version)
+
+        classes = [self._resolve_class(path) for path in paths]
+        schemas = [(classes[index], columns) for index, columns in schemas]
+
+        for klass, _ in schemas:
+            self._boot(klass)
+
+        # Resolving the constructor of each schema once
+        schemas = [(klass, klass.__new__, columns) for klass, columns in schemas]
+
+        return self._unpack_collection(classes, schemas, collection_class, rows)
+
+    def _pack_models(self, models):
+        schema_indexes = self._schema_indexes
+        pack_relation = self._pack_relation
+        rows = []
+
+        for model in models:
+            attributes = model._attributes
+            relations = model._relations
+
+            key = (model.__class__, tuple(attributes))
+            schema = schema_indexes.get(key)
+
+            if schema is None:
+                schema = self._add_schema(key)
+
+            if relations:
+                relations = tuple(
+                    [
+                        (name,) + pack_relation(value)
+                        for name, value in relations.items()
+                    ]
+                )
+            else:
+                relations = None
+
+            rows.append((schema, tuple(attributes.values()), model._exists, relations))
+
+        return tuple(rows)
+
+    def _add_schema(self, key):
+        schema = self._schema_indexes[key] = len(self._schemas)
+        self._schemas.append((self._get_class_index(key[0]), key[1]))
+
+        return schema
+
+    def _pack_relation(self, value):
+        if value is None:
+            return NONE, None
+
+        kind = self._get_kind(value)
+
+        if kind == MODEL:
+            return MODEL, self._pack_models([value])[0]
+
+        if kind == COLLECTION:
+            return (
+                COLLECTION,
+                (self._get_class_index(value.__class__), self._pack_models(value)),
+            )
+
+        return VALUE, value
+
+    @classmethod
+    def _get_kind(cls, value):
+        kind = cls._kinds.get(value.__class__)
+
+        if kind is None:
+            from .model import Model
+            from .collection import Collection
+
+            if isinstance(value, Model):
+                kind = MODEL
+            elif isinstance(value, Collection):
+                kind = COLLECTION
+            else:
+                kind = VALUE
+
+            cls._kinds[value.__class__] = kind
+
+        return kind
+
+    def _unpack_collection(self, classes, schemas, collection_class, rows):
+        return classes[collection_class](self._unpack_models(classes, schemas, rows))
+
+    def _unpack_models(self, classes, schemas, rows):
+        models = []
+
+        for schema, values, exists, packed_relations in rows:
+            klass, new, columns = schemas[schema]
+
+            relations = {}
+            if packed_relations:
+                for name, kind, value in packed_relations:
+                    if kind == MODEL:
+                        value = self._unpack_models(classes, schemas, [value])[0]
+                    elif kind == COLLECTION:
+                        value = self._unpack_collection(classes, schemas, *value)
+
+                    relations[name] = value
+
+            attributes = dict(zip(columns, values))
+
+            model = new(klass)
+            model.__dict__.update(
+                _exists=exists,
+                _attributes=attributes,
+                _original=dict(attributes),
+                _relations=relations,
+            )
+
+            models.append(model)
+
+        return models
+
+    def _boot(self, klass):
+        if not klass._booted.get(klass):
+            klass.__new__(klass)._boot_if_not_booted()
+
+    def _get_class_index(self, klass):
+        index = self._class_indexes.get(klass)
+
+        if index is None:
+            index = self._class_indexes[klass] = len(self._class_paths)
+            self._class_paths.append(self._get_class_path(klass))
+
+        return index
+
+    def _get_class_path(self, klass):
+        # Reading the name through type avoids the query fallback of models
+        name = type.__getattribute__(klass, "__name__" if PY2 else "__qualname__")
+
+        return "%s:%s" % (klass.__module__, name)
+
+    @classmethod
+    def _resolve_class(cls, path):
+        klass = cls._classes.get(path)
+
+        if klass is None:
+            module, _, name = path.partition(":")
+
+            klass = importlib.import_module(module)
+            for part in name.split("."):
+                klass = getattr(klass, part)
+
+            cls._classes[path] = klass
+
+        return klass
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+import os
+import copy
+import pickle
+import numbers
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+from ..exceptions import ArgumentError
+from ..utils import PY2
+
+
+# The job run by the worker processes. It is inherited when forking
+# so that the builder and the callback do not need to be pickled.
+_job = None
+
+
+def _run_partition_in_process(bounds):
+    return _job.run_partition(bounds)
+
+
+class ParallelResult(object):
+    """
+    The aggregated outcome of Builder.parallel_chunk().
+    """
+
+    def __init__(self, results, errors):
+        """
+        :param results: The values returned by the callback, in key order
+        :type results: list
+
+        :param errors: The (first key, last key, exception) tuples of the failed chunks
+        :type errors: list
+        """
+        self.results = results
+        self.errors = errors
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __repr__(self):
+        return "<ParallelResult results=%d errors=%d>" % (
+            len(self.results),
+            len(self.errors),
+        )
+
+
+class ParallelChunk(object):
+    """
+    Processes the chunks of a query in parallel,
+    each worker handling a range of primary keys on its own connection.
+    """
+
+    def __init__(self, builder, callback, count, executor="thread"):
+        """
+        :param builder: The scoped builder
+        :type builder: orator.orm.Builder
+
+        :param callback: The function called with each chunk
+        :type callback: callable
+
+        :param count: The chunk size
+        :type count: int
+
+        :param executor: "thread" or "process"
+        :type executor: str
+        """
+        if executor not in ["thread", "process"]:
+            raise ArgumentError("Invalid executor [%s]" % executor)
+
+        self._builder = builder
+        self._model = builder.get_model()
+        self._query = builder.get_query()
+        self._callback = callback
+        self._count = count
+        self._executor = executor
+        self._column = self._model.get_qualified_key_name()
+        self._pid = os.getpid()
+
+    def run(self, workers):
+        """
+        Run the callback on all the chunks.
+
+        :param workers: The number of workers
+        :type workers: int
+
+        :rtype: ParallelResult
+        """
+        partitions = self.get_partitions(workers)
+
+        if not partitions:
+            return ParallelResult([], [])
+
+        workers = min(workers, len(partitions))
+
+        if self._executor == "thread":
+            pool = ThreadPool(workers)
+            try:
+                outcomes = pool.map(self.run_partition, partitions)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            outcomes = self._run_in_processes(workers, partitions)
+
+        results = []
+        errors = []
+        for partition_results, partition_errors in outcomes:
+            results += partition_results
+            errors += partition_errors
+
+        return ParallelResult(results, errors)
+
+    def _run_in_processes(self, workers, partitions):
+        global _job
+
+        if PY2:
+            context = multiprocessing
+        else:
+            context = multiprocessing.get_context("fork")
+
+        _job = self
+        pool = context.Pool(workers)
+        try:
+            return pool.map(_run_partition_in_process, partitions)
+        finally:
+            pool.close()
+            pool.join()
+            _job = None
+
+    def get_partitions(self, workers):
+        """
+        Split the range of primary keys in contiguous partitions.
+
+        :param workers: The number of partitions
+        :type workers: int
+
+        :return: A list of (min key, max key) tuples
+        :rtype: list
+        """
+        low = copy.copy(self._query).min(self._column)
+        high = copy.copy(self._query).max(self._column)
+
+        if low is None or high is None:
+            return []
+
+        # Keys that are not integers can't be split,
+        # so they are handled by a single worker.
+        if not isinstance(low, numbers.Integral) or not isinstance(
+            high, numbers.Integral
+        ):
+            return [(None, None)]
+
+        size = max(1, (high - low + 1) // workers)
+
+        partitions = []
+        start = low
+        while start <= high:
+            end = start + size - 1
+            if len(partitions) == workers - 1:
+                end = high
+
+            partitions.append((start, min(end, high)))
+            start = end + 1
+
+        return partitions
+
+    def run_partition(self, bounds):
+        """
+        Run the callback on the chunks of a range of keys.
+
+        :param bounds: The (min key, max key) tuple
+        :type bounds: tuple
+
+        :return: The results and errors of the partition
+        :rtype: tuple
+        """
+        resolver = self._model.get_connection_resolver()
+        name = self._model.get_connection_name()
+
+        if os.getpid() != self._pid:
+            # The connections inherited from the parent process
+            # must not be used, nor closed, by the child.
+            for connection in list(resolver.get_connections()):
+                resolver.forget(connection)
+
+            self._pid = os.getpid()
+
+        query = copy.copy(self._query)
+        query._connection = resolver.connection(name)
+
+        results = []
+        errors = []
+        key = self._model.get_key_name()
+
+        try:
+            for rows in query.chunk_by_id(self._count, self._column, *bounds):
+                models = self._model.hydrate(rows, name)
+                models = self._model.new_collection(
+                    self._builder.eager_load_relations(models.all())
+                )
+
+                try:
+                    results.append(self._callback(models))
+                except Exception as e:
+                    errors.append((rows[0][key], rows[-1][key], self._portable(e)))
+        except Exception as e:
+            errors.append((bounds[0], bounds[1], self._portable(e)))
+        finally:
+            resolver.disconnect(name)
+
+        return results, errors
+
+    def _portable(self, error):
+        """
+        Make sure an error can be sent back by a worker process.
+        """
+        if self._executor == "thread":
+            return error
+
+        try:
+            pickle.loads(pickle.dumps(error))
+
+            return error
+        except Exception:
+            return Exception("%s: %s" % (error.__class__.__name__, error))
@@ -6,6 +6,7 @@ import inflection
 from ...exceptions.orm import ModelNotFound
 from ...query.expression import QueryExpression
 from ..collection import Collection
+from ..touches import TouchBuffer
 import orator.orm.model
 from .relation import Relation
 from .result import Result
@@ -399,7 +400,12 @@ class BelongsToMany(Relation):
         ids = self.get_related_ids()
 
         if len(ids) > 0:
-            self.get_related().new_query().where_in(key, ids).update(columns)
+            buffer = TouchBuffer.current(self.get_related().get_connection())
+
+            if buffer is not None:
+                buffer.touch_keys(self.get_related(), ids)
+            else:
+                self.get_related().new_query().where_in(key, ids).update(columns)
 
     def get_related_ids(self):
         """
@@ -444,8 +450,9 @@ class BelongsToMany(Relation):
         if joinings is None:
             joinings = {}
 
-        for key, model in enumerate(models):
-            self.save(model, joinings.get(key), False)
+        with self._related.batch_events():
+            for key, model in enumerate(models):
+                self.save(model, joinings.get(key), False)
 
         self.touch_if_touching()
 
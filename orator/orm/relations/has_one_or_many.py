@@ -174,7 +174,8 @@ class HasOneOrMany(Relation):
 
         :rtype: list
         """
-        return list(map(self.save, models))
+        with self._related.batch_events():
+            return list(map(self.save, models))
 
     def find_or_new(self, id, columns=None):
         """
@@ -289,8 +290,9 @@ class HasOneOrMany(Relation):
         """
         instances = []
 
-        for record in records:
-            instances.append(self.create(**record))
+        with self._related.batch_events():
+            for record in records:
+                instances.append(self.create(**record))
 
         return instances
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import types
 from contextlib import contextmanager
 from ...query.expression import QueryExpression
 from ..collection import Collection
@@ -10,6 +11,9 @@ class Relation(object):
 
     _constraints = True
 
+    # The functions forwarding the dynamic methods to the query, by name
+    _forwarders = {}
+
     def __init__(self, query, parent):
         """
         :param query: A Builder instance
@@ -232,18 +236,26 @@ class Relation(object):
     def __dynamic(self, method):
         attribute = getattr(self._query, method)
 
-        def call(*args, **kwargs):
-            result = attribute(*args, **kwargs)
+        if not callable(attribute):
+            return attribute
 
-            if result is self._query:
-                return self
+        forwarder = self._forwarders.get(method)
+        if forwarder is None:
+            forwarder = self._forwarders[method] = self._make_forwarder(method)
 
-            return result
+        return types.MethodType(forwarder, self)
 
-        if not callable(attribute):
-            return attribute
+    @staticmethod
+    def _make_forwarder(method):
+        def forward(relation, *args, **kwargs):
+            result = getattr(relation._query, method)(*args, **kwargs)
+
+            if result is relation._query:
+                return relation
+
+            return result
 
-        return call
+        return forward
 
     def __getattr__(self, item):
         return self.__dynamic(item)
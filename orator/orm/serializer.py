@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+import re
+from ..utils import basestring
+
+
+class ModelSerializer(object):
+    """
+    Converts models of a given class to dictionaries in a single pass
+    over their attributes and relations.
+
+    Models overriding one of the serialization hooks are converted
+    through the regular attributes_to_dict() and relations_to_dict() methods.
+    """
+
+    _hooks = [
+        "attributes_to_dict",
+        "relations_to_dict",
+        "_get_dictable_attributes",
+        "_get_dictable_appends",
+        "_get_dictable_relations",
+        "_get_dictable_items",
+        "_get_mutated_attributes",
+        "_format_date",
+    ]
+
+    _date = re.compile(
+        r"^(\d{4}-\d{2}-\d{2})(?:[ T](\d{2}:\d{2}:\d{2})(?:\.(\d{1,6}))?)?$"
+    )
+
+    _serializers = {}
+
+    def __init__(self, klass):
+        """
+        :param klass: The model class
+        :type klass: type
+        """
+        self._compiled = not self._overrides_hooks(klass)
+        self._mutated = None
+
+    @classmethod
+    def for_model(cls, klass):
+        """
+        Get the serializer of a model class.
+
+        :param klass: The model class
+        :type klass: type
+
+        :rtype: ModelSerializer
+        """
+        serializer = cls._serializers.get(klass)
+
+        if serializer is None:
+            serializer = cls._serializers[klass] = cls(klass)
+
+        return serializer
+
+    def _overrides_hooks(self, klass):
+        from .model import Model
+
+        for base in klass.__mro__:
+            if base is Model:
+                break
+
+            for hook in self._hooks:
+                if hook in base.__dict__:
+                    return True
+
+        return False
+
+    def serialize(self, model):
+        """
+        Convert a model instance to a dictionary.
+
+        :param model: The model instance
+        :type model: orator.orm.Model
+
+        :rtype: dict
+        """
+        if not self._compiled:
+            attributes = model.attributes_to_dict()
+
+            attributes.update(model.relations_to_dict())
+
+            return attributes
+
+        if self._mutated is None:
+            self._mutated = set(model._get_mutated_attributes())
+
+        mutated = self._mutated
+        visible = model.__visible__
+        hidden = model.__hidden__
+        casts = model.__casts__
+        dates = model.get_dates()
+        date_format = model.get_date_format()
+
+        result = {}
+
+        for key, value in model._attributes.items():
+            if visible:
+                if key not in visible:
+                    continue
+            elif key in hidden or key.startswith("_"):
+                continue
+
+            if key in mutated:
+                value = model._mutate_attribute_for_dict(key)
+            else:
+                if key in dates:
+                    value = self._format_date(model, value, date_format)
+
+                if key in casts:
+                    value = model._cast_attribute(key, value)
+
+            result[key] = value
+
+        for key in model.__appends__:
+            if visible:
+                if key not in visible:
+                    continue
+            elif key in hidden or key.startswith("_"):
+                continue
+
+            result[key] = model._mutate_attribute_for_dict(key)
+
+        for key, value in model._relations.items():
+            if visible:
+                if key not in visible or key in hidden:
+                    continue
+            elif key in hidden or key.startswith("_"):
+                continue
+
+            if hasattr(value, "serialize"):
+                result[key] = value.serialize()
+            elif hasattr(value, "to_dict"):
+                result[key] = value.to_dict()
+            elif value is None:
+                result[key] = None
+
+        return result
+
+    def _format_date(self, model, date, date_format):
+        """
+        Format a date attribute.
+
+        Dates stored as strings in the database format are converted
+        to ISO 8601 without being parsed.
+
+        :rtype: str
+        """
+        if date_format == "iso" and isinstance(date, basestring):
+            match = self._date.match(date)
+
+            if match:
+                day, time, fraction = match.groups()
+
+                if fraction and int(fraction):
+                    fraction = "." + fraction.ljust(6, "0")
+                else:
+                    fraction = ""
+
+                return "%sT%s%s+00:00" % (day, time or "00:00:00", fraction)
+
+        return model._format_date(date)
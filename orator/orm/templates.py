@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+
+
+class QueryTemplate(object):
+    """
+    The parts of the queries of a model class resolved once:
+    the default attributes, the global scopes and the default eager loads.
+    """
+
+    def __init__(self, klass, fast_init=False):
+        """
+        :param klass: The model class
+        :type klass: class
+
+        :param fast_init: Whether the models can be created without calling __init__
+        :type fast_init: bool
+        """
+        model = klass()
+
+        self.klass = klass
+        self.fast_init = fast_init
+        self.attributes = dict(klass.__attributes__)
+        self.scopes = OrderedDict(model.get_global_scopes())
+        self.with_ = klass._with
+        self.eager_load = {}
+
+        if self.with_:
+            builder = model.new_orm_builder(model._new_base_query_builder())
+
+            self.eager_load = builder._parse_with_relations(list(self.with_))
+
+    def new_model(self):
+        """
+        Create an empty model to query from.
+
+        :rtype: orator.orm.Model
+        """
+        if not self.fast_init:
+            return self.klass()
+
+        model = self.klass.__new__(self.klass)
+        model.__dict__.update(
+            _exists=False,
+            _attributes=dict(self.attributes),
+            _original=dict(self.attributes),
+            _relations={},
+        )
+
+        return model
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import OrderedDict
+
+from .collection import Collection
+
+
+_local = threading.local()
+
+
+class TouchBuffer(object):
+    """
+    Collects the owner models to touch and updates their timestamps
+    with a single query per table when flushed.
+    """
+
+    chunk_size = 500
+
+    def __init__(self):
+        self._touches = OrderedDict()
+
+    @classmethod
+    def current(cls, connection):
+        """
+        Get the buffer in which the touches must be recorded.
+
+        :param connection: The connection of the touching model
+        :type connection: orator.connections.Connection
+
+        :return: The buffer of the active batch_touches() scope,
+                 the buffer of the current transaction or None
+        :rtype: TouchBuffer or None
+        """
+        buffers = getattr(_local, "buffers", None)
+        if buffers:
+            return buffers[-1]
+
+        if connection.transaction_level() > 0:
+            return connection.before_commit(cls(), TouchBuffer)
+
+        return None
+
+    @classmethod
+    def push(cls):
+        """
+        Start a batch of touches.
+
+        :rtype: TouchBuffer
+        """
+        if not hasattr(_local, "buffers"):
+            _local.buffers = []
+
+        buffer = cls()
+        _local.buffers.append(buffer)
+
+        return buffer
+
+    @classmethod
+    def pop(cls):
+        """
+        End the current batch of touches.
+
+        :rtype: TouchBuffer
+        """
+        return _local.buffers.pop()
+
+    def touch(self, owners):
+        """
+        Record the touch of owner models and, through them, of their own owners.
+
+        :param owners: The owner models
+        :type owners: Model or Collection
+        """
+        if isinstance(owners, Collection):
+            owners = owners.all()
+        elif not isinstance(owners, list):
+            owners = [owners]
+
+        for owner in owners:
+            if not owner.exists:
+                continue
+
+            if not owner._should_set_timestamp(owner.UPDATED_AT):
+                continue
+
+            models = self._get_models(owner.__class__, owner.get_connection_name())
+            key = owner.get_key()
+
+            if key in models:
+                models[key].append(owner)
+
+                continue
+
+            models[key] = [owner]
+
+            owner.touch_owners()
+
+    def touch_keys(self, model, keys):
+        """
+        Record the touch of models by their keys.
+
+        :param model: An instance of the model class
+        :type model: Model
+
+        :param keys: The keys of the models
+        :type keys: list
+        """
+        models = self._get_models(model.__class__, model.get_connection_name())
+
+        for key in keys:
+            models.setdefault(key, [])
+
+    def _get_models(self, klass, connection):
+        return self._touches.setdefault((klass, connection), OrderedDict())
+
+    def flush(self):
+        """
+        Update the timestamps of the recorded models.
+        """
+        touches = self._touches
+        self._touches = OrderedDict()
+
+        for (klass, connection), models in touches.items():
+            instance = klass()
+            instance.set_connection(connection)
+
+            column = instance.get_updated_at_column()
+            time = instance.fresh_timestamp()
+            keys = list(models.keys())
+
+            for i in range(0, len(keys), self.chunk_size):
+                instance.new_query_without_scopes().where_in(
+                    instance.get_qualified_key_name(), keys[i : i + self.chunk_size]
+                ).update({column: time})
+
+            for owners in models.values():
+                for owner in owners:
+                    owner.set_updated_at(time)
+                    owner._original[column] = owner._attributes[column]
+
+    def __call__(self):
+        self.flush()
@@ -9,7 +9,15 @@ from ..utils import deprecated
 
 
 class LengthAwarePaginator(BasePaginator):
-    def __init__(self, items, total, per_page, current_page=None, options=None):
+    def __init__(
+        self,
+        items,
+        total,
+        per_page,
+        current_page=None,
+        options=None,
+        approximate=False,
+    ):
         """
         Constructor
 
@@ -27,20 +35,31 @@ class LengthAwarePaginator(BasePaginator):
 
         :param options: Extra options to set
         :type options: dict
+
+        :param approximate: Whether the total is an estimate
+        :type approximate: bool
         """
         if options is not None:
             for key, value in options.items():
                 setattr(self, key, value)
 
-        self.total = total
-        self.per_page = per_page
-        self.last_page = int(math.ceil(total / per_page))
-        self.current_page = self._set_current_page(current_page, self.last_page)
         if isinstance(items, Collection):
             self._items = items
         else:
             self._items = Collection.make(items)
 
+        self.total = total
+        self.approximate = approximate
+        self.per_page = per_page
+        self.last_page = int(math.ceil(total / per_page))
+
+        # An estimated total can be too low, so we trust
+        # the results we got for the requested page.
+        if approximate and current_page and len(self._items) > 0:
+            self.last_page = max(self.last_page, current_page)
+
+        self.current_page = self._set_current_page(current_page, self.last_page)
+
     def _set_current_page(self, current_page, last_page):
         """
         Get the current page for the request.
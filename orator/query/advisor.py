@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+
+import re
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+_identifier = r'[`"\[]?([\w$]+)[`"\]]?'
+
+
+class IndexSuggestion(object):
+    """
+    An index proposed by the IndexAdvisor.
+    """
+
+    def __init__(self, table, columns):
+        """
+        :param table: The table to index
+        :type table: str
+
+        :param columns: The columns to index
+        :type columns: list
+        """
+        self.table = table
+        self.columns = columns
+        self.rows = 0
+        self.occurrences = 0
+        self.queries = []
+
+    @property
+    def weight(self):
+        return self.rows * self.occurrences
+
+    def apply(self, blueprint):
+        """
+        Add the suggested index to a schema blueprint.
+
+        :param blueprint: The blueprint of the table
+        :type blueprint: orator.schema.Blueprint
+
+        :rtype: Fluent
+        """
+        return blueprint.index(list(self.columns))
+
+    def definition(self):
+        """
+        Get the Blueprint.index() call for the suggested index.
+
+        :rtype: str
+        """
+        return "table.index([%s])" % ", ".join("'%s'" % c for c in self.columns)
+
+    def __str__(self):
+        return "with schema.table('%s') as table:\n    %s" % (
+            self.table,
+            self.definition(),
+        )
+
+    def __repr__(self):
+        return "<IndexSuggestion %s(%s) rows=%d occurrences=%d>" % (
+            self.table,
+            ", ".join(self.columns),
+            self.rows,
+            self.occurrences,
+        )
+
+
+class IndexAdvisor(object):
+    """
+    Explains the select queries run against a connection
+    and proposes indexes for the full scans on large tables.
+    """
+
+    _tables = re.compile(
+        r"\b(?:from|join)\s+%s(?:\s+as\s+%s)?" % (_identifier, _identifier),
+        re.IGNORECASE,
+    )
+
+    _conditions = re.compile(
+        r"(?:%s\.)?%s\s*(=|<>|!=|<=|>=|<|>|not\s+in\b|in\b|not\s+like\b|like\b"
+        r"|is\b|between\b)" % (_identifier, _identifier),
+        re.IGNORECASE,
+    )
+
+    _join_conditions = re.compile(
+        r"=\s*%s\.%s" % (_identifier, _identifier), re.IGNORECASE
+    )
+
+    _end_of_conditions = re.compile(
+        r"\b(?:group\s+by|order\s+by|having|limit|offset|union)\b", re.IGNORECASE
+    )
+
+    def __init__(self, connection, min_rows=1000):
+        """
+        :param connection: The connection to analyze queries against
+        :type connection: orator.connections.Connection
+
+        :param min_rows: The number of rows above which a table is considered large
+        :type min_rows: int
+        """
+        self._connection = connection
+        self._min_rows = min_rows
+        self._queries = OrderedDict()
+        self._table_rows = {}
+
+    @contextmanager
+    def watch(self):
+        """
+        Record the select queries run against the connection
+        while in the context.
+        """
+        listener = lambda query, bindings, time_: self.add(query, bindings)
+
+        self._connection.listen(listener)
+
+        try:
+            yield self
+        finally:
+            self._connection.remove_listener(listener)
+
+    def add(self, sql, bindings=None):
+        """
+        Add a query to the advisor.
+
+        Identical queries are only explained once.
+
+        :param sql: The query
+        :type sql: str
+
+        :param bindings: The query bindings
+        :type bindings: list
+
+        :rtype: IndexAdvisor
+        """
+        if not sql.lstrip().lower().startswith("select"):
+            return self
+
+        if sql in self._queries:
+            self._queries[sql][1] += 1
+        else:
+            self._queries[sql] = [list(bindings or []), 1]
+
+        return self
+
+    def plans(self):
+        """
+        Explain the recorded queries.
+
+        :return: A list of (plan, occurrences) tuples
+        :rtype: list
+        """
+        grammar = self._connection.get_query_grammar()
+        processor = self._connection.get_post_processor()
+
+        plans = []
+        for sql, (bindings, occurrences) in self._queries.items():
+            results = self._connection.select(grammar.compile_explain(sql), bindings)
+
+            plans.append(
+                (processor.process_explain(None, sql, bindings, results), occurrences)
+            )
+
+        return plans
+
+    def full_scans(self):
+        """
+        Get the full scans on large tables performed by the recorded queries.
+
+        :return: A list of (plan, node, rows) tuples
+        :rtype: list
+        """
+        scans = []
+        for plan, _ in self.plans():
+            for node in plan.full_scans():
+                if not node.table:
+                    continue
+
+                rows = self._get_table_rows(node.table)
+                if rows >= self._min_rows:
+                    scans.append((plan, node, rows))
+
+        return scans
+
+    def suggestions(self):
+        """
+        Get the indexes that would avoid the full scans on large tables,
+        the most beneficial first.
+
+        :rtype: list
+        """
+        suggestions = OrderedDict()
+        occurrences = dict((sql, o) for sql, (_, o) in self._queries.items())
+
+        for plan, node, rows in self.full_scans():
+            table = self._unprefix(node.table)
+            columns = self._get_filtered_columns(plan.sql, node.table)
+
+            if not columns:
+                continue
+
+            key = (table, tuple(columns))
+            if key not in suggestions:
+                suggestions[key] = IndexSuggestion(table, columns)
+
+            suggestion = suggestions[key]
+            suggestion.rows = max(suggestion.rows, rows)
+            suggestion.occurrences += occurrences.get(plan.sql, 1)
+            if plan.sql not in suggestion.queries:
+                suggestion.queries.append(plan.sql)
+
+        return sorted(suggestions.values(), key=lambda s: s.weight, reverse=True)
+
+    def _get_table_rows(self, table):
+        if table not in self._table_rows:
+            self._table_rows[table] = self._connection.table(
+                self._unprefix(table)
+            ).count()
+
+        return self._table_rows[table]
+
+    def _get_filtered_columns(self, sql, table):
+        """
+        Extract the columns of a table used in the conditions of a query,
+        equality conditions first.
+
+        :rtype: list
+        """
+        aliases = set([table])
+        tables = set()
+        for name, alias in self._tables.findall(sql):
+            tables.add(name)
+            if name == table and alias:
+                aliases.add(alias)
+
+        match = re.search(r"\b(?:where|on)\b", sql, re.IGNORECASE)
+        if not match:
+            return []
+
+        conditions = sql[match.start() :]
+        end = self._end_of_conditions.search(conditions)
+        if end:
+            conditions = conditions[: end.start()]
+
+        equalities = []
+        others = []
+
+        for qualifier, column, operator in self._conditions.findall(conditions):
+            if not self._belongs_to(qualifier, aliases, tables):
+                continue
+
+            if operator.lower() in ["=", "in", "is"]:
+                equalities.append(column)
+            else:
+                others.append(column)
+
+        for qualifier, column in self._join_conditions.findall(conditions):
+            if qualifier in aliases:
+                equalities.append(column)
+
+        columns = []
+        for column in equalities + others:
+            if not column.isdigit() and column not in columns:
+                columns.append(column)
+
+        return columns
+
+    def _belongs_to(self, qualifier, aliases, tables):
+        if qualifier:
+            return qualifier in aliases
+
+        # Unqualified columns can only be attributed
+        # when a single table is involved.
+        return len(tables) <= 1
+
+    def _unprefix(self, table):
+        prefix = self._connection.get_table_prefix()
+
+        if prefix and table.startswith(prefix):
+            return table[len(prefix) :]
+
+        return table
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+
+import os
+import traceback
+from functools import wraps
+from collections import OrderedDict
+
+from ..exceptions.query import QueryBudgetExceeded
+
+# Frames of the library are skipped when resolving the call site of a query
+_ORATOR_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+
+class RecordedQuery(object):
+    """
+    A query run while a QueryBudget was active.
+    """
+
+    def __init__(self, connection, sql, bindings, time_, site):
+        """
+        :param connection: The name of the connection
+        :type connection: str
+
+        :param sql: The SQL of the query
+        :type sql: str
+
+        :param bindings: The query bindings
+        :type bindings: list
+
+        :param time_: The duration of the query in milliseconds
+        :type time_: float
+
+        :param site: The call site of the query, as "file:line in function"
+        :type site: str
+        """
+        self.connection = connection
+        self.sql = sql
+        self.bindings = bindings
+        self.time = time_
+        self.site = site
+
+    def __repr__(self):
+        return "<RecordedQuery [%s] %s (%s)>" % (
+            self.connection,
+            self.sql,
+            self.bindings,
+        )
+
+
+class QueryBudget(object):
+    """
+    Records the queries run on a set of connections
+    and checks them against a maximum number of queries and a maximum time.
+
+    It can be used as a context manager, or as a decorator,
+    and raises QueryBudgetExceeded with a report of the queries
+    and their call sites when the budget is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_queries=None,
+        max_time_ms=None,
+        allow_duplicates=True,
+        connections=None,
+        resolver=None,
+    ):
+        """
+        :param max_queries: The maximum number of queries
+        :type max_queries: int or None
+
+        :param max_time_ms: The maximum total duration of the queries in milliseconds
+        :type max_time_ms: float or None
+
+        :param allow_duplicates: Whether running the same query with the same bindings
+                                 more than once is allowed
+        :type allow_duplicates: bool
+
+        :param connections: The connections to watch
+        :type connections: list
+
+        :param resolver: A database manager whose connections,
+                         including the ones opened inside the budget, are watched
+        :type resolver: orator.DatabaseManager
+        """
+        self.max_queries = max_queries
+        self.max_time_ms = max_time_ms
+        self.allow_duplicates = allow_duplicates
+
+        self._connections = list(connections or [])
+        self._resolver = resolver
+        self._listeners = []
+
+        self.queries = []
+
+    def watch(self, connection):
+        """
+        Record the queries run on the given connection.
+
+        :param connection: The connection
+        :type connection: orator.connections.Connection
+        """
+        name = connection.get_name()
+
+        def listener(sql, bindings, time_):
+            self.queries.append(
+                RecordedQuery(name, sql, bindings, time_ or 0, self._get_call_site())
+            )
+
+        connection.listen(listener)
+        self._listeners.append((connection, listener))
+
+    def release(self):
+        """
+        Stop recording the queries.
+        """
+        for connection, listener in self._listeners:
+            connection.remove_listener(listener)
+
+        self._listeners = []
+
+        if self._resolver is not None and self in self._resolver._query_budgets:
+            self._resolver._query_budgets.remove(self)
+
+    def __enter__(self):
+        self.queries = []
+
+        connections = self._connections
+
+        if self._resolver is not None:
+            self._resolver._query_budgets.append(self)
+            connections = list(self._resolver.get_connections().values())
+
+        for connection in connections:
+            self.watch(connection)
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+        if exc_type is None:
+            self.check()
+
+    def __call__(self, func):
+        @wraps(func)
+        def _budgeted(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+
+        return _budgeted
+
+    def count(self, connection=None):
+        """
+        Get the number of recorded queries.
+
+        :param connection: Restrict the count to a connection name
+        :type connection: str or None
+
+        :rtype: int
+        """
+        if connection is None:
+            return len(self.queries)
+
+        return len([query for query in self.queries if query.connection == connection])
+
+    def total_time(self):
+        """
+        Get the total duration of the recorded queries in milliseconds.
+
+        :rtype: float
+        """
+        return sum(query.time for query in self.queries)
+
+    def duplicates(self):
+        """
+        Get the queries run more than once with the same bindings.
+
+        :return: The lists of identical queries
+        :rtype: list
+        """
+        groups = OrderedDict()
+        for query in self.queries:
+            key = (query.connection, query.sql, repr(query.bindings))
+            groups.setdefault(key, []).append(query)
+
+        return [queries for queries in groups.values() if len(queries) > 1]
+
+    def is_exceeded(self):
+        """
+        Check whether the budget has been exceeded.
+
+        :rtype: bool
+        """
+        if self.max_queries is not None and self.count() > self.max_queries:
+            return True
+
+        if self.max_time_ms is not None and self.total_time() > self.max_time_ms:
+            return True
+
+        return not self.allow_duplicates and bool(self.duplicates())
+
+    def check(self):
+        """
+        Raise an exception if the budget has been exceeded.
+
+        :raises: QueryBudgetExceeded
+        """
+        if self.is_exceeded():
+            raise QueryBudgetExceeded(self.report())
+
+    def report(self):
+        """
+        Describe the recorded queries.
+
+        :rtype: str
+        """
+        lines = [
+            "Query budget: %d queries%s, %.2fms%s"
+            % (
+                self.count(),
+                "" if self.max_queries is None else " (max %d)" % self.max_queries,
+                self.total_time(),
+                "" if self.max_time_ms is None else " (max %sms)" % self.max_time_ms,
+            )
+        ]
+
+        connections = OrderedDict()
+        for query in self.queries:
+            connections[query.connection] = connections.get(query.connection, 0) + 1
+
+        lines.append("Queries by connection:")
+        for name, count in connections.items():
+            lines.append("  %s: %d" % (name, count))
+
+        duplicates = self.duplicates()
+        if duplicates:
+            lines.append("Duplicated queries:")
+            for queries in duplicates:
+                query = queries[0]
+                lines.append(
+                    "  %dx [%s] %s (%s)"
+                    % (len(queries), query.connection, query.sql, query.bindings)
+                )
+                for site in OrderedDict((q.site, None) for q in queries):
+                    lines.append("    %s" % site)
+
+        sites = OrderedDict()
+        for query in self.queries:
+            sites.setdefault(query.site, []).append(query)
+
+        lines.append("Call sites:")
+        for site, queries in sorted(sites.items(), key=lambda item: -len(item[1])):
+            lines.append(
+                "  %dx %.2fms %s" % (len(queries), sum(q.time for q in queries), site)
+            )
+
+        return "\n".join(lines)
+
+    def _get_call_site(self):
+        for filename, line, function, _ in reversed(traceback.extract_stack()):
+            if not os.path.abspath(filename).startswith(_ORATOR_PATH):
+                return "%s:%d in %s" % (filename, line, function)
+
+        return "<unknown>"
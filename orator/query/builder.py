@@ -2,6 +2,7 @@
 
 import re
 import copy
+import time
 import datetime
 
 from itertools import chain
@@ -12,11 +13,14 @@ from .join_clause import JoinClause
 from ..pagination import Paginator, LengthAwarePaginator
 from ..utils import basestring, Null
 from ..exceptions import ArgumentError
+from ..exceptions.query import QueryException
 from ..support import Collection
 
 
 class QueryBuilder(object):
 
+    _count_cache = {}
+
     _operators = [
         "=",
         "<",
@@ -906,6 +910,27 @@ class QueryBuilder(object):
     def for_page(self, page, per_page=15):
         return self.skip((page - 1) * per_page).take(per_page)
 
+    def for_page_after_id(self, per_page=15, last_id=None, column="id"):
+        """
+        Constrain the query to the next "page" of results after a given ID.
+
+        :param per_page: The number of results per page
+        :type per_page: int
+
+        :param last_id: The last ID of the previous page
+        :type last_id: mixed
+
+        :param column: The ID column
+        :type column: str
+
+        :return: The current QueryBuilder instance
+        :rtype: QueryBuilder
+        """
+        if last_id is not None:
+            self.where(column, ">", last_id)
+
+        return self.order_by(column, "asc").take(per_page)
+
     def union(self, query, all=False):
         """
         Add a union statement to the query
@@ -1064,7 +1089,35 @@ class QueryBuilder(object):
             self.to_sql(), self.get_bindings(), not self._use_write_connection
         )
 
-    def paginate(self, per_page=15, current_page=None, columns=None):
+    def explain(self, analyze=False):
+        """
+        Get the execution plan of the query.
+
+        :param analyze: Whether the query should actually be executed
+                        to get real timings (only supported by PostgreSQL)
+        :type analyze: bool
+
+        :return: The normalized query plan
+        :rtype: orator.query.explain.QueryPlan
+        """
+        original = self.columns
+
+        sql = self.to_sql()
+        explain = self._grammar.compile_explain(sql, analyze)
+
+        self.columns = original
+
+        bindings = self.get_bindings()
+
+        results = self._connection.select(
+            explain, bindings, not self._use_write_connection
+        )
+
+        return self._processor.process_explain(self, sql, bindings, results)
+
+    def paginate(
+        self, per_page=15, current_page=None, columns=None, total="exact", ttl=60
+    ):
         """
         Paginate the given query.
 
@@ -1077,6 +1130,12 @@ class QueryBuilder(object):
         :param columns: The columns to return
         :type columns: list
 
+        :param total: How to count the results: "exact", "estimate" or "cached"
+        :type total: str
+
+        :param ttl: The number of seconds a cached total is kept
+        :type ttl: int
+
         :return: The paginator
         :rtype: LengthAwarePaginator
         """
@@ -1085,11 +1144,13 @@ class QueryBuilder(object):
 
         page = current_page or Paginator.resolve_current_page()
 
-        total = self.get_count_for_pagination()
+        count, approximate = self.get_total_for_pagination(total, ttl)
 
         results = self.for_page(page, per_page).get(columns)
 
-        return LengthAwarePaginator(results, total, per_page, page)
+        return LengthAwarePaginator(
+            results, count, per_page, page, approximate=approximate
+        )
 
     def simple_paginate(self, per_page=15, current_page=None, columns=None):
         """
@@ -1125,6 +1186,139 @@ class QueryBuilder(object):
 
         return total
 
+    def get_total_for_pagination(self, total="exact", ttl=60):
+        """
+        Get the total number of results for pagination.
+
+        :param total: How to count the results: "exact", "estimate" or "cached"
+        :type total: str
+
+        :param ttl: The number of seconds a cached total is kept
+        :type ttl: int
+
+        :return: The total and whether it is approximate
+        :rtype: tuple
+        """
+        if total not in ["exact", "estimate", "cached"]:
+            raise ArgumentError("Invalid pagination total [%s]" % total)
+
+        if total == "exact":
+            return self.get_count_for_pagination(), False
+
+        self._backup_fields_for_count()
+
+        try:
+            if total == "estimate":
+                estimate = self.estimate_count()
+
+                if estimate is not None:
+                    return estimate, True
+
+                return self.count(), False
+
+            return self._get_cached_count(ttl)
+        finally:
+            self._restore_fields_for_count()
+
+    def estimate_count(self):
+        """
+        Estimate the number of results of the query from the database statistics.
+
+        Queries without conditions use the estimated number of rows of the table,
+        other queries the planner estimates when the database provides them.
+
+        :return: The estimated count or None if no estimate is available
+        :rtype: int or None
+        """
+        if self._is_filtered():
+            if not self._grammar.supports_explain_row_estimates():
+                return None
+
+            plan = self.explain()
+            if plan.root is None or plan.root.rows is None:
+                return None
+
+            return int(plan.root.rows)
+
+        return self._estimate_table_count(self._connection)
+
+    def _is_filtered(self):
+        """
+        Determine whether the query returns less rows than its table.
+
+        :rtype: bool
+        """
+        filtered = (
+            self.wheres
+            or self.joins
+            or self.groups
+            or self.havings
+            or self.unions
+            or self.distinct_
+        )
+
+        return bool(filtered) or not isinstance(self.from__, basestring)
+
+    def _estimate_table_count(self, connection):
+        """
+        Get the estimated number of rows of the table of the query.
+
+        :param connection: The connection holding the table
+        :type connection: orator.connections.Connection
+
+        :rtype: int or None
+        """
+        sql = self._grammar.compile_table_row_estimate()
+        if sql is None:
+            return None
+
+        table = self._grammar.get_table_prefix() + self.from__
+
+        try:
+            results = connection.select(sql, [table])
+        except QueryException:
+            # The statistics are not available, like SQLite tables
+            # that have not been analyzed.
+            return None
+
+        return self._processor.process_table_row_estimate(self, results)
+
+    def _get_cached_count(self, ttl):
+        """
+        Count the results of the query, reusing the count
+        of an identical query made less than ttl seconds ago.
+
+        :return: The count and whether it comes from the cache
+        :rtype: tuple
+        """
+        key = self._get_count_cache_key()
+        now = time.time()
+
+        cached = self._count_cache.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0], True
+
+        count = self.count()
+
+        # Expired counts are only pruned when a new count is cached.
+        # The cache is shared by the threads, which may prune the same keys.
+        for k in [k for k, v in list(self._count_cache.items()) if v[1] <= now]:
+            self._count_cache.pop(k, None)
+
+        self._count_cache[key] = (count, now + ttl)
+
+        return count, False
+
+    def _get_count_cache_key(self):
+        return (self._connection.get_name(), self.to_sql(), repr(self.get_bindings()))
+
+    @classmethod
+    def flush_count_cache(cls):
+        """
+        Forget the counts cached for pagination.
+        """
+        cls._count_cache.clear()
+
     def _backup_fields_for_count(self):
         for field, binding in [("orders", "order"), ("limit", None), ("offset", None)]:
             self._backups[field] = {}
@@ -1158,6 +1352,56 @@ class QueryBuilder(object):
         ):
             yield chunk
 
+    def chunk_by_id(self, count, column="id", min_id=None, max_id=None):
+        """
+        Chunk the results of the query using ranges of IDs.
+
+        Each chunk is fetched by an independent query starting after
+        the last ID of the previous chunk, which can use the index of the column.
+        The existing orders of the query are ignored.
+
+        :param count: The chunk size
+        :type count: int
+
+        :param column: The ID column
+        :type column: str
+
+        :param min_id: The lowest ID to retrieve
+        :type min_id: mixed
+
+        :param max_id: The highest ID to retrieve
+        :type max_id: mixed
+
+        :return: The current chunk
+        :rtype: Collection
+        """
+        # Results are keyed by the unqualified column name
+        key = column.split(".")[-1]
+
+        last_id = None
+        while True:
+            query = copy.copy(self)
+            query.orders = []
+            query.set_bindings([], "order")
+
+            if min_id is not None:
+                query.where(column, ">=", min_id)
+
+            if max_id is not None:
+                query.where(column, "<=", max_id)
+
+            results = query.for_page_after_id(count, last_id, column).get()
+
+            if not results:
+                break
+
+            yield results
+
+            if len(results) < count:
+                break
+
+            last_id = results[-1][key]
+
     def lists(self, column, key=None):
         """
         Get a list with the values of a given column
@@ -1410,6 +1654,21 @@ class QueryBuilder(object):
             for i, value in enumerate(values):
                 values[i] = OrderedDict(sorted(value.items()))
 
+        # Large inputs are split in statements within the parameters limit
+        size = max(1, self._grammar.get_max_parameters() // len(values[0]))
+
+        if len(values) > size:
+            with self._connection.transaction():
+                for start in range(0, len(values), size):
+                    self._upsert(
+                        values[start : start + size], conflict_keys, conflict_columns
+                    )
+
+            return True
+
+        return self._upsert(values, conflict_keys, conflict_columns)
+
+    def _upsert(self, values, conflict_keys, conflict_columns):
         bindings = []
 
         for record in values:
@@ -1443,6 +1702,18 @@ class QueryBuilder(object):
 
         values = self._clean_bindings(values.values())
 
+        pipeline = self._connection.get_pipeline()
+
+        if pipeline is not None:
+            return pipeline.queue(
+                lambda: self._processor.process_insert_get_id(
+                    self, sql, values, sequence
+                ),
+                "insert_get_id",
+                sql,
+                values,
+            )
+
         return self._processor.process_insert_get_id(self, sql, values, sequence)
 
     def update(self, _values=None, **values):
@@ -1492,6 +1763,40 @@ class QueryBuilder(object):
 
         return self.update(**columns)
 
+    def increment_many(self, column, amounts, key="id"):
+        """
+        Increment a column by a different amount for each key
+        with a single statement.
+
+        :param column: The column to increment
+        :type column: str
+
+        :param amounts: The amounts by key
+        :type amounts: dict
+
+        :param key: The key column
+        :type key: str
+
+        :return: The number of rows affected
+        :rtype: int
+        """
+        amounts = list(amounts.items())
+
+        if not amounts:
+            return 0
+
+        self.where_in(key, [k for k, _ in amounts])
+
+        sql = self._grammar.compile_increment_many(self, column, key, amounts)
+
+        bindings = []
+        for k, amount in amounts:
+            bindings += [k, amount]
+
+        bindings += self.get_bindings()
+
+        return self._connection.update(sql, self._clean_bindings(bindings))
+
     def decrement(self, column, amount=1, extras=None):
         """
         Decrement a column's value by a given amount
@@ -1593,10 +1898,12 @@ class QueryBuilder(object):
         return self._connection.raw(value)
 
     def get_bindings(self):
+        prepare_date = self._grammar.prepare_date
+
         bindings = []
         for value in chain(*self._bindings.values()):
             if isinstance(value, datetime.date):
-                value = value.strftime(self._grammar.get_date_format())
+                value = prepare_date(value)
 
             bindings.append(value)
 
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+import time
+import atexit
+import logging
+import weakref
+import threading
+from collections import OrderedDict
+
+
+logger = logging.getLogger("orator.connection.counters")
+
+_buffers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    for buffer in list(_buffers):
+        try:
+            buffer.flush()
+        except Exception as e:
+            logger.error("Unable to flush the %s counters: %s" % (buffer, e))
+
+
+class CounterFlush(object):
+    """
+    The metrics of a flush of a CounterBuffer.
+    """
+
+    def __init__(self, table, column, keys, increments, affected, time_):
+        """
+        :param table: The table
+        :type table: str
+
+        :param column: The counter column
+        :type column: str
+
+        :param keys: The number of keys updated
+        :type keys: int
+
+        :param increments: The number of increments aggregated
+        :type increments: int
+
+        :param affected: The number of rows affected
+        :type affected: int
+
+        :param time_: The duration of the flush in milliseconds
+        :type time_: float
+        """
+        self.table = table
+        self.column = column
+        self.keys = keys
+        self.increments = increments
+        self.affected = affected
+        self.time = time_
+
+    def __repr__(self):
+        return (
+            "<CounterFlush %s.%s keys=%d increments=%d affected=%d time=%.2fms>"
+            % (
+                self.table,
+                self.column,
+                self.keys,
+                self.increments,
+                self.affected,
+                self.time,
+            )
+        )
+
+
+class CounterBuffer(object):
+    """
+    Aggregates the increments of a counter column in memory
+    and writes them with a single statement per flush.
+
+    The buffer is flushed when it holds increments for max_keys keys,
+    on the first increment after interval seconds since the last flush,
+    when the connection is disconnected and when the program exits.
+    """
+
+    chunk_size = 500
+
+    def __init__(
+        self, connection, table, column, key="id", interval=1.0, max_keys=1000
+    ):
+        """
+        :param connection: The connection
+        :type connection: orator.connections.Connection
+
+        :param table: The table
+        :type table: str
+
+        :param column: The counter column
+        :type column: str
+
+        :param key: The key column
+        :type key: str
+
+        :param interval: The maximum delay, in seconds, between two flushes
+        :type interval: float or None
+
+        :param max_keys: The number of keys above which the buffer is flushed
+        :type max_keys: int or None
+        """
+        self._connection = connection
+        self._table = table
+        self._column = column
+        self._key = key
+        self._interval = interval
+        self._max_keys = max_keys
+
+        self._pending = OrderedDict()
+        self._increments = 0
+        self._last_flush = time.time()
+        self._lock = threading.RLock()
+        self._listeners = []
+
+        _buffers.add(self)
+
+    def increment(self, key, amount=1):
+        """
+        Increment the counter of a key.
+
+        :param key: The key of the row
+        :type key: mixed
+
+        :param amount: The amount by which to increment
+        :type amount: int
+
+        :return: The flush metrics if the increment triggered a flush
+        :rtype: CounterFlush or None
+        """
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + amount
+            self._increments += 1
+
+            if self._is_due():
+                return self.flush()
+
+    def decrement(self, key, amount=1):
+        """
+        Decrement the counter of a key.
+
+        :param key: The key of the row
+        :type key: mixed
+
+        :param amount: The amount by which to decrement
+        :type amount: int
+
+        :rtype: CounterFlush or None
+        """
+        return self.increment(key, -amount)
+
+    def _is_due(self):
+        if self._max_keys is not None and len(self._pending) >= self._max_keys:
+            return True
+
+        if self._interval is not None:
+            return time.time() - self._last_flush >= self._interval
+
+        return False
+
+    def pending(self):
+        """
+        Get the increments not yet written.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._pending)
+
+    def flush(self):
+        """
+        Write the pending increments.
+
+        :return: The flush metrics or None if there was nothing to write
+        :rtype: CounterFlush or None
+        """
+        with self._lock:
+            pending = [(k, v) for k, v in self._pending.items() if v]
+            increments = self._increments
+
+            self._pending = OrderedDict()
+            self._increments = 0
+            self._last_flush = time.time()
+
+            if not pending:
+                return
+
+            start = time.time()
+            affected = 0
+
+            for i in range(0, len(pending), self.chunk_size):
+                chunk = pending[i : i + self.chunk_size]
+
+                try:
+                    affected += self._connection.table(self._table).increment_many(
+                        self._column, OrderedDict(chunk), self._key
+                    )
+                except Exception:
+                    # The increments not written are kept for the next flush
+                    for k, v in pending[i:]:
+                        self._pending[k] = self._pending.get(k, 0) + v
+
+                    self._increments += increments
+
+                    raise
+
+            flush = CounterFlush(
+                self._table,
+                self._column,
+                len(pending),
+                increments,
+                affected,
+                round((time.time() - start) * 1000, 2),
+            )
+
+        logger.debug(repr(flush))
+
+        for listener in self._listeners:
+            listener(flush)
+
+        return flush
+
+    def listen(self, callback):
+        """
+        Register a callback receiving the metrics of each flush.
+
+        :param callback: The callback
+        :type callback: callable
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """
+        Remove a flush listener.
+
+        :param callback: The callback
+        :type callback: callable
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def close(self):
+        """
+        Flush the pending increments and stop tracking the buffer.
+
+        :rtype: CounterFlush or None
+        """
+        try:
+            return self.flush()
+        finally:
+            _buffers.discard(self)
+
+    def __repr__(self):
+        return "<CounterBuffer %s.%s>" % (self._table, self._column)
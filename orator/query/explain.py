@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+
+class PlanNode(object):
+    """
+    A single, database agnostic, step of a query plan.
+    """
+
+    FULL_SCAN = "full"
+    INDEX_SCAN = "index"
+    COVERING_INDEX_SCAN = "covering"
+    OTHER = "other"
+
+    def __init__(
+        self,
+        operation,
+        table=None,
+        index=None,
+        scan_type=OTHER,
+        rows=None,
+        cost=None,
+        actual_rows=None,
+        actual_time=None,
+        detail=None,
+        children=None,
+        raw=None,
+    ):
+        """
+        :param operation: The operation as reported by the database
+        :type operation: str
+
+        :param table: The table accessed by the operation, if any
+        :type table: str or None
+
+        :param index: The index used by the operation, if any
+        :type index: str or None
+
+        :param scan_type: The normalized scan type
+        :type scan_type: str
+
+        :param rows: The estimated number of rows
+        :type rows: int or None
+
+        :param cost: The estimated cost of the operation
+        :type cost: float or None
+
+        :param actual_rows: The actual number of rows (only when analyzing)
+        :type actual_rows: int or None
+
+        :param actual_time: The actual time in ms (only when analyzing)
+        :type actual_time: float or None
+
+        :param detail: Additional information, like the filter condition
+        :type detail: str or None
+
+        :param children: The child nodes
+        :type children: list
+
+        :param raw: The raw plan data
+        :type raw: mixed
+        """
+        self.operation = operation
+        self.table = table
+        self.index = index
+        self.scan_type = scan_type
+        self.rows = rows
+        self.cost = cost
+        self.actual_rows = actual_rows
+        self.actual_time = actual_time
+        self.detail = detail
+        self.children = children or []
+        self.raw = raw
+
+    def is_full_scan(self):
+        return self.scan_type == self.FULL_SCAN
+
+    def walk(self):
+        """
+        Iterate over the node and all its descendants, depth first.
+
+        :rtype: generator
+        """
+        yield self
+
+        for child in self.children:
+            for node in child.walk():
+                yield node
+
+    def serialize(self):
+        return {
+            "operation": self.operation,
+            "table": self.table,
+            "index": self.index,
+            "scan_type": self.scan_type,
+            "rows": self.rows,
+            "cost": self.cost,
+            "actual_rows": self.actual_rows,
+            "actual_time": self.actual_time,
+            "detail": self.detail,
+            "children": [child.serialize() for child in self.children],
+        }
+
+    def __repr__(self):
+        return "<PlanNode %s table=%r index=%r scan_type=%r>" % (
+            self.operation,
+            self.table,
+            self.index,
+            self.scan_type,
+        )
+
+
+class QueryPlan(object):
+    """
+    The normalized plan of a query as returned by QueryBuilder.explain().
+    """
+
+    def __init__(self, sql, bindings, nodes, raw=None):
+        """
+        :param sql: The explained SQL query
+        :type sql: str
+
+        :param bindings: The query bindings
+        :type bindings: list
+
+        :param nodes: The top level plan nodes
+        :type nodes: list
+
+        :param raw: The raw EXPLAIN results
+        :type raw: mixed
+        """
+        self.sql = sql
+        self.bindings = bindings
+        self.nodes = nodes
+        self.raw = raw
+
+    @property
+    def root(self):
+        if self.nodes:
+            return self.nodes[0]
+
+    @property
+    def cost(self):
+        """
+        The estimated total cost of the query, if reported by the database.
+
+        :rtype: float or None
+        """
+        if self.root:
+            return self.root.cost
+
+    def walk(self):
+        for node in self.nodes:
+            for n in node.walk():
+                yield n
+
+    def tables(self):
+        """
+        Get the tables accessed by the query.
+
+        :rtype: list
+        """
+        tables = []
+        for node in self.walk():
+            if node.table and node.table not in tables:
+                tables.append(node.table)
+
+        return tables
+
+    def full_scans(self):
+        """
+        Get the nodes performing a full table scan.
+
+        :rtype: list
+        """
+        return [node for node in self.walk() if node.is_full_scan()]
+
+    def uses_index(self, index=None):
+        for node in self.walk():
+            if node.scan_type in [PlanNode.INDEX_SCAN, PlanNode.COVERING_INDEX_SCAN]:
+                if index is None or node.index == index:
+                    return True
+
+        return False
+
+    def serialize(self):
+        return {
+            "sql": self.sql,
+            "bindings": self.bindings,
+            "nodes": [node.serialize() for node in self.nodes],
+        }
+
+    def __iter__(self):
+        return self.walk()
+
+    def __repr__(self):
+        return "<QueryPlan %s>" % self.sql
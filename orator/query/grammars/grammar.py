@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import re
+import datetime
 from ...support.grammar import Grammar
 from ..builder import QueryBuilder
 from ...utils import basestring
@@ -23,6 +24,62 @@ class QueryGrammar(Grammar):
         "lock_",
     ]
 
+    # The maximum number of parameters of a statement
+    max_parameters = 65535
+
+    # The maximum number of rows of a multi-row insert, if limited
+    max_insert_rows = None
+
+    # Whether dates are sent to the driver as native objects
+    _native_dates = False
+
+    def set_native_dates(self, native_dates):
+        """
+        Set whether dates are sent to the driver as native objects
+        rather than as formatted strings.
+
+        :param native_dates: Whether to use native dates
+        :type native_dates: bool
+        """
+        self._native_dates = bool(native_dates)
+
+    def uses_native_dates(self):
+        return self._native_dates
+
+    def prepare_date(self, value):
+        """
+        Convert a date to the value sent to the driver.
+
+        :param value: The date
+        :type value: datetime.date or datetime.datetime
+
+        :rtype: str or datetime.date or datetime.datetime
+        """
+        if not self._native_dates:
+            return value.strftime(self.get_date_format())
+
+        if isinstance(value, datetime.datetime):
+            if type(value) is datetime.datetime and value.tzinfo is None:
+                return value
+
+            # Like formatted dates, native ones keep the wall time.
+            # Subclasses, like pendulum instances, are converted
+            # since drivers look up their adapters by exact type.
+            return datetime.datetime(
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+                value.microsecond,
+            )
+
+        if type(value) is datetime.date:
+            return value
+
+        return datetime.date(value.year, value.month, value.day)
+
     def compile_select(self, query):
         if not query.columns:
             query.columns = ["*"]
@@ -378,39 +435,57 @@ class QueryGrammar(Grammar):
         :return: The compiled statement
         :rtype: str
         """
-        # Essentially we will force every insert to be treated as a batch insert which
-        # simply makes creating the SQL easier for us since we can utilize the same
-        # basic routine regardless of an amount of records given to us to insert.
-        table = self.wrap_table(query.from__)
-
-        if not isinstance(values, list):
-            values = [values]
+        # Upserts are always compiled as multi-row VALUES inserts,
+        # even by the grammars inserting multiple rows differently.
+        sql = QueryGrammar.compile_insert(self, query, values)
 
-        columns = self.columnize(values[0].keys())
+        return "%s %s" % (
+            sql,
+            self._compile_upsert_conflict(conflict_keys, conflict_columns),
+        )
 
-        # We need to build a list of parameter place-holders of values that are bound
-        # to the query. Each insert should have the exact same amount of parameter
-        # bindings so we can just go off the first list of values in this array.
-        parameters = self.parameterize(values[0].values())
+    def _compile_upsert_conflict(self, conflict_keys, conflict_columns):
+        """
+        Compile the conflict clause of an upsert statement.
 
-        value = ["(%s)" % parameters] * len(values)
+        :rtype: str
+        """
+        conflict = "ON CONFLICT (%s)" % self.columnize(conflict_keys)
 
-        parameters = ", ".join(value)
+        if not conflict_columns:
+            return "%s DO NOTHING" % conflict
 
-        conflict_key_join = ", ".join(conflict_keys)
-        conflict_update_statements = [
-            "%s = EXCLUDED.%s" % (col, col) for col in conflict_columns
-        ]
-        conflict_update_join = ", ".join(conflict_update_statements)
-
-        return "INSERT INTO %s (%s) VALUES %s ON CONFLICT (%s) DO UPDATE SET %s" % (
-            table,
-            columns,
-            parameters,
-            conflict_key_join,
-            conflict_update_join,
+        updates = ", ".join(
+            "%s = EXCLUDED.%s" % (self.wrap(column), self.wrap(column))
+            for column in conflict_columns
         )
 
+        return "%s DO UPDATE SET %s" % (conflict, updates)
+
+    def get_max_parameters(self):
+        """
+        Get the maximum number of parameters of a statement.
+
+        :rtype: int
+        """
+        return self.max_parameters
+
+    def get_max_insert_rows(self, columns):
+        """
+        Get the maximum number of rows of a single insert statement.
+
+        :param columns: The number of columns of the rows
+        :type columns: int
+
+        :rtype: int
+        """
+        size = max(1, self.get_max_parameters() // max(1, columns))
+
+        if self.max_insert_rows is not None:
+            size = min(size, self.max_insert_rows)
+
+        return size
+
     def compile_insert_get_id(self, query, values, sequence):
         return self.compile_insert(query, values)
 
@@ -442,6 +517,43 @@ class QueryGrammar(Grammar):
 
         return ("UPDATE %s%s SET %s %s" % (table, joins, columns, where)).strip()
 
+    def compile_increment_many(self, query, column, key, amounts):
+        """
+        Compile an update statement incrementing a column
+        by a different amount for each key.
+
+        The bindings of the statement are the (key, amount) pairs,
+        followed by the bindings of the query.
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param column: The column to increment
+        :type column: str
+
+        :param key: The key column
+        :type key: str
+
+        :param amounts: The (key, amount) pairs
+        :type amounts: list
+
+        :rtype: str
+        """
+        table = self.wrap_table(query.from__)
+        column = self.wrap(column)
+
+        cases = " ".join(
+            "WHEN %s THEN %s" % (self.get_marker(), self.get_marker())
+            for _ in amounts
+        )
+
+        where = self._compile_wheres(query)
+
+        return (
+            "UPDATE %s SET %s = %s + CASE %s %s END %s"
+            % (table, column, column, self.wrap(key), cases, where)
+        ).strip()
+
     def compile_delete(self, query):
         table = self.wrap_table(query.from__)
 
@@ -455,6 +567,83 @@ class QueryGrammar(Grammar):
     def compile_truncate(self, query):
         return {"TRUNCATE %s" % self.wrap_table(query.from__): []}
 
+    def compile_explain(self, sql, analyze=False):
+        """
+        Compile an explain statement into SQL
+
+        :param sql: The select query to explain
+        :type sql: str
+
+        :param analyze: Whether the query should actually be executed
+        :type analyze: bool
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        return "EXPLAIN %s" % sql
+
+    def compile_table_row_estimate(self):
+        """
+        Compile the query reading the estimated number of rows of a table
+        from the database statistics.
+
+        The query takes the table name as its only binding.
+
+        :return: The compiled query or None if not supported
+        :rtype: str or None
+        """
+        return None
+
+    def supports_explain_row_estimates(self):
+        """
+        Determine if the plans returned by explain()
+        estimate the number of rows returned by a query.
+
+        :rtype: bool
+        """
+        return False
+
+    def supports_savepoints(self):
+        """
+        Determine if the grammar supports savepoints.
+
+        :rtype: bool
+        """
+        return True
+
+    def compile_savepoint(self, name):
+        """
+        Compile the SQL statement to define a savepoint.
+
+        :param name: The name of the savepoint
+        :type name: str
+
+        :rtype: str
+        """
+        return "SAVEPOINT %s" % name
+
+    def compile_savepoint_release(self, name):
+        """
+        Compile the SQL statement to release a savepoint.
+
+        :param name: The name of the savepoint
+        :type name: str
+
+        :rtype: str
+        """
+        return "RELEASE SAVEPOINT %s" % name
+
+    def compile_savepoint_rollback(self, name):
+        """
+        Compile the SQL statement to rollback to a savepoint.
+
+        :param name: The name of the savepoint
+        :type name: str
+
+        :rtype: str
+        """
+        return "ROLLBACK TO SAVEPOINT %s" % name
+
     def _compile_lock(self, query, value):
         if isinstance(value, basestring):
             return value
@@ -56,6 +56,36 @@ class MySQLQueryGrammar(QueryGrammar):
 
         return "%s(%s)" % (joiner, union["query"].to_sql())
 
+    def compile_explain(self, sql, analyze=False):
+        """
+        Compile an explain statement into SQL
+
+        MySQL does not support analyzing a query with a JSON output
+        so the flag is ignored.
+
+        :param sql: The select query to explain
+        :type sql: str
+
+        :param analyze: Whether the query should actually be executed
+        :type analyze: bool
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        return "EXPLAIN FORMAT=JSON %s" % sql
+
+    def compile_table_row_estimate(self):
+        """
+        Compile the query reading the estimated number of rows of a table
+        from the database statistics.
+
+        :rtype: str
+        """
+        return (
+            "SELECT TABLE_ROWS AS estimate FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s" % self.get_marker()
+        )
+
     def _compile_lock(self, query, value):
         """
         Compile the lock into SQL
@@ -77,55 +107,27 @@ class MySQLQueryGrammar(QueryGrammar):
         elif value is False:
             return "LOCK IN SHARE MODE"
 
-    def compile_upsert(self, query, values, conflict_keys, conflict_columns):
+    def _compile_upsert_conflict(self, conflict_keys, conflict_columns):
         """
-        Compile an upsert SQL statement
-
-        :param query: A QueryBuilder instance
-        :type query: QueryBuilder
+        Compile the conflict clause of an upsert statement.
 
-        :param values: The values to insert
-        :type values: dict or list
+        MySQL detects the conflicts on every unique index of the table.
 
-        :param conflict_keys: The list of keys
-
-        :param conflict_columns: The columns to update on conflict
-        :type  conflict_columns: list
-
-        :return: The compiled statement
         :rtype: str
         """
-        # Essentially we will force every insert to be treated as a batch insert which
-        # simply makes creating the SQL easier for us since we can utilize the same
-        # basic routine regardless of an amount of records given to us to insert.
-        table = self.wrap_table(query.from__)
-
-        if not isinstance(values, list):
-            values = [values]
-
-        columns = self.columnize(values[0].keys())
+        if not conflict_columns:
+            # Updating a key with its own value leaves the conflicting row unchanged
+            key = self.wrap(conflict_keys[0])
 
-        # We need to build a list of parameter place-holders of values that are bound
-        # to the query. Each insert should have the exact same amount of parameter
-        # bindings so we can just go off the first list of values in this array.
-        parameters = self.parameterize(values[0].values())
+            return "ON DUPLICATE KEY UPDATE %s = %s" % (key, key)
 
-        value = ["(%s)" % parameters] * len(values)
-
-        parameters = ", ".join(value)
-        return columns, parameters
-        conflict_update_statements = [
-            "%s = %s" % (col ) for col in conflict_columns
-        ]
-        conflict_update_join = ", ".join(conflict_update_statements)
-
-        return "INSERT INTO %s (%s) VALUES %s ON DUPLICATE KEY UPDATE %s" % (
-            table,
-            columns,
-            parameters,
-            conflict_update_join
+        updates = ", ".join(
+            "%s = VALUES(%s)" % (self.wrap(column), self.wrap(column))
+            for column in conflict_columns
         )
 
+        return "ON DUPLICATE KEY UPDATE %s" % updates
+
     def compile_update(self, query, values):
         """
         Compile an update statement into SQL
@@ -48,6 +48,40 @@ class PostgresQueryGrammar(QueryGrammar):
 
         return "FOR SHARE"
 
+    def compile_table_row_estimate(self):
+        """
+        Compile the query reading the estimated number of rows of a table
+        from the database statistics.
+
+        :rtype: str
+        """
+        return (
+            "SELECT reltuples::bigint AS estimate FROM pg_class "
+            "WHERE oid = %s::regclass" % self.get_marker()
+        )
+
+    def supports_explain_row_estimates(self):
+        return True
+
+    def compile_explain(self, sql, analyze=False):
+        """
+        Compile an explain statement into SQL
+
+        :param sql: The select query to explain
+        :type sql: str
+
+        :param analyze: Whether the query should actually be executed
+        :type analyze: bool
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        options = "FORMAT JSON"
+        if analyze:
+            options = "ANALYZE, " + options
+
+        return "EXPLAIN (%s) %s" % (options, sql)
+
     def compile_update(self, query, values):
         """
         Compile an update statement into SQL
@@ -71,6 +105,62 @@ class PostgresQueryGrammar(QueryGrammar):
 
         return ("UPDATE %s SET %s%s %s" % (table, columns, from_, where)).strip()
 
+    def compile_increment_many(self, query, column, key, amounts):
+        """
+        Compile an update statement incrementing a column
+        by a different amount for each key.
+
+        Integer keys are joined against a VALUES list,
+        other keys fall back to a CASE expression.
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param column: The column to increment
+        :type column: str
+
+        :param key: The key column
+        :type key: str
+
+        :param amounts: The (key, amount) pairs
+        :type amounts: list
+
+        :rtype: str
+        """
+        integers = all(
+            isinstance(k, int) and not isinstance(k, bool) for k, _ in amounts
+        )
+
+        if not integers or query.joins:
+            return super(PostgresQueryGrammar, self).compile_increment_many(
+                query, column, key, amounts
+            )
+
+        table = self.wrap_table(query.from__)
+        values = ", ".join(
+            "(%s, %s)" % (self.get_marker(), self.get_marker()) for _ in amounts
+        )
+        where = self._compile_wheres(query)
+
+        sql = "UPDATE %s SET %s = %s.%s + %s FROM (VALUES %s) AS %s (%s, %s) " % (
+            table,
+            self.wrap(column),
+            table,
+            self.wrap(column),
+            self.wrap("counters.amount"),
+            values,
+            self.wrap("counters"),
+            self.wrap("key"),
+            self.wrap("amount"),
+        )
+
+        sql += "WHERE %s.%s = %s" % (table, self.wrap(key), self.wrap("counters.key"))
+
+        if where:
+            sql += " AND (%s)" % where[len("WHERE ") :]
+
+        return sql
+
     def _compile_update_columns(self, values):
         """
         Compile the columns for the update statement
@@ -2,9 +2,20 @@
 
 from .grammar import QueryGrammar
 
+try:
+    from sqlite3 import sqlite_version_info
+except ImportError:
+    sqlite_version_info = (0, 0, 0)
+
 
 class SQLiteQueryGrammar(QueryGrammar):
 
+    # SQLITE_MAX_VARIABLE_NUMBER defaults to 999 before SQLite 3.32.0
+    max_parameters = 32766 if sqlite_version_info >= (3, 32, 0) else 999
+
+    # Multi-row inserts are compound selects, limited by SQLITE_MAX_COMPOUND_SELECT
+    max_insert_rows = 500
+
     _operators = [
         "=",
         "<",
@@ -63,6 +74,34 @@ class SQLiteQueryGrammar(QueryGrammar):
             " UNION ALL SELECT ".join(columns),
         )
 
+    def compile_upsert(self, query, values, conflict_keys, conflict_columns):
+        """
+        Compile an upsert SQL statement
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param values: The values to insert
+        :type values: dict or list
+
+        :param conflict_keys: The list of keys
+
+        :param conflict_columns: The columns to update on conflict
+        :type  conflict_columns: list
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        if sqlite_version_info < (3, 24, 0):
+            raise RuntimeError(
+                "Upserts require SQLite 3.24.0 or later, %s is installed"
+                % ".".join(map(str, sqlite_version_info))
+            )
+
+        return super(SQLiteQueryGrammar, self).compile_upsert(
+            query, values, conflict_keys, conflict_columns
+        )
+
     def compile_truncate(self, query):
         """
         Compile a truncate statement into SQL
@@ -82,6 +121,34 @@ class SQLiteQueryGrammar(QueryGrammar):
 
         return sql
 
+    def compile_explain(self, sql, analyze=False):
+        """
+        Compile an explain statement into SQL
+
+        SQLite does not support analyzing a query so the flag is ignored.
+
+        :param sql: The select query to explain
+        :type sql: str
+
+        :param analyze: Whether the query should actually be executed
+        :type analyze: bool
+
+        :return: The compiled statement
+        :rtype: str
+        """
+        return "EXPLAIN QUERY PLAN %s" % sql
+
+    def compile_table_row_estimate(self):
+        """
+        Compile the query reading the estimated number of rows of a table
+        from the statistics gathered by ANALYZE.
+
+        :rtype: str
+        """
+        return "SELECT stat AS estimate FROM sqlite_stat1 WHERE tbl = %s" % (
+            self.get_marker()
+        )
+
     def _where_date(self, query, where):
         """
         Compile a "where date" clause
@@ -1,9 +1,26 @@
 # -*- coding: utf-8 -*-
 
+import simplejson as json
+
 from .processor import QueryProcessor
+from ..explain import QueryPlan, PlanNode
 
 
 class MySQLQueryProcessor(QueryProcessor):
+
+    _index_access_types = [
+        "system",
+        "const",
+        "eq_ref",
+        "ref",
+        "fulltext",
+        "ref_or_null",
+        "index_merge",
+        "unique_subquery",
+        "index_subquery",
+        "range",
+    ]
+
     def process_insert_get_id(self, query, sql, values, sequence=None):
         """
         Process an "insert get ID" query.
@@ -65,3 +82,114 @@ class MySQLQueryProcessor(QueryProcessor):
                 results,
             )
         )
+
+    def process_explain(self, query, sql, bindings, results):
+        """
+        Process the results of an "EXPLAIN FORMAT=JSON" query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param sql: The explained sql query
+        :type sql: str
+
+        :param bindings: The query bindings
+        :type bindings: list
+
+        :param results: The query results
+        :type results: list
+
+        :return: The normalized query plan
+        :rtype: QueryPlan
+        """
+        row = results[0]
+        if isinstance(row, dict):
+            plan = list(row.values())[0]
+        else:
+            plan = row[0]
+
+        if not isinstance(plan, dict):
+            plan = json.loads(plan)
+
+        nodes = self._parse_plan_block("query_block", plan["query_block"])
+
+        return QueryPlan(sql, bindings, nodes, plan)
+
+    def _parse_plan_block(self, operation, block):
+        """
+        Parse a block of a MySQL JSON plan.
+
+        Blocks are either table accesses or operations (ordering, grouping,
+        nested loops, subqueries...) wrapping other blocks.
+
+        :rtype: list
+        """
+        if isinstance(block, list):
+            nodes = []
+            for item in block:
+                nodes += self._parse_plan_block(operation, item)
+
+            return nodes
+
+        if operation == "table":
+            return [self._parse_plan_table(block)]
+
+        children = []
+        for key, value in block.items():
+            if isinstance(value, (dict, list)) and key not in [
+                "cost_info",
+                "possible_keys",
+                "used_key_parts",
+                "used_columns",
+                "ref",
+            ]:
+                children += self._parse_plan_block(key, value)
+
+        if operation in ["nested_loop", "attached_subqueries"]:
+            return children
+
+        cost = block.get("cost_info", {}).get("query_cost")
+
+        return [
+            PlanNode(
+                operation,
+                cost=float(cost) if cost is not None else None,
+                children=children,
+                raw=block,
+            )
+        ]
+
+    def _parse_plan_table(self, table):
+        access_type = table.get("access_type")
+        covering = table.get("using_index", False)
+
+        if access_type in self._index_access_types:
+            if covering:
+                scan_type = PlanNode.COVERING_INDEX_SCAN
+            else:
+                scan_type = PlanNode.INDEX_SCAN
+        elif access_type == "index" and covering:
+            scan_type = PlanNode.COVERING_INDEX_SCAN
+        elif access_type in ["ALL", "index"]:
+            scan_type = PlanNode.FULL_SCAN
+        else:
+            scan_type = PlanNode.OTHER
+
+        cost = table.get("cost_info", {}).get("prefix_cost")
+
+        children = []
+        for key in ["materialized_from_subquery", "attached_subqueries"]:
+            if key in table:
+                children += self._parse_plan_block(key, table[key])
+
+        return PlanNode(
+            access_type or "table",
+            table=table.get("table_name"),
+            index=table.get("key"),
+            scan_type=scan_type,
+            rows=table.get("rows_examined_per_scan"),
+            cost=float(cost) if cost is not None else None,
+            detail=table.get("attached_condition"),
+            children=children,
+            raw=table,
+        )
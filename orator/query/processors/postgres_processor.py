@@ -1,9 +1,21 @@
 # -*- coding: utf-8 -*-
 
+import simplejson as json
+
 from .processor import QueryProcessor
+from ..explain import QueryPlan, PlanNode
 
 
 class PostgresQueryProcessor(QueryProcessor):
+
+    _scan_types = {
+        "Seq Scan": PlanNode.FULL_SCAN,
+        "Index Scan": PlanNode.INDEX_SCAN,
+        "Bitmap Index Scan": PlanNode.INDEX_SCAN,
+        "Bitmap Heap Scan": PlanNode.INDEX_SCAN,
+        "Index Only Scan": PlanNode.COVERING_INDEX_SCAN,
+    }
+
     def process_insert_get_id(self, query, sql, values, sequence=None):
         """
         Process an "insert get ID" query.
@@ -46,3 +58,48 @@ class PostgresQueryProcessor(QueryProcessor):
         :return: list
         """
         return list(map(lambda x: x["column_name"], results))
+
+    def process_explain(self, query, sql, bindings, results):
+        """
+        Process the results of an "EXPLAIN (FORMAT JSON)" query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param sql: The explained sql query
+        :type sql: str
+
+        :param bindings: The query bindings
+        :type bindings: list
+
+        :param results: The query results
+        :type results: list
+
+        :return: The normalized query plan
+        :rtype: QueryPlan
+        """
+        plans = results[0][0]
+        if not isinstance(plans, (list, dict)):
+            plans = json.loads(plans)
+
+        if isinstance(plans, dict):
+            plans = [plans]
+
+        nodes = [self._parse_plan_node(plan["Plan"]) for plan in plans]
+
+        return QueryPlan(sql, bindings, nodes, plans)
+
+    def _parse_plan_node(self, plan):
+        return PlanNode(
+            plan["Node Type"],
+            table=plan.get("Relation Name"),
+            index=plan.get("Index Name"),
+            scan_type=self._scan_types.get(plan["Node Type"], PlanNode.OTHER),
+            rows=plan.get("Plan Rows"),
+            cost=plan.get("Total Cost"),
+            actual_rows=plan.get("Actual Rows"),
+            actual_time=plan.get("Actual Total Time"),
+            detail=plan.get("Filter") or plan.get("Index Cond"),
+            children=[self._parse_plan_node(p) for p in plan.get("Plans", [])],
+            raw=plan,
+        )
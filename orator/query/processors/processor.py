@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from ..explain import QueryPlan, PlanNode
+
 
 class QueryProcessor(object):
     def process_select(self, query, results):
@@ -59,3 +61,57 @@ class QueryProcessor(object):
         :return: dict
         """
         return results
+
+    def process_table_row_estimate(self, query, results):
+        """
+        Process the results of an estimated table rows query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param results: The query results
+        :type results: list
+
+        :return: The estimated number of rows or None if unknown
+        :rtype: int or None
+        """
+        if not results:
+            return None
+
+        estimate = results[0]["estimate"]
+
+        # Tables that have never been analyzed have no (or negative) estimates
+        if estimate is None or int(estimate) <= 0:
+            return None
+
+        return int(estimate)
+
+    def process_explain(self, query, sql, bindings, results):
+        """
+        Process the results of an "explain" query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param sql: The explained sql query
+        :type sql: str
+
+        :param bindings: The query bindings
+        :type bindings: list
+
+        :param results: The query results
+        :type results: list
+
+        :return: The normalized query plan
+        :rtype: QueryPlan
+        """
+        nodes = []
+        for row in results:
+            if isinstance(row, dict):
+                operation = " ".join(str(v) for v in row.values() if v is not None)
+            else:
+                operation = " ".join(str(v) for v in row if v is not None)
+
+            nodes.append(PlanNode(operation, raw=row))
+
+        return QueryPlan(sql, bindings, nodes, results)
@@ -1,9 +1,21 @@
 # -*- coding: utf-8 -*-
 
+import re
+
 from .processor import QueryProcessor
+from ..explain import QueryPlan, PlanNode
 
 
 class SQLiteQueryProcessor(QueryProcessor):
+
+    _plan_detail = re.compile(
+        r"^(?P<operation>SCAN|SEARCH)(?: TABLE)? (?P<table>[\w$]+)"
+        r"(?: AS [\w$]+)?"
+        r"(?: USING (?P<using>COVERING INDEX|INDEX|INTEGER PRIMARY KEY|PRIMARY KEY)"
+        r"(?: (?P<index>[\w$]+))?)?",
+        re.IGNORECASE,
+    )
+
     def process_column_listing(self, results):
         """
         Process the results of a column listing query
@@ -15,3 +27,82 @@ class SQLiteQueryProcessor(QueryProcessor):
         :return: list
         """
         return list(map(lambda x: x["name"], results))
+
+    def process_table_row_estimate(self, query, results):
+        """
+        Process the results of an estimated table rows query
+
+        The first number of each sqlite_stat1 entry is the number of rows
+        of the table or of the index.
+
+        :rtype: int or None
+        """
+        estimates = [int(row["estimate"].split(" ")[0]) for row in results]
+
+        if not estimates or max(estimates) <= 0:
+            return None
+
+        return max(estimates)
+
+    def process_explain(self, query, sql, bindings, results):
+        """
+        Process the results of an "EXPLAIN QUERY PLAN" query
+
+        :param query: A QueryBuilder instance
+        :type query: QueryBuilder
+
+        :param sql: The explained sql query
+        :type sql: str
+
+        :param bindings: The query bindings
+        :type bindings: list
+
+        :param results: The query results
+        :type results: list
+
+        :return: The normalized query plan
+        :rtype: QueryPlan
+        """
+        nodes = []
+        by_id = {}
+
+        for row in results:
+            node = self._parse_plan_detail(row["detail"])
+            node.raw = row
+            by_id[row["id"]] = node
+
+            parent = by_id.get(row["parent"])
+            if parent is not None:
+                parent.children.append(node)
+            else:
+                nodes.append(node)
+
+        return QueryPlan(sql, bindings, nodes, results)
+
+    def _parse_plan_detail(self, detail):
+        match = self._plan_detail.match(detail)
+
+        if not match or detail.upper().startswith("SCAN CONSTANT ROW"):
+            return PlanNode(detail, detail=detail)
+
+        operation = match.group("operation").upper()
+        using = (match.group("using") or "").upper()
+
+        if using == "COVERING INDEX":
+            scan_type = PlanNode.COVERING_INDEX_SCAN
+        elif using or operation == "SEARCH":
+            scan_type = PlanNode.INDEX_SCAN
+        else:
+            scan_type = PlanNode.FULL_SCAN
+
+        index = match.group("index")
+        if not index and "PRIMARY KEY" in using:
+            index = "PRIMARY"
+
+        return PlanNode(
+            operation,
+            table=match.group("table"),
+            index=index,
+            scan_type=scan_type,
+            detail=detail,
+        )
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import re
+
 from ..support.fluent import Fluent
+from ..query.expression import QueryExpression
+from ..utils import basestring
 
 
 class Blueprint(object):
@@ -173,16 +177,24 @@ class Blueprint(object):
         """
         return self._drop_index_command("drop_unique", "unique", index)
 
-    def drop_index(self, index):
+    def drop_index(self, index, concurrently=False):
         """
         Indicate that the given index should be dropped.
 
         :param index: The index
         :type index: str
 
+        :param concurrently: Whether to drop the index without locking writes
+        :type concurrently: bool
+
         :rtype: Fluent
         """
-        return self._drop_index_command("drop_index", "index", index)
+        command = self._drop_index_command("drop_index", "index", index)
+
+        if concurrently:
+            command.concurrently = True
+
+        return command
 
     def drop_foreign(self, index):
         """
@@ -236,7 +248,17 @@ class Blueprint(object):
         """
         return self._index_command("primary", columns, name)
 
-    def unique(self, columns, name=None):
+    def unique(
+        self,
+        columns,
+        name=None,
+        where=None,
+        include=None,
+        using=None,
+        concurrently=False,
+        algorithm=None,
+        lock=None,
+    ):
         """
         Specify a unique index on the table
 
@@ -246,23 +268,91 @@ class Blueprint(object):
         :param name: The name of the primary key
         :type name: str
 
+        :param where: The condition of a partial index
+        :type where: str
+
+        :param include: The non-key columns of a covering index
+        :type include: str or list
+
+        :param using: The index method (btree, hash, gin, gist, brin...)
+        :type using: str
+
+        :param concurrently: Whether to build the index without locking writes
+        :type concurrently: bool
+
+        :param algorithm: The MySQL ALGORITHM clause (INPLACE, COPY...)
+        :type algorithm: str
+
+        :param lock: The MySQL LOCK clause (NONE, SHARED...)
+        :type lock: str
+
         :rtype: Fluent
         """
-        return self._index_command("unique", columns, name)
+        return self._index_command(
+            "unique",
+            columns,
+            name,
+            where=where,
+            include=include,
+            using=using,
+            concurrently=concurrently,
+            algorithm=algorithm,
+            lock=lock,
+        )
 
-    def index(self, columns, name=None):
+    def index(
+        self,
+        columns,
+        name=None,
+        where=None,
+        include=None,
+        using=None,
+        concurrently=False,
+        algorithm=None,
+        lock=None,
+    ):
         """
         Specify an index on the table
 
+        Columns can be raw expressions, like QueryExpression("lower(email)").
+
         :param columns: The primary key(s) columns
         :type columns: str or list
 
         :param name: The name of the primary key
         :type name: str
 
+        :param where: The condition of a partial index
+        :type where: str
+
+        :param include: The non-key columns of a covering index
+        :type include: str or list
+
+        :param using: The index method (btree, hash, gin, gist, brin...)
+        :type using: str
+
+        :param concurrently: Whether to build the index without locking writes
+        :type concurrently: bool
+
+        :param algorithm: The MySQL ALGORITHM clause (INPLACE, COPY...)
+        :type algorithm: str
+
+        :param lock: The MySQL LOCK clause (NONE, SHARED...)
+        :type lock: str
+
         :rtype: Fluent
         """
-        return self._index_command("index", columns, name)
+        return self._index_command(
+            "index",
+            columns,
+            name,
+            where=where,
+            include=include,
+            using=using,
+            concurrently=concurrently,
+            algorithm=algorithm,
+            lock=lock,
+        )
 
     def foreign(self, columns, name=None):
         """
@@ -678,7 +768,7 @@ class Blueprint(object):
 
         return self._index_command(command, columns, index)
 
-    def _index_command(self, type, columns, index):
+    def _index_command(self, type, columns, index, **options):
         """
         Add a new index command to the blueprint.
 
@@ -691,6 +781,9 @@ class Blueprint(object):
         :param index: The index name
         :type index: str
 
+        :param options: The index options, unset ones are ignored
+        :type options: dict
+
         :rtype: Fluent
         """
         if not isinstance(columns, list):
@@ -699,17 +792,26 @@ class Blueprint(object):
         if not index:
             index = self._create_index_name(type, columns)
 
-        return self._add_command(type, index=index, columns=columns)
+        parameters = dict((k, v) for k, v in options.items() if v)
+
+        if isinstance(parameters.get("include"), basestring):
+            parameters["include"] = [parameters["include"]]
+
+        return self._add_command(type, index=index, columns=columns, **parameters)
 
     def _create_index_name(self, type, columns):
         if not isinstance(columns, list):
             columns = [columns]
 
-        index = "%s_%s_%s" % (
-            self._table,
-            "_".join([str(column) for column in columns]),
-            type,
-        )
+        names = []
+        for column in columns:
+            if isinstance(column, QueryExpression):
+                # Expressions, like lower(email), can contain any character
+                column = re.sub(r"\W+", "_", str(column)).strip("_")
+
+            names.append(str(column))
+
+        index = "%s_%s_%s" % (self._table, "_".join(names), type)
 
         return index.lower().replace("-", "_").replace(".", "_")
 
@@ -107,11 +107,46 @@ class MySQLSchemaGrammar(SchemaGrammar):
         return self._compile_key(blueprint, command, "INDEX")
 
     def _compile_key(self, blueprint, command, type):
-        columns = self.columnize(command.columns)
+        # Functional key parts must be enclosed in parentheses
+        columns = []
+        for column in command.columns:
+            if self.is_expression(column):
+                columns.append("(%s)" % self.get_value(column))
+            else:
+                columns.append(self.wrap(column))
+
+        columns = ", ".join(columns)
 
         table = self.wrap_table(blueprint)
 
-        return "ALTER TABLE %s ADD %s %s(%s)" % (table, type, command.index, columns)
+        using = ""
+        if command.get("using"):
+            using = " USING %s" % command.using.upper()
+
+        sql = "ALTER TABLE %s ADD %s %s%s(%s)" % (
+            table,
+            type,
+            command.index,
+            using,
+            columns,
+        )
+
+        # MySQL has no partial or covering indexes, but online DDL
+        # allows to build the index without blocking writes.
+        algorithm = command.get("algorithm")
+        lock = command.get("lock")
+
+        if command.get("concurrently"):
+            algorithm = algorithm or "INPLACE"
+            lock = lock or "NONE"
+
+        if algorithm:
+            sql += ", ALGORITHM=%s" % algorithm.upper()
+
+        if lock:
+            sql += ", LOCK=%s" % lock.upper()
+
+        return sql
 
     def compile_drop(self, blueprint, command, _):
         return "DROP TABLE %s" % self.wrap_table(blueprint)
@@ -142,6 +142,11 @@ class PostgresSchemaGrammar(SchemaGrammar):
         )
 
     def compile_unique(self, blueprint, command, _):
+        # Unique constraints can't be partial, covering or use expressions
+        # so we use a unique index instead when one of those is needed.
+        if self._is_index_constraint(command):
+            return self._compile_create_index(blueprint, command, "UNIQUE INDEX")
+
         columns = self.columnize(command.columns)
 
         table = self.wrap_table(blueprint)
@@ -153,11 +158,37 @@ class PostgresSchemaGrammar(SchemaGrammar):
         )
 
     def compile_index(self, blueprint, command, _):
-        columns = self.columnize(command.columns)
+        return self._compile_create_index(blueprint, command, "INDEX")
 
-        table = self.wrap_table(blueprint)
+    def _is_index_constraint(self, command):
+        if any(map(self.is_expression, command.columns)):
+            return True
+
+        return any(
+            command.get(option)
+            for option in ["where", "include", "using", "concurrently"]
+        )
+
+    def _compile_create_index(self, blueprint, command, type):
+        sql = "CREATE %s " % type
+
+        if command.get("concurrently"):
+            sql += "CONCURRENTLY "
 
-        return "CREATE INDEX %s ON %s (%s)" % (command.index, table, columns)
+        sql += "%s ON %s" % (command.index, self.wrap_table(blueprint))
+
+        if command.get("using"):
+            sql += " USING %s" % command.using
+
+        sql += " (%s)" % self.columnize(command.columns)
+
+        if command.get("include"):
+            sql += " INCLUDE (%s)" % self.columnize(command.include)
+
+        if command.get("where"):
+            sql += " WHERE %s" % command.where
+
+        return sql
 
     def compile_drop(self, blueprint, command, _):
         return "DROP TABLE %s" % self.wrap_table(blueprint)
@@ -186,6 +217,9 @@ class PostgresSchemaGrammar(SchemaGrammar):
         return "ALTER TABLE %s DROP CONSTRAINT %s" % (table, command.index)
 
     def compile_drop_index(self, blueprint, command, _):
+        if command.get("concurrently"):
+            return "DROP INDEX CONCURRENTLY %s" % command.index
+
         return "DROP INDEX %s" % command.index
 
     def compile_drop_foreign(self, blueprint, command, _):
@@ -159,18 +159,23 @@ class SQLiteSchemaGrammar(SchemaGrammar):
         return statements
 
     def compile_unique(self, blueprint, command, _):
-        columns = self.columnize(command.columns)
-
-        table = self.wrap_table(blueprint)
-
-        return "CREATE UNIQUE INDEX %s ON %s (%s)" % (command.index, table, columns)
+        return self._compile_create_index(blueprint, command, "UNIQUE INDEX")
 
     def compile_index(self, blueprint, command, _):
+        return self._compile_create_index(blueprint, command, "INDEX")
+
+    def _compile_create_index(self, blueprint, command, type):
         columns = self.columnize(command.columns)
 
         table = self.wrap_table(blueprint)
 
-        return "CREATE INDEX %s ON %s (%s)" % (command.index, table, columns)
+        sql = "CREATE %s %s ON %s (%s)" % (type, command.index, table, columns)
+
+        # SQLite has partial indexes but no index methods or covering indexes
+        if command.get("where"):
+            sql += " WHERE %s" % command.where
+
+        return sql
 
     def compile_foreign(self, blueprint, command, _):
         pass
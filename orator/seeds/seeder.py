@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import time
 from ..orm import Factory
 
 
@@ -7,9 +8,15 @@ class Seeder(object):
 
     factory = None
 
+    # The tables filled by the seeder.
+    # The seeders called together are ordered so that
+    # the tables referenced by foreign keys are filled first.
+    tables = []
+
     def __init__(self, resolver=None):
         self._command = None
         self._resolver = resolver
+        self._progress_bar = None
 
         if self.factory is None:
             self.factory = Factory(resolver=resolver)
@@ -26,13 +33,66 @@ class Seeder(object):
         """
         Seed the given connection from the given class.
 
-        :param klass: The Seeder class
-        :type klass: class
+        :param klass: The Seeder class or a list of Seeder classes
+        :type klass: class or list
         """
+        if isinstance(klass, (list, tuple)):
+            for seeder in self._sort_by_foreign_keys(list(klass)):
+                self.call(seeder)
+
+            return
+
+        start = time.time()
+
         self._resolve(klass).run()
 
         if self._command:
-            self._command.line("<info>Seeded:</info> <fg=cyan>%s</>" % klass.__name__)
+            self._command.line(
+                "<info>Seeded:</info> <fg=cyan>%s</> (%.2fs)"
+                % (klass.__name__, time.time() - start)
+            )
+
+    def _sort_by_foreign_keys(self, klasses):
+        """
+        Sort seeder classes so that the seeders filling referenced tables run first.
+
+        The classes keep their order when there is no dependency between them
+        or when the dependencies are circular.
+
+        :param klasses: The Seeder classes
+        :type klasses: list
+
+        :rtype: list
+        """
+        owners = {}
+        for i, klass in enumerate(klasses):
+            for table in getattr(klass, "tables", []):
+                owners.setdefault(table, i)
+
+        if not owners:
+            return klasses
+
+        schema_manager = self._get_resolver().connection().get_schema_manager()
+
+        dependencies = [set() for _ in klasses]
+        for i, klass in enumerate(klasses):
+            for table in getattr(klass, "tables", []):
+                for foreign_key in schema_manager.list_table_foreign_keys(table):
+                    owner = owners.get(foreign_key.get_foreign_table_name())
+
+                    if owner is not None and owner != i:
+                        dependencies[i].add(owner)
+
+        ordered = []
+        done = set()
+        while len(ordered) < len(klasses):
+            pending = [i for i in range(len(klasses)) if i not in done]
+            ready = [i for i in pending if not dependencies[i] - done] or pending
+
+            done.add(ready[0])
+            ordered.append(klasses[ready[0]])
+
+        return ordered
 
     def _resolve(self, klass):
         """
@@ -41,12 +101,7 @@ class Seeder(object):
         :param klass: The Seeder class
         :type klass: class
         """
-        resolver = None
-
-        if self._resolver:
-            resolver = self._resolver
-        elif self._command:
-            resolver = self._command.resolver
+        resolver = self._get_resolver()
 
         instance = klass()
         instance.set_connection_resolver(resolver)
@@ -56,6 +111,49 @@ class Seeder(object):
 
         return instance
 
+    def _get_resolver(self):
+        if self._resolver:
+            return self._resolver
+        elif self._command:
+            return self._command.resolver
+
+    def _report_progress(self, klass, inserted, total, elapsed):
+        """
+        Display the progress of a bulk insert of a factory.
+
+        :param klass: The model class
+        :type klass: class
+
+        :param inserted: The number of models inserted
+        :type inserted: int
+
+        :param total: The number of models to insert
+        :type total: int
+
+        :param elapsed: The elapsed time in seconds
+        :type elapsed: float
+        """
+        if not self._command:
+            return
+
+        if self._progress_bar is None:
+            self._progress_bar = self._command.progress_bar(total)
+            self._progress_bar.start()
+
+        self._progress_bar.set_progress(inserted)
+
+        if inserted < total:
+            return
+
+        self._progress_bar.finish()
+        self._progress_bar = None
+
+        self._command.line("")
+        self._command.line(
+            "<info>Inserted:</info> <fg=cyan>%d %s</> in %.2fs (%d rows/s)"
+            % (inserted, klass.__name__, elapsed, inserted / max(elapsed, 0.001))
+        )
+
     def set_command(self, command):
         """
         Set the console command instance.
@@ -64,6 +162,7 @@ class Seeder(object):
         :type command: cleo.Command
         """
         self._command = command
+        self.factory.set_progress_listener(self._report_progress)
 
         return self
 
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+from .shard_map import ShardMap, HashShardMap, RangeShardMap
+from .query_builder import ShardedQueryBuilder
@@ -0,0 +1,531 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import heapq
+import functools
+import itertools
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+from ..query.builder import QueryBuilder
+from ..query.expression import QueryExpression
+from ..exceptions import ArgumentError
+from ..utils import basestring
+
+
+def scatter(connections, callback, parallel=True):
+    """
+    Call a function with each connection.
+
+    :param connections: The connections
+    :type connections: list
+
+    :param callback: The function called with each connection
+    :type callback: callable
+
+    :param parallel: Whether the calls should run concurrently,
+                     the connections must then be usable from any thread
+    :type parallel: bool
+
+    :return: The values returned by the callback, in connection order
+    :rtype: list
+    """
+    if not parallel or len(connections) < 2:
+        return [callback(connection) for connection in connections]
+
+    pool = ThreadPool(len(connections))
+    try:
+        return pool.map(callback, connections)
+    finally:
+        pool.close()
+        pool.join()
+
+
+class ShardedQueryBuilder(QueryBuilder):
+    """
+    A query builder spanning all the shards of a shard map.
+
+    Queries constrained on the shard key with equality or IN clauses
+    only run against the matching shards, the other ones are sent
+    to all the shards and their results are combined: rows are merged
+    following the orders of the query before applying the limit and
+    the offset, and aggregates are computed from the per-shard values.
+    """
+
+    def __init__(self, resolver, name, shard_key):
+        """
+        :param resolver: The connection resolver
+        :type resolver: orator.DatabaseManager
+
+        :param name: The name of the shard map
+        :type name: str
+
+        :param shard_key: The shard key column
+        :type shard_key: str
+        """
+        self._resolver = resolver
+        self._shard_map_name = name
+        self._shard_map = resolver.get_shard_map(name)
+        self._shard_key = shard_key
+
+        if self._shard_map is None:
+            raise ArgumentError("Shard map [%s] not configured" % name)
+
+        # The first shard provides the grammar and the processor
+        connection = resolver.connection(self._shard_map.get_shards()[0])
+
+        super(ShardedQueryBuilder, self).__init__(
+            connection, connection.get_query_grammar(), connection.get_post_processor()
+        )
+
+    def get_shard_connections(self):
+        """
+        Get the connections of the shards targeted by the query.
+
+        :rtype: list
+        """
+        shards = self._get_target_shards()
+
+        return [self._resolver.connection(shard) for shard in shards]
+
+    def _get_target_shards(self):
+        shards = self._shard_map.get_shards()
+
+        # A single "or" clause may match records of any shard
+        if any(where["boolean"] != "and" for where in self.wheres):
+            return shards
+
+        targets = None
+        for where in self.wheres:
+            values = self._get_shard_key_values(where)
+
+            if values is None:
+                continue
+
+            matching = set(self._shard_map.get_shard(value) for value in values)
+
+            if targets is None:
+                targets = matching
+            else:
+                targets &= matching
+
+        if targets is None:
+            return shards
+
+        return [shard for shard in shards if shard in targets]
+
+    def _get_shard_key_values(self, where):
+        column = where.get("column")
+
+        if (
+            not isinstance(column, basestring)
+            or column.split(".")[-1] != self._shard_key
+        ):
+            return
+
+        if where["type"] == "basic" and where["operator"] == "=":
+            values = [where["value"]]
+        elif where["type"] == "in":
+            values = list(where["values"])
+        else:
+            return
+
+        if any(isinstance(value, QueryExpression) for value in values):
+            return
+
+        return values
+
+    def _get_shard_for_values(self, values):
+        if values.get(self._shard_key) is None:
+            raise ArgumentError(
+                "The shard key [%s] is required to insert records" % self._shard_key
+            )
+
+        return self._shard_map.get_shard(values[self._shard_key])
+
+    def _scatter(self, connections, callback):
+        # The connections were opened in the current thread,
+        # so the workers can only use them if the drivers allow it
+        parallel = self._shard_map.is_parallel() and all(
+            connection.is_thread_safe() for connection in connections
+        )
+
+        return scatter(connections, callback, parallel)
+
+    def _run_select(self):
+        connections = self.get_shard_connections()
+
+        if len(connections) == 1:
+            return connections[0].select(
+                self.to_sql(), self.get_bindings(), not self._use_write_connection
+            )
+
+        if self.aggregate_:
+            return [{"aggregate": self._run_aggregate(connections)}]
+
+        sql = self._to_shard_sql()
+        bindings = self.get_bindings()
+        use_read_connection = not self._use_write_connection
+
+        results = self._scatter(
+            connections,
+            lambda connection: connection.select(sql, bindings, use_read_connection),
+        )
+
+        rows = self._merge(results)
+
+        if self.offset_:
+            rows = rows[self.offset_ :]
+
+        if self.limit_ is not None:
+            rows = rows[: self.limit_]
+
+        return rows
+
+    def _to_shard_sql(self):
+        """
+        Get the SQL of the query sent to each shard.
+
+        The limit and the offset apply to the merged rows,
+        so each shard must return enough rows to fill the global page.
+
+        :rtype: str
+        """
+        limit, offset = self.limit_, self.offset_
+
+        if limit is not None:
+            self.limit_ = limit + (offset or 0)
+        self.offset_ = None
+
+        try:
+            return self.to_sql()
+        finally:
+            self.limit_, self.offset_ = limit, offset
+
+    def chunk(self, count):
+        """
+        Chunk the results of the query, streaming the rows of each targeted shard.
+
+        The rows are merged following the orders of the query
+        before applying its limit and offset, as with get().
+
+        :param count: The chunk size
+        :type count: int
+
+        :return: The current chunk
+        :rtype: list
+        """
+        connections = self.get_shard_connections()
+        use_read_connection = not self._use_write_connection
+
+        if len(connections) == 1:
+            for chunk in connections[0].select_many(
+                count, self.to_sql(), self.get_bindings(), use_read_connection
+            ):
+                yield chunk
+
+            return
+
+        sql = self._to_shard_sql()
+        bindings = self.get_bindings()
+
+        streams = [
+            self._stream(
+                connection.select_many(count, sql, bindings, use_read_connection)
+            )
+            for connection in connections
+        ]
+
+        rows = self._merge_streams(streams)
+
+        start = self.offset_ or 0
+        stop = None if self.limit_ is None else start + self.limit_
+
+        chunk = []
+        for row in itertools.islice(rows, start, stop):
+            chunk.append(row)
+
+            if len(chunk) == count:
+                yield chunk
+
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    def _stream(self, chunks):
+        for chunk in chunks:
+            for row in chunk:
+                yield row
+
+    def _merge_streams(self, streams):
+        key = self._get_merge_key()
+
+        if key is None:
+            return itertools.chain(*streams)
+
+        # The shard and the position of the rows break the ties
+        # so that the rows themselves are never compared
+        decorated = [
+            self._decorate(stream, key, index) for index, stream in enumerate(streams)
+        ]
+
+        return (item[-1] for item in heapq.merge(*decorated))
+
+    def _decorate(self, stream, key, index):
+        for position, row in enumerate(stream):
+            yield key(row), index, position, row
+
+    def _merge(self, results):
+        rows = []
+        for result in results:
+            rows += result
+
+        key = self._get_merge_key()
+
+        if key is None:
+            return rows
+
+        # Timsort merges the already sorted results of each shard in linear time
+        return sorted(rows, key=key)
+
+    def _get_merge_key(self):
+        """
+        Get the sort key merging the rows following the orders of the query.
+
+        :return: The key or None if the rows can't be merged
+        :rtype: callable or None
+        """
+        orders = [order for order in self.orders if "column" in order]
+
+        if not orders or len(orders) != len(self.orders):
+            return
+
+        orders = [
+            (order["column"].split(".")[-1], order["direction"] == "desc")
+            for order in orders
+        ]
+
+        def compare(a, b):
+            for column, descending in orders:
+                x, y = a[column], b[column]
+
+                if x == y:
+                    continue
+
+                # Nulls come first in ascending order
+                if x is None:
+                    result = -1
+                elif y is None:
+                    result = 1
+                else:
+                    result = -1 if x < y else 1
+
+                return -result if descending else result
+
+            return 0
+
+        return functools.cmp_to_key(compare)
+
+    def _run_aggregate(self, connections):
+        function = self.aggregate_["function"]
+
+        if function == "avg":
+            total = self._sum(self._scatter_aggregate(connections, "sum"))
+            count = self._sum(self._scatter_aggregate(connections, "count"))
+
+            if not count:
+                return
+
+            return float(total) / count
+
+        values = self._scatter_aggregate(connections, function)
+
+        if function == "count":
+            return self._sum(values)
+
+        values = [value for value in values if value is not None]
+
+        if not values:
+            return
+
+        if function == "sum":
+            return sum(values)
+
+        if function == "min":
+            return min(values)
+
+        if function == "max":
+            return max(values)
+
+        raise ArgumentError("Unsupported sharded aggregate [%s]" % function)
+
+    def _scatter_aggregate(self, connections, function):
+        aggregate = self.aggregate_
+        self.aggregate_ = {"function": function, "columns": aggregate["columns"]}
+
+        try:
+            sql = self.to_sql()
+        finally:
+            self.aggregate_ = aggregate
+
+        bindings = self.get_bindings()
+        use_read_connection = not self._use_write_connection
+
+        def run(connection):
+            results = connection.select(sql, bindings, use_read_connection)
+
+            if results:
+                return dict((k.lower(), v) for k, v in results[0].items())["aggregate"]
+
+        return self._scatter(connections, run)
+
+    def explain(self, analyze=False):
+        connections = self.get_shard_connections()
+
+        # The plans of several shards can't be combined
+        if len(connections) != 1:
+            raise NotImplementedError(
+                "Only sharded queries targeting a single shard can be explained"
+            )
+
+        connection = self._connection
+        self._connection = connections[0]
+
+        try:
+            return super(ShardedQueryBuilder, self).explain(analyze)
+        finally:
+            self._connection = connection
+
+    def estimate_count(self):
+        # Only the table statistics of the shards can be added up
+        if self._is_filtered():
+            return None
+
+        estimates = self._scatter(
+            self.get_shard_connections(), self._estimate_table_count
+        )
+
+        if None in estimates:
+            return None
+
+        return sum(estimates)
+
+    def _get_count_cache_key(self):
+        return (
+            "shard map %s" % self._shard_map_name,
+            self.to_sql(),
+            repr(self.get_bindings()),
+        )
+
+    def _sum(self, values):
+        return sum(value for value in values if value is not None)
+
+    def insert(self, _values=None, **values):
+        if not values and not _values:
+            return True
+
+        if not isinstance(_values, list):
+            if _values is not None:
+                values.update(_values)
+
+            values = [values]
+        else:
+            values = _values
+
+        for shard, records in self._group_by_shard(values).items():
+            self._on(shard).insert(records)
+
+        return True
+
+    def insert_get_id(self, values, sequence=None):
+        shard = self._get_shard_for_values(values)
+
+        return self._on(shard).insert_get_id(values, sequence)
+
+    def upsert(self, conflict_keys, conflict_columns, _values=None, **values):
+        if not values and not _values:
+            return True
+
+        if not isinstance(_values, list):
+            if _values is not None:
+                values.update(_values)
+
+            values = [values]
+        else:
+            values = _values
+
+        for shard, records in self._group_by_shard(values).items():
+            self._on(shard).upsert(conflict_keys, conflict_columns, records)
+
+        return True
+
+    def _group_by_shard(self, values):
+        shards = OrderedDict()
+
+        for record in values:
+            shards.setdefault(self._get_shard_for_values(record), []).append(record)
+
+        return shards
+
+    def _on(self, shard):
+        connection = self._resolver.connection(shard)
+
+        return connection.query().from_(self.from__)
+
+    def update(self, _values=None, **values):
+        if _values is not None:
+            values.update(_values)
+
+        values = OrderedDict(sorted(values.items()))
+
+        bindings = self._clean_bindings(list(values.values()) + self.get_bindings())
+
+        sql = self._grammar.compile_update(self, values)
+
+        return sum(
+            self._scatter(
+                self.get_shard_connections(),
+                lambda connection: connection.update(sql, bindings),
+            )
+        )
+
+    def increment_many(self, column, amounts, key="id"):
+        raise NotImplementedError("Sharded queries do not support increment_many()")
+
+    def delete(self, id=None):
+        if id is not None:
+            self.where("id", "=", id)
+
+        sql = self._grammar.compile_delete(self)
+        bindings = self.get_bindings()
+
+        return sum(
+            self._scatter(
+                self.get_shard_connections(),
+                lambda connection: connection.delete(sql, bindings),
+            )
+        )
+
+    def truncate(self):
+        statements = self._grammar.compile_truncate(self).items()
+
+        def run(connection):
+            for sql, bindings in statements:
+                connection.statement(sql, bindings)
+
+        self._scatter(self.get_shard_connections(), run)
+
+    def __copy__(self):
+        new = self.__class__.__new__(self.__class__)
+
+        shared = ["_connection", "_resolver", "_shard_map"]
+
+        new.__dict__.update(
+            dict(
+                (k, v if k in shared else copy.deepcopy(v))
+                for k, v in self.__dict__.items()
+            )
+        )
+
+        return new
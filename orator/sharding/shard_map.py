@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+import zlib
+import bisect
+
+from ..exceptions import ArgumentError
+
+
+class ShardMap(object):
+    """
+    Maps the values of a shard key to the names of the connections
+    holding the corresponding records.
+    """
+
+    def __init__(self, shards, parallel=True):
+        """
+        :param shards: The names of the shard connections
+        :type shards: list
+
+        :param parallel: Whether queries spanning several shards
+                         should run concurrently
+        :type parallel: bool
+        """
+        if not shards:
+            raise ArgumentError("A shard map needs at least one shard")
+
+        self._shards = list(shards)
+        self._parallel = parallel
+
+    def get_shards(self):
+        """
+        Get the names of all the shards.
+
+        :rtype: list
+        """
+        return self._shards
+
+    def get_shard(self, value):
+        """
+        Get the name of the shard holding the given shard key value.
+
+        :param value: The shard key value
+        :type value: mixed
+
+        :rtype: str
+        """
+        raise NotImplementedError()
+
+    def is_parallel(self):
+        return self._parallel
+
+
+class HashShardMap(ShardMap):
+    """
+    Spreads the shard key values evenly using a stable hash.
+    """
+
+    def get_shard(self, value):
+        if value is None:
+            raise ArgumentError("Cannot resolve the shard of a null value")
+
+        key = zlib.crc32(str(value).encode("utf-8")) & 0xFFFFFFFF
+
+        return self._shards[key % len(self._shards)]
+
+
+class RangeShardMap(ShardMap):
+    """
+    Assigns contiguous ranges of shard key values to each shard.
+    """
+
+    def __init__(self, ranges, parallel=True):
+        """
+        :param ranges: The (upper bound, shard) tuples, in ascending order.
+                       Upper bounds are exclusive and the last one
+                       can be None to catch all the remaining values.
+        :type ranges: list
+
+        :param parallel: Whether queries spanning several shards
+                         should run concurrently
+        :type parallel: bool
+        """
+        bounds = [bound for bound, _ in ranges]
+
+        if None in bounds[:-1]:
+            raise ArgumentError("Only the last range can be unbounded")
+
+        if bounds and bounds[-1] is None:
+            bounds.pop()
+
+        if bounds != sorted(bounds):
+            raise ArgumentError("The ranges must be in ascending order")
+
+        shards = []
+        for _, shard in ranges:
+            if shard not in shards:
+                shards.append(shard)
+
+        super(RangeShardMap, self).__init__(shards, parallel)
+
+        self._bounds = bounds
+        self._ranges = [shard for _, shard in ranges]
+
+    def get_shard(self, value):
+        if value is None:
+            raise ArgumentError("Cannot resolve the shard of a null value")
+
+        index = bisect.bisect_right(self._bounds, value)
+
+        if index == len(self._ranges):
+            raise ArgumentError("No shard for the value [%s]" % value)
+
+        return self._ranges[index]
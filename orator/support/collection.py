@@ -1,8 +1,56 @@
 # -*- coding: utf-8 -*-
 
 from backpack import Collection as BaseCollection
+from ..utils import fast_json
 
 
 class Collection(BaseCollection):
+    def to_json(self, **options):
+        """
+        Get the collection of items as JSON.
 
-    pass
+        :param options: JSON encoding options:
+        :type options: dict
+
+        :rtype: str
+        """
+        return fast_json.dumps(self.serialize(), **options)
+
+    def iter_json(self, chunk_size=100, **options):
+        """
+        Get the collection of items as a JSON array, chunk by chunk.
+
+        Items are serialized as the array is consumed
+        so the serialized version of the whole collection is never built.
+
+        :param chunk_size: The number of items per chunk
+        :type chunk_size: int
+
+        :param options: JSON encoding options:
+        :type options: dict
+
+        :rtype: generator
+        """
+        yield "["
+
+        items = self.items
+        for start in range(0, len(items), chunk_size):
+            chunk = ",".join(
+                fast_json.dumps(self._serialize_item(item), **options)
+                for item in items[start : start + chunk_size]
+            )
+
+            if start:
+                chunk = "," + chunk
+
+            yield chunk
+
+        yield "]"
+
+    def _serialize_item(self, item):
+        if hasattr(item, "serialize"):
+            return item.serialize()
+        elif hasattr(item, "to_dict"):
+            return item.to_dict()
+
+        return item
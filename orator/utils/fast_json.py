@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""
+JSON encoding using the fastest available library.
+
+Values are encoded with simplejson by default. If orjson or python-rapidjson
+are installed they can be used instead to encode values when no encoding
+option is given, falling back on simplejson for anything they can't handle.
+Their output is compact, without spaces after separators,
+and non-ASCII characters are not escaped.
+"""
+
+import simplejson as json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import rapidjson
+except ImportError:
+    rapidjson = None
+
+
+def _orjson_dumps(value):
+    return orjson.dumps(value).decode("utf-8")
+
+
+def _rapidjson_dumps(value):
+    return rapidjson.dumps(value)
+
+
+_backends = {"orjson": _orjson_dumps, "rapidjson": _rapidjson_dumps}
+
+# The output of the other backends differs from the one of simplejson,
+# so they must be enabled explicitly
+backend = None
+
+
+def use_backend(name):
+    """
+    Set the JSON backend to use.
+
+    :param name: The backend name ("orjson", "rapidjson") or None for simplejson
+    :type name: str or None
+    """
+    global backend
+
+    if name is not None and name not in _backends:
+        raise ValueError("Unsupported JSON backend [%s]" % name)
+
+    if name is not None and {"orjson": orjson, "rapidjson": rapidjson}[name] is None:
+        raise RuntimeError("The %s package is not installed" % name)
+
+    backend = name
+
+
+def dumps(value, **options):
+    """
+    Encode a value to JSON.
+
+    :param value: The value to encode
+    :type value: mixed
+
+    :param options: The simplejson encoding options
+    :type options: dict
+
+    :rtype: str
+    """
+    if backend is not None and not options:
+        try:
+            return _backends[backend](value)
+        except (TypeError, ValueError, OverflowError):
+            # Types unsupported by the backend, like Decimal,
+            # are left to simplejson.
+            pass
+
+    return json.dumps(value, **options)
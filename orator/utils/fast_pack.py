@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""
+Binary encoding of plain structures.
+
+Values are encoded with pickle by default. If msgpack is installed
+it can be used instead, values it can't handle natively, like dates
+or decimals, being stored as pickled extension types.
+Decoding detects the encoder that was used.
+"""
+
+import pickle
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# The extension type of the values pickled inside msgpack data
+PICKLED = 1
+
+
+def _msgpack_default(value):
+    return msgpack.ExtType(PICKLED, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+
+def _msgpack_ext_hook(code, data):
+    if code == PICKLED:
+        return pickle.loads(data)
+
+    return msgpack.ExtType(code, data)
+
+
+def _pickle_dumps(value):
+    return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+def _msgpack_dumps(value):
+    return msgpack.packb(value, use_bin_type=True, default=_msgpack_default)
+
+
+_backends = {"pickle": _pickle_dumps, "msgpack": _msgpack_dumps}
+
+backend = "pickle"
+
+
+def use_backend(name):
+    """
+    Set the binary backend to use.
+
+    :param name: The backend name ("pickle" or "msgpack")
+    :type name: str
+    """
+    global backend
+
+    if name not in _backends:
+        raise ValueError("Unsupported binary backend [%s]" % name)
+
+    if name == "msgpack" and msgpack is None:
+        raise RuntimeError("The msgpack package is not installed")
+
+    backend = name
+
+
+def dumps(value):
+    """
+    Encode a value.
+
+    :param value: The value to encode
+    :type value: mixed
+
+    :rtype: bytes
+    """
+    return _backends[backend](value)
+
+
+def loads(data):
+    """
+    Decode a value encoded by dumps().
+
+    :param data: The encoded value
+    :type data: bytes
+
+    :rtype: mixed
+    """
+    # Pickle protocols 2 and above start with the PROTO opcode
+    if data[:1] == b"\x80":
+        return pickle.loads(data)
+
+    if msgpack is None:
+        raise RuntimeError("The msgpack package is not installed")
+
+    return msgpack.unpackb(data, raw=False, use_list=False, ext_hook=_msgpack_ext_hook)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import importlib
+
+LAZY_MODULES = sys.version_info >= (3, 7)
+
+
+def lazy_module(name, namespace, attributes):
+    """
+    Export attributes of a package, importing their submodule on first access.
+
+    On Python versions without module level __getattr__ (PEP 562)
+    the attributes are imported immediately.
+
+    :param name: The name of the package
+    :type name: str
+
+    :param namespace: The globals of the package
+    :type namespace: dict
+
+    :param attributes: The relative submodule of each attribute, by name
+    :type attributes: dict
+    """
+    namespace["__all__"] = list(attributes)
+
+    if not LAZY_MODULES:
+        for attribute in attributes:
+            namespace[attribute] = _load(name, attributes, attribute)
+
+        return
+
+    def __getattr__(attribute):
+        if attribute not in attributes:
+            raise AttributeError("module %r has no attribute %r" % (name, attribute))
+
+        value = _load(name, attributes, attribute)
+        namespace[attribute] = value
+
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(attributes))
+
+    namespace["__getattr__"] = __getattr__
+    namespace["__dir__"] = __dir__
+
+
+def load_object(path):
+    """
+    Import an object from its "module:name" path.
+
+    :param path: The path of the object
+    :type path: str
+    """
+    module, _, attribute = path.partition(":")
+
+    return getattr(importlib.import_module(module), attribute)
+
+
+def _load(name, attributes, attribute):
+    return getattr(importlib.import_module(attributes[attribute], name), attribute)
@@ -7,30 +7,67 @@ class Qmarker(object):
 
     RE_QMARK = re.compile(r"\?\?|\?|%")
 
+    # The conversions of the most recent queries
+    cache_size = 512
+
+    # Longer queries, like large multi-row inserts, are rarely repeated
+    # and are not cached to keep the memory used by the cache bounded
+    max_cached_length = 4096
+
+    _cache = {}
+
     @classmethod
     def qmark(cls, query):
         """
         Convert a "qmark" query into "format" style.
+
+        The conversions of the queries of up to max_cached_length characters
+        are cached, so that the statements executed repeatedly are only converted once.
         """
+        converted = cls._cache.get(query)
+
+        if converted is not None:
+            return converted
+
+        if "??" in query:
+
+            def sub_sequence(m):
+                s = m.group(0)
+                if s == "??":
+                    return "?"
+                if s == "%":
+                    return "%%"
+                else:
+                    return "%s"
 
-        def sub_sequence(m):
-            s = m.group(0)
-            if s == "??":
-                return "?"
-            if s == "%":
-                return "%%"
-            else:
-                return "%s"
+            converted = cls.RE_QMARK.sub(sub_sequence, query)
+        else:
+            # Without escaped question marks, plain replacements
+            # give the same result without calling back into Python
+            # for each placeholder.
+            converted = query.replace("%", "%%").replace("?", "%s")
 
-        return cls.RE_QMARK.sub(sub_sequence, query)
+        if len(query) > cls.max_cached_length:
+            return converted
+
+        if len(cls._cache) >= cls.cache_size:
+            cls._cache.clear()
+
+        cls._cache[query] = converted
+
+        return converted
 
     @classmethod
     def denullify(cls, args):
-        for arg in args:
-            if arg is not None:
-                yield arg
-            else:
-                yield ()
+        """
+        Replace the missing parameters of an executemany() call by empty tuples.
+
+        The parameters are returned as is when none is missing.
+        """
+        if isinstance(args, (list, tuple)) and None not in args:
+            return args
+
+        return [arg if arg is not None else () for arg in args]
 
 
 qmark = Qmarker.qmark
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import textwrap
+from collections import OrderedDict
+
+from orator.benchmarks import (
+    Benchmark,
+    BenchmarkRunner,
+    BenchmarkResult,
+    Baseline,
+)
+from orator.commands.benchmarks import BenchCommand
+
+from .. import OratorTestCase
+from ..commands import OratorCommandTestCase
+
+
+class CountingBenchmark(Benchmark):
+
+    number = 3
+    repeat = 2
+
+    def setup(self):
+        self.calls = []
+        self.db.connection().get_schema_builder()
+
+    def run(self):
+        self.calls.append(self.db.connection().select("SELECT 1"))
+
+
+class SQLiteOnlyBenchmark(CountingBenchmark):
+
+    databases = ["sqlite"]
+
+
+class BenchmarkRunnerTestCase(OratorTestCase):
+    def test_run_measures_benchmarks_against_reachable_databases(self):
+        runner = BenchmarkRunner(
+            OrderedDict(
+                [
+                    ("sqlite", {"driver": "sqlite", "database": ":memory:"}),
+                    ("sqlite-file", {"driver": "sqlite", "database": None}),
+                    ("unreachable", {"driver": "unknown"}),
+                ]
+            )
+        )
+
+        seen = []
+        results, skipped = runner.run(
+            [CountingBenchmark, SQLiteOnlyBenchmark], callback=seen.append
+        )
+
+        self.assertEqual(["unreachable"], skipped)
+        self.assertEqual(seen, results)
+        self.assertEqual(
+            [
+                ("counting_benchmark", "sqlite"),
+                ("sq_lite_only_benchmark", "sqlite"),
+                ("counting_benchmark", "sqlite-file"),
+            ],
+            [(r.name, r.database) for r in results],
+        )
+        self.assertEqual(2, len(results[0].timings))
+        self.assertEqual(min(results[0].timings) / 3, results[0].time)
+
+
+class BaselineTestCase(OratorTestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_compare_detects_regressions(self):
+        baseline = Baseline()
+        baseline.update(
+            [
+                BenchmarkResult("foo", "sqlite", 1, [1.0]),
+                BenchmarkResult("bar", "sqlite", 1, [1.0]),
+            ]
+        )
+
+        regressions = baseline.compare(
+            [
+                BenchmarkResult("foo", "sqlite", 1, [1.05]),
+                BenchmarkResult("bar", "sqlite", 1, [1.5]),
+                BenchmarkResult("baz", "sqlite", 1, [10.0]),
+                BenchmarkResult("foo", "mysql", 1, [10.0]),
+            ],
+            threshold=10,
+        )
+
+        self.assertEqual(1, len(regressions))
+        self.assertEqual("bar", regressions[0].name)
+        self.assertAlmostEqual(50, regressions[0].change)
+
+    def test_baseline_can_be_saved_and_loaded(self):
+        path = os.path.join(self.path, "baseline.json")
+
+        self.assertIsNone(Baseline.load(path).get("foo", "sqlite"))
+
+        baseline = Baseline()
+        baseline.update([BenchmarkResult("foo", "sqlite", 2, [1.0, 0.5])])
+        baseline.save(path)
+
+        self.assertEqual(0.25, Baseline.load(path).get("foo", "sqlite"))
+
+
+class BenchCommandTestCase(OratorCommandTestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+        with open(os.path.join(self.path, "bench_foo.py"), "w") as fh:
+            fh.write(
+                textwrap.dedent(
+                    """
+                    from orator.benchmarks import Benchmark
+
+
+                    class Foo(Benchmark):
+
+                        number = 1
+                        repeat = 1
+
+                        def run(self):
+                            pass
+                    """
+                )
+            )
+
+    def tearDown(self):
+        super(BenchCommandTestCase, self).tearDown()
+
+        shutil.rmtree(self.path)
+
+    def test_fails_when_a_benchmark_regresses(self):
+        command = BenchCommand()
+        options = [("--path", self.path), ("--database", ["sqlite"])]
+
+        tester = self.run_command(command, options + [("--save", True)])
+        self.assertIn("Baseline saved", tester.get_display())
+
+        path = os.path.join(self.path, "baseline.json")
+        baseline = Baseline.load(path)
+        self.assertIsNotNone(baseline.get("foo", "sqlite"))
+
+        Baseline(OrderedDict([("sqlite", {"foo": 0.0})])).save(path)
+        self.assertEqual(0, self.run_command(command, options).status_code)
+
+        Baseline(OrderedDict([("sqlite", {"foo": 1e-12})])).save(path)
+        tester = self.run_command(command, options)
+
+        self.assertEqual(1, tester.status_code)
+        self.assertIn("Regression: foo [sqlite]", tester.get_display())
@@ -15,6 +15,9 @@ from ..orm.models import User
 
 from orator.query.builder import QueryBuilder
 from orator.connections.connection import Connection
+from orator.exceptions import ArgumentError
+from orator.exceptions.query import QueryException
+from orator.utils.qmarker import Qmarker, qmark, denullify
 
 
 class ConnectionTestCase(OratorTestCase):
@@ -74,6 +77,104 @@ class ConnectionTestCase(OratorTestCase):
         self.assertIsNotNone(connection.get_table_prefix())
         self.assertEqual("", connection.get_table_prefix())
 
+    def test_nested_transactions_use_savepoints(self):
+        connection = Connection(mock.MagicMock(), "database")
+        connection.statement = mock.MagicMock()
+
+        connection.begin_transaction()
+        connection.begin_transaction()
+        connection.begin_transaction()
+        self.assertEqual(3, connection.transaction_level())
+
+        connection.rollback()
+        connection.commit()
+        self.assertEqual(1, connection.transaction_level())
+
+        connection.commit()
+        self.assertEqual(0, connection.transaction_level())
+
+        self.assertEqual(
+            [
+                mock.call("SAVEPOINT trans2"),
+                mock.call("SAVEPOINT trans3"),
+                mock.call("ROLLBACK TO SAVEPOINT trans3"),
+                mock.call("RELEASE SAVEPOINT trans2"),
+            ],
+            connection.statement.call_args_list,
+        )
+        connection.get_connection().commit.assert_called_once_with()
+        self.assertFalse(connection.get_connection().rollback.called)
+
+    def test_transaction_with_callback_retries_concurrency_errors(self):
+        connection = Connection(mock.MagicMock(), "database")
+        error = QueryException(
+            "UPDATE", [], Exception("deadlock detected while waiting for lock")
+        )
+        callback = mock.MagicMock(side_effect=[error, error, "foo"])
+
+        result = connection.transaction(callback, retries=2)
+
+        self.assertEqual("foo", result)
+        self.assertEqual(3, callback.call_count)
+        self.assertEqual(2, connection.get_connection().rollback.call_count)
+        connection.get_connection().commit.assert_called_once_with()
+        self.assertEqual(0, connection.transaction_level())
+
+    def test_transaction_with_callback_gives_up_after_retries(self):
+        connection = Connection(mock.MagicMock(), "database")
+        error = QueryException("UPDATE", [], Exception("database is locked"))
+        callback = mock.MagicMock(side_effect=error)
+        sleeps = []
+
+        self.assertRaises(
+            QueryException,
+            connection.transaction,
+            callback,
+            retries=2,
+            backoff=sleeps.append,
+        )
+        self.assertEqual(3, callback.call_count)
+        self.assertEqual([1, 2], sleeps)
+
+    def test_transaction_with_callback_does_not_retry_other_errors(self):
+        connection = Connection(mock.MagicMock(), "database")
+        callback = mock.MagicMock(side_effect=Exception("foo"))
+
+        self.assertRaises(Exception, connection.transaction, callback, retries=3)
+        self.assertEqual(1, callback.call_count)
+
+    def test_transaction_retries_requires_callback(self):
+        connection = Connection(None, "database")
+
+        self.assertRaises(ArgumentError, connection.transaction, retries=3)
+
+    def test_before_commit_callbacks(self):
+        connection = Connection(mock.MagicMock(), "database")
+        connection.statement = mock.MagicMock()
+        callback = mock.MagicMock()
+
+        connection.before_commit(callback)
+        callback.assert_called_once_with()
+        callback.reset_mock()
+
+        connection.begin_transaction()
+        connection.begin_transaction()
+        self.assertIs(callback, connection.before_commit(callback, "foo"))
+        self.assertIs(callback, connection.before_commit(mock.MagicMock(), "foo"))
+        connection.commit()
+        self.assertFalse(callback.called)
+
+        connection.commit()
+        callback.assert_called_once_with()
+        callback.reset_mock()
+
+        connection.begin_transaction()
+        connection.before_commit(callback)
+        connection.rollback()
+        connection.begin_transaction()
+        connection.commit()
+        self.assertFalse(callback.called)
+
 
 class ConnectionThreadLocalTest(OratorTestCase):
 
@@ -119,3 +220,154 @@ class ConnectionThreadLocalTest(OratorTestCase):
         [t.join() for t in threads]
 
         self.assertEqual(data_queue.qsize(), self.threads * 20)
+
+    def test_nested_transaction_rollback_keeps_outer_work(self):
+        self.init_database()
+
+        db = self.manager
+
+        with db.transaction():
+            db.table("users").insert(name="foo")
+
+            try:
+                with db.transaction():
+                    db.table("users").insert(name="bar")
+
+                    raise Exception("bar")
+            except Exception:
+                pass
+
+            db.table("users").insert(name="baz")
+
+        self.assertEqual(["foo", "baz"], db.table("users").order_by("id").lists("name"))
+
+    def test_nested_transaction_as_first_statement_keeps_outer_atomicity(self):
+        self.init_database()
+
+        db = self.manager
+
+        try:
+            with db.transaction():
+                with db.transaction():
+                    db.table("users").insert(name="foo")
+
+                raise Exception("foo")
+        except Exception:
+            pass
+
+        self.assertEqual(0, db.table("users").count())
+
+
+class ConnectionPipelineTest(OratorTestCase):
+    def test_pipeline_sends_statements_on_exit(self):
+        self.init_database()
+
+        db = self.manager.connection()
+        queries = []
+        db.listen(lambda query, bindings, time_: queries.append(query))
+
+        with db.pipeline() as pipeline:
+            inserted = db.table("users").insert(name="foo")
+            user_id = db.table("users").insert_get_id({"name": "bar"})
+            affected = db.table("users").where("name", "foo").update(name="baz")
+            user = User.create(name="qux")
+
+            self.assertEqual(4, len(pipeline))
+            self.assertEqual([], queries)
+            self.assertFalse(affected.done())
+            self.assertNotIn("id", user.get_attributes())
+
+        self.assertEqual(4, len(queries))
+        self.assertTrue(inserted.result())
+        self.assertEqual(2, user_id.result())
+        self.assertEqual(1, affected.result())
+        self.assertEqual(3, user.id)
+        self.assertFalse(user.is_dirty())
+        self.assertEqual(
+            ["baz", "bar", "qux"], db.table("users").order_by("id").lists("name")
+        )
+
+    def test_select_sends_pending_statements(self):
+        self.init_database()
+
+        db = self.manager.connection()
+
+        with db.pipeline():
+            inserted = db.table("users").insert(name="foo")
+
+            self.assertEqual(1, db.table("users").count())
+            self.assertTrue(inserted.done())
+
+    def test_failed_pipeline_is_rolled_back(self):
+        self.init_database()
+
+        db = self.manager.connection()
+
+        with self.assertRaises(QueryException):
+            with db.pipeline():
+                inserted = db.table("users").insert(name="foo")
+                db.table("unknown").insert(name="bar")
+
+        self.assertIsInstance(inserted.exception(), QueryException)
+        self.assertRaises(QueryException, inserted.result)
+        self.assertEqual(0, db.table("users").count())
+        self.assertEqual(0, db.transaction_level())
+
+    def test_exception_in_pipeline_discards_statements(self):
+        self.init_database()
+
+        db = self.manager.connection()
+
+        try:
+            with db.pipeline():
+                inserted = db.table("users").insert(name="foo")
+
+                raise ValueError()
+        except ValueError:
+            pass
+
+        self.assertIsInstance(inserted.exception(), ValueError)
+        self.assertEqual(0, db.table("users").count())
+
+    def test_transactions_cannot_be_started_inside_a_pipeline(self):
+        self.init_database()
+
+        db = self.manager.connection()
+
+        with db.transaction():
+            with db.pipeline():
+                inserted = db.table("users").insert(name="foo")
+
+                with self.assertRaises(RuntimeError):
+                    with db.transaction():
+                        pass
+
+        self.assertTrue(inserted.result())
+        self.assertEqual(1, db.table("users").count())
+        self.assertEqual(0, db.transaction_level())
+
+
+class QmarkerTestCase(OratorTestCase):
+    def test_qmark(self):
+        self.assertEqual(
+            "SELECT * FROM users WHERE name LIKE '%%foo' AND id = %s",
+            qmark("SELECT * FROM users WHERE name LIKE '%foo' AND id = ?"),
+        )
+        self.assertEqual(
+            "SELECT * FROM users WHERE data ? 'key' AND id = %s",
+            qmark("SELECT * FROM users WHERE data ?? 'key' AND id = ?"),
+        )
+
+        query = "SELECT * FROM users WHERE id IN (%s)" % ", ".join(["?"] * 3)
+        self.assertIs(qmark(query), qmark(query))
+
+        query = "SELECT * FROM users WHERE id IN (%s)" % ", ".join(["?"] * 5000)
+        self.assertEqual(query.replace("?", "%s"), qmark(query))
+        self.assertNotIn(query, Qmarker._cache)
+
+    def test_denullify(self):
+        args = [(1,), (2,)]
+
+        self.assertIs(args, denullify(args))
+        self.assertEqual([(1,), ()], denullify([(1,), None]))
+        self.assertEqual([(1,), ()], denullify(iter([(1,), None])))
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from .. import OratorTestCase
+from .. import OratorTestCase, mock
 
 from orator.connections.postgres_connection import PostgresConnection
 
@@ -20,3 +20,46 @@ class PostgresConnectionTestCase(OratorTestCase):
         connection = PostgresConnection(None, "database", "", {"use_qmark": False})
 
         self.assertIsNone(connection.get_marker())
+
+    def test_pipelined_statements_are_sent_together(self):
+        connection = PostgresConnection(self.get_api_connection(), "database", "", {})
+
+        with connection.pipeline():
+            connection.statement('INSERT INTO "users" ("name") VALUES (%s)', ["foo"])
+            connection.statement('UPDATE "users" SET "age" = %s', [3])
+
+        cursor = connection.get_connection().cursor.return_value
+        cursor.execute.assert_called_once_with(
+            'INSERT INTO "users" ("name") VALUES (\'foo\'); UPDATE "users" SET "age" = 3'
+        )
+
+    def test_pipelined_qmark_statements_are_sent_one_by_one(self):
+        api = self.get_api_connection()
+        connection = PostgresConnection(api, "database", "", {"use_qmark": True})
+
+        with connection.pipeline():
+            connection.statement('INSERT INTO "users" ("name") VALUES (?)', ["foo"])
+            connection.statement('UPDATE "users" SET "age" = ?', [3])
+
+        self.assertFalse(api.cursor.return_value.mogrify.called)
+        self.assertEqual(
+            [
+                mock.call('INSERT INTO "users" ("name") VALUES (?)', ["foo"]),
+                mock.call('UPDATE "users" SET "age" = ?', [3]),
+            ],
+            api.cursor.return_value.execute.call_args_list,
+        )
+
+    def get_api_connection(self):
+        def mogrify(query, bindings):
+            values = tuple(
+                "'%s'" % value if isinstance(value, str) else value
+                for value in bindings
+            )
+
+            return (query % values).encode()
+
+        api = mock.MagicMock()
+        api.cursor.return_value.mogrify.side_effect = mogrify
+
+        return api
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import threading
+
+from .. import OratorTestCase
+from orator import DatabaseManager
+from orator.exceptions import ArgumentError
+from orator.exceptions.query import QueryException
+
+
+class SQLiteConnectionTestCase(OratorTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "test.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+        super(SQLiteConnectionTestCase, self).tearDown()
+
+    def test_performance_profile(self):
+        connection = self.connect(profile="performance", cache_size=-1000)
+
+        self.assertEqual("wal", self.pragma(connection, "journal_mode"))
+        self.assertEqual(1, self.pragma(connection, "synchronous"))
+        self.assertEqual(-1000, self.pragma(connection, "cache_size"))
+        self.assertEqual(268435456, self.pragma(connection, "mmap_size"))
+        self.assertEqual(2, self.pragma(connection, "temp_store"))
+        self.assertEqual(5000, self.pragma(connection, "busy_timeout"))
+        self.assertEqual(1, self.pragma(connection, "foreign_keys"))
+
+    def test_pragmas_are_validated(self):
+        self.assertRaises(ArgumentError, self.connect, journal_mode="WAL; DROP")
+        self.assertRaises(ArgumentError, self.connect, cache_size="1; DROP")
+        self.assertRaises(ArgumentError, self.connect, profile="foo")
+
+    def test_reads_use_the_read_pool(self):
+        connection = self.connect(journal_mode="wal", read_pool=2)
+
+        with connection.get_schema_builder().create("users") as table:
+            table.increments("id")
+
+        connection.table("users").insert({"id": 1})
+
+        readers = []
+
+        def read():
+            readers.append(connection.get_read_connection())
+            self.assertEqual(1, connection.table("users").count())
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        pool = connection.get_read_pool()
+
+        self.assertEqual(4, len(readers))
+        self.assertEqual(2, len(pool.get_connections()))
+        self.assertEqual(2, len(set(id(reader) for reader in readers)))
+        self.assertNotIn(connection.get_connection(), readers)
+
+        # Read connections are read-only
+        self.assertRaises(
+            QueryException, connection.select, "DELETE FROM users WHERE id = 1"
+        )
+
+        with connection.transaction():
+            self.assertIs(connection.get_connection(), connection.get_read_connection())
+
+        connection.disconnect()
+        self.assertIsNone(connection.get_read_pool())
+
+    def test_read_pool_is_shared_by_the_threads(self):
+        db = DatabaseManager(
+            {
+                "test": {
+                    "driver": "sqlite",
+                    "database": self.path,
+                    "journal_mode": "wal",
+                    "read_pool": 2,
+                }
+            }
+        )
+
+        with db.connection().get_schema_builder().create("users") as table:
+            table.increments("id")
+            table.integer("count")
+
+        db.table("users").insert({"id": 1, "count": 0})
+
+        pools = []
+        errors = []
+
+        def work():
+            connection = db.connection()
+
+            try:
+                for _ in range(5):
+                    # Updates would be lost without a single writer
+                    with connection.transaction():
+                        count = connection.table("users").where("id", 1).pluck("count")
+                        connection.table("users").where("id", 1).update(count=count + 1)
+
+                    connection.table("users").count()
+            except Exception as e:
+                errors.append(e)
+
+            pools.append(connection.get_read_pool())
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(20, db.table("users").where("id", 1).pluck("count"))
+        self.assertEqual(1, len(set(id(pool) for pool in pools)))
+        self.assertEqual(2, len(pools[0].get_connections()))
+
+    def test_in_memory_databases_cannot_use_a_read_pool(self):
+        db = DatabaseManager(
+            {"test": {"driver": "sqlite", "database": ":memory:", "read_pool": 2}}
+        )
+
+        self.assertRaises(ArgumentError, db.connection)
+
+    def connect(self, **config):
+        config.update(driver="sqlite", database=self.path)
+
+        return DatabaseManager({"test": config}).connection()
+
+    def pragma(self, connection, name):
+        return list(connection.select("PRAGMA %s" % name)[0].values())[0]
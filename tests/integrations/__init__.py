@@ -185,6 +185,98 @@ class IntegrationTestCase(object):
         self.assertEqual(1, len(results))
         self.assertEqual("john@doe.com", results.first().email)
 
+    def test_relation_aggregates(self):
+        user = OratorTestUser.create(email="john@doe.com")
+        OratorTestUser.create(email="jane@doe.com")
+        user.friends().create(email="jack@doe.com")
+        post = user.posts().create(name="First Post")
+        user.posts().create(name="Second Post")
+        post.comments().create(body="Text")
+        comment = post.comments().create(body="Text 2")
+
+        users = (
+            OratorTestUser.with_count("posts", "friends")
+            .with_count({"posts as first_posts": lambda q: q.where("name", "First Post")})
+            .order_by("id")
+            .get()
+        )
+
+        self.assertEqual([2, 0, 0], users.pluck("posts_count").all())
+        self.assertEqual([1, 0, 0], users.pluck("friends_count").all())
+        self.assertEqual([1, 0, 0], users.pluck("first_posts").all())
+
+        posts = OratorTestPost.with_max("comments", "id").order_by("id").get()
+
+        self.assertEqual([comment.id, None], posts.pluck("comments_max_id").all())
+
+    def test_deferred_columns(self):
+        user = OratorTestUser.create(email="john@doe.com")
+        user.friends().create(email="jane@doe.com")
+        user.posts().create(name="First Post")
+        user.posts().create(name="Second Post")
+
+        queries = []
+        self.connection().listen(lambda query, bindings, time_: queries.append(query))
+
+        posts = OratorTestPost.query().defer("name").order_by("id").get()
+
+        self.assertEqual(1, len(queries))
+        self.assertNotIn("name", posts[0].to_dict())
+        self.assertEqual("Second Post", posts[1].name)
+        self.assertEqual("First Post", posts[0].name)
+        self.assertEqual(2, len(queries))
+
+        posts[0].user_id = user.id
+        posts[0].save()
+        self.assertEqual({}, posts[0].get_dirty())
+
+        user = (
+            OratorTestUser.with_(
+                {"posts": lambda q: q.only("user_id"), "friends": lambda q: q.only()}
+            )
+            .where("id", user.id)
+            .first()
+        )
+
+        self.assertEqual(["id", "user_id"], sorted(user.posts[0].to_dict().keys()))
+        self.assertNotIn("email", user.friends[0].to_dict())
+        self.assertEqual("jane@doe.com", user.friends[0].email)
+        self.assertEqual("First Post", user.posts[0].name)
+
+    def test_batch_touches(self):
+        user = OratorTestUser.create(email="john@doe.com")
+        post = user.posts().create(name="First Post")
+        parent = post.comments().create(body="Parent")
+        other = post.comments().create(body="Other")
+
+        queries = []
+        self.connection().listen(lambda query, bindings, time_: queries.append(query))
+
+        with OratorTestComment.batch_touches():
+            for i in range(3):
+                post.comments().create(body="Reply %d" % i, parent_id=parent.id)
+
+            post.comments().create(body="Reply", parent_id=other.id)
+
+            updates = [q for q in queries if q.lower().startswith("update")]
+            self.assertEqual([], updates)
+
+        updates = [q for q in queries if q.lower().startswith("update")]
+        self.assertEqual(1, len(updates))
+        self.assertIn(" in ", updates[0].lower())
+
+        del queries[:]
+
+        with self.connection().transaction():
+            for i in range(3):
+                post.comments().create(body="Reply %d" % i, parent_id=parent.id)
+
+            updates = [q for q in queries if q.lower().startswith("update")]
+            self.assertEqual([], updates)
+
+        updates = [q for q in queries if q.lower().startswith("update")]
+        self.assertEqual(1, len(updates))
+
     def test_basic_has_many_eager_loading(self):
         user = OratorTestUser.create(id=1, email="john@doe.com")
         post = user.posts().create(name="First Post")
@@ -317,6 +409,68 @@ class IntegrationTestCase(object):
         self.assertTrue(result)
         self.assertEqual(2, OratorTestPost.count())
 
+    def test_upsert_many(self):
+        user = OratorTestUser.create(email="john@doe.com")
+        user.created_at = user.created_at.subtract(days=1)
+        user.save()
+        created_at = OratorTestUser.find(user.id).created_at
+
+        keys = OratorTestUser.upsert_many(
+            [{"email": "john@doe.com"}, {"email": "jane@doe.com"}],
+            "email",
+            return_keys=True,
+        )
+
+        self.assertEqual(2, OratorTestUser.count())
+        self.assertEqual(user.id, keys[0])
+        self.assertEqual(
+            OratorTestUser.where("email", "jane@doe.com").first().id, keys[1]
+        )
+        self.assertEqual(created_at, OratorTestUser.find(user.id).created_at)
+
+    def test_upsert_many_in_batches(self):
+        records = [{"email": "user%d@doe.com" % i} for i in range(25)]
+
+        self.assertEqual(25, OratorTestUser.upsert_many(records, "email"))
+        self.assertEqual(
+            25, OratorTestUser.upsert_many(records, "email", batch_size=10)
+        )
+        self.assertEqual(25, OratorTestUser.count())
+
+    def test_upsert_many_with_composite_unique_keys(self):
+        with self.schema().create("test_scores") as table:
+            table.increments("id")
+            table.integer("game")
+            table.integer("player")
+            table.string("score")
+            table.unique(["game", "player"])
+
+        class Score(Model):
+
+            __table__ = "test_scores"
+            __guarded__ = []
+            __timestamps__ = False
+
+        try:
+            records = [
+                {"game": i // 100, "player": i % 100, "score": "first"}
+                for i in range(1200)
+            ]
+            records.append({"game": 0, "player": 0, "score": "last"})
+
+            keys = Score.upsert_many(records, ["game", "player"], return_keys=True)
+
+            self.assertEqual(1201, len(keys))
+            self.assertEqual(1200, len(set(keys)))
+            self.assertEqual(keys[0], keys[-1])
+            self.assertEqual(1200, Score.count())
+            self.assertEqual("last", Score.find(keys[0]).score)
+            self.assertEqual(
+                1200, Score.upsert_many(records, ["game", "player"], batch_size=500)
+            )
+        finally:
+            self.schema().drop_if_exists("test_scores")
+
     def test_belongs_to_many_further_query(self):
         user = OratorTestUser.create(id=1, email="john@doe.com")
         friend = OratorTestUser.create(id=2, email="jane@doe.com")
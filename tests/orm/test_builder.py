@@ -12,6 +12,7 @@ from orator.exceptions.orm import ModelNotFound
 from orator.orm.collection import Collection
 from orator.connections import Connection
 from orator.query.processors import QueryProcessor
+from .models import User
 
 
 class BuilderTestCase(OratorTestCase):
@@ -360,6 +361,48 @@ class BuilderTestCase(OratorTestCase):
 
         self.assertEqual(result, builder)
 
+    def test_dynamic_methods_are_resolved_once(self):
+        builder = self.get_builder()
+        builder.get_query().from_ = mock.MagicMock()
+        builder.get_query().where = mock.MagicMock()
+        builder.set_model(OrmBuilderTestModelScopeStub())
+
+        self.assertEqual(builder, builder.approved())
+        self.assertEqual(builder, builder.where_null("foo"))
+        self.assertIn("approved", builder.__dict__)
+        self.assertIn("where_null", builder.__dict__)
+
+        table = Builder._dispatch_tables[
+            (OrmBuilderTestModelScopeStub, builder.get_query().__class__)
+        ]
+        self.assertIn("approved", table)
+        self.assertIn("where_null", table)
+
+        def foo_bar(builder):
+            return "foo"
+
+        builder.macro("where_null", foo_bar)
+
+        self.assertEqual("foo", builder.where_null())
+
+    def test_scopes_set_on_model_class_flush_dispatch_tables(self):
+        class Stub(OratorTestModel):
+            pass
+
+        builder = self.get_builder()
+        builder.set_model(Stub())
+
+        self.assertRaises(AttributeError, getattr, builder, "active")
+
+        Stub.scope_active = lambda self, query: query.where("active", True)
+
+        builder = self.get_builder()
+        builder.get_query().where = mock.MagicMock()
+        builder.set_model(Stub())
+
+        self.assertEqual(builder, builder.active())
+        builder.get_query().where.assert_called_once_with("active", True, None, "and")
+
     def test_simple_where(self):
         builder = self.get_builder()
         builder.get_query().where = mock.MagicMock()
@@ -412,6 +455,84 @@ class BuilderTestCase(OratorTestCase):
 
         self.assertEqual(builder, result)
 
+    def test_has_uses_exists(self):
+        related = '"orm_builder_test_model_far_related_stubs"'
+        subquery = (
+            "(SELECT * FROM %s "
+            'WHERE %s."orm_builder_test_model_close_related_id" '
+            '= "orm_builder_test_model_close_relateds"."id")' % (related, related)
+        )
+
+        builder = OrmBuilderTestModelCloseRelated.has("bar")
+        self.assertEqual(
+            'SELECT * FROM "orm_builder_test_model_close_relateds" '
+            "WHERE EXISTS %s" % subquery,
+            builder.to_sql(),
+        )
+
+        builder = OrmBuilderTestModelCloseRelated.where("foo", "bar").doesnt_have(
+            "bar"
+        )
+        self.assertEqual(
+            'SELECT * FROM "orm_builder_test_model_close_relateds" '
+            'WHERE "foo" = ? AND NOT EXISTS %s' % subquery,
+            builder.to_sql(),
+        )
+
+    def test_has_with_count_uses_subquery_count(self):
+        builder = OrmBuilderTestModelCloseRelated.has("bar", ">=", 2)
+
+        related = '"orm_builder_test_model_far_related_stubs"'
+        self.assertEqual(
+            'SELECT * FROM "orm_builder_test_model_close_relateds" '
+            "WHERE (SELECT COUNT(*) FROM %s "
+            'WHERE %s."orm_builder_test_model_close_related_id" '
+            '= "orm_builder_test_model_close_relateds"."id") >= ?' % (related, related),
+            builder.to_sql(),
+        )
+        self.assertEqual([2], builder.get_bindings())
+
+    def test_where_has_bindings_with_exists(self):
+        builder = OrmBuilderTestModelParentStub.where_has(
+            "foo.bar", lambda q: q.where("baz", "bam")
+        ).where("qux", 2)
+
+        self.assertEqual(["bam", 2], builder.get_bindings())
+
+    def test_with_count(self):
+        builder = OrmBuilderTestModelCloseRelated.with_count("bar", "bar as baz")
+
+        related = '"orm_builder_test_model_far_related_stubs"'
+        subquery = (
+            "(SELECT COUNT(*) FROM %s "
+            'WHERE %s."orm_builder_test_model_close_related_id" '
+            '= "orm_builder_test_model_close_relateds"."id")' % (related, related)
+        )
+        self.assertEqual(
+            'SELECT "orm_builder_test_model_close_relateds".*, '
+            '%s AS "bar_count", %s AS "baz" '
+            'FROM "orm_builder_test_model_close_relateds"' % (subquery, subquery),
+            builder.to_sql(),
+        )
+
+    def test_with_sum_with_constraints(self):
+        builder = (
+            OrmBuilderTestModelCloseRelated.select("id")
+            .with_sum({"bar": lambda q: q.where("active", True)}, "price")
+            .where("id", 1)
+        )
+
+        related = '"orm_builder_test_model_far_related_stubs"'
+        self.assertEqual(
+            'SELECT "id", (SELECT SUM(%s."price") FROM %s '
+            'WHERE %s."orm_builder_test_model_close_related_id" '
+            '= "orm_builder_test_model_close_relateds"."id" AND "active" = ?) '
+            'AS "bar_sum_price" FROM "orm_builder_test_model_close_relateds" '
+            'WHERE "id" = ?' % (related, related, related),
+            builder.to_sql(),
+        )
+        self.assertEqual([True, 1], builder.get_bindings())
+
     def test_where_exists_accepts_builder_instance(self):
         model = OrmBuilderTestModelCloseRelated
 
@@ -442,6 +563,55 @@ class BuilderTestCase(OratorTestCase):
         return builder
 
 
+class ParallelChunkTestCase(OratorTestCase):
+    def setUp(self):
+        self.init_database()
+
+        with self.manager.transaction():
+            for i in range(25):
+                User.create(name="user%d" % i)
+
+    def test_chunk_by_id(self):
+        chunks = list(User.where("id", ">", 5).chunk_by_id(7))
+
+        self.assertEqual([7, 7, 6], [len(chunk) for chunk in chunks])
+        self.assertEqual(list(range(6, 26)), [u.id for c in chunks for u in c])
+
+    def test_parallel_chunk_with_threads(self):
+        result = User.query().parallel_chunk(self._process, 5, workers=5)
+
+        self.assertEqual(
+            list(range(1, 11)) + list(range(16, 26)), sum(result.results, [])
+        )
+        self.assertEqual(1, len(result.errors))
+        self.assertEqual((11, 15), result.errors[0][:2])
+        self.assertFalse(result.ok)
+
+    def test_parallel_chunk_with_processes(self):
+        result = User.where("id", "<=", 20).parallel_chunk(
+            self._process, 5, workers=2, executor="process"
+        )
+
+        self.assertEqual(
+            [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 16, 17, 18, 19, 20],
+            sum(result.results, []),
+        )
+        self.assertIsInstance(result.errors[0][2], ValueError)
+
+    def test_parallel_chunk_without_results(self):
+        result = User.where("id", ">", 100).parallel_chunk(self._process)
+
+        self.assertEqual([], result.results)
+        self.assertTrue(result.ok)
+
+    @staticmethod
+    def _process(users):
+        if users[0].id == 11:
+            raise ValueError(users[0].id)
+
+        return [user.id for user in users]
+
+
 class OratorTestModel(Model):
     @classmethod
     def _boot_columns(cls):
@@ -110,6 +110,77 @@ class FactoryTestCase(OratorTestCase):
         self.assertEqual(3, len(admins))
         self.assertTrue(admins[0].admin)
 
+    def test_factory_insert(self):
+        progress = []
+
+        inserted = self.factory(User, 5).insert(
+            batch_size=2, progress=lambda *args: progress.append(args[:3])
+        )
+
+        self.assertEqual(5, inserted)
+        self.assertEqual(5, User.count())
+        self.assertEqual(
+            [(User, 2, 5), (User, 4, 5), (User, 5, 5)], progress
+        )
+        self.assertIsNotNone(User.first().created_at)
+        self.assertFalse(User.__unguarded__)
+
+    def test_factory_insert_splits_batches_within_database_limits(self):
+        @self.factory.define(User, "unique")
+        def users_factory(faker):
+            return {"name": faker.uuid4(), "email": faker.uuid4()}
+
+        queries = []
+
+        def listener(query, *args):
+            queries.append(query)
+
+        self.connection().listen(listener)
+
+        try:
+            inserted = self.factory(User, "unique", 600).insert(timestamps=False)
+        finally:
+            self.connection().remove_listener(listener)
+
+        self.assertEqual(600, inserted)
+        self.assertEqual(600, User.count())
+        self.assertEqual(2, len([query for query in queries if "INSERT" in query]))
+
+    def test_factory_insert_without_timestamps(self):
+        queries = []
+
+        def listener(query, *args):
+            queries.append(query)
+
+        self.connection().listen(listener)
+
+        try:
+            self.factory(User, 2).insert(timestamps=False, admin=True)
+        finally:
+            self.connection().remove_listener(listener)
+
+        self.assertEqual(2, User.where("admin", True).count())
+        self.assertNotIn("created_at", queries[0])
+
+    def test_factory_insert_with_events(self):
+        created = []
+        User.created(lambda user: created.append(user.name))
+
+        try:
+            self.factory(User, 3).insert(batch_size=2, events=True)
+        finally:
+            User.flush_event_listeners()
+
+        self.assertEqual(3, len(created))
+        self.assertEqual(sorted(created), sorted(User.lists("name")))
+
+    def test_factory_insert_in_processes(self):
+        inserted = self.factory(User, 10).insert(batch_size=2, processes=2)
+
+        self.assertEqual(10, inserted)
+        self.assertEqual(10, User.count())
+
+
 
 class User(Model):
 
@@ -4,6 +4,7 @@ import simplejson as json
 import hashlib
 import time
 import datetime
+import threading
 from pendulum import Pendulum
 from flexmock import flexmock, flexmock_teardown
 from .. import OratorTestCase, mock
@@ -392,6 +393,40 @@ class OrmModelTestCase(OratorTestCase):
 
         model.reguard()
 
+    def test_date_attributes_are_parsed_once(self):
+        model = Model()
+        model.set_raw_attributes({"created_at": "2015-03-24 12:30:00"})
+
+        with mock.patch.object(model, "as_datetime", wraps=model.as_datetime) as m:
+            created_at = model.created_at
+
+            self.assertIs(created_at, model.created_at)
+            self.assertEqual(1, m.call_count)
+
+            model.set_raw_attribute("created_at", "2016-03-24 12:30:00")
+
+            self.assertEqual(2016, model.created_at.year)
+            self.assertEqual(2, m.call_count)
+
+    def test_dates_are_stored_as_native_objects_with_native_dates(self):
+        resolver = flexmock(DatabaseManager)
+        resolver.should_receive("connection").and_return(
+            Connection(None, config={"native_dates": True})
+        )
+        OrmModelDatesStub.set_connection_resolver(DatabaseManager({}))
+
+        model = OrmModelDatesStub()
+        model.created_at = Pendulum(2015, 3, 24, 12, 30, 15, 500)
+        model.updated_at = datetime.date(2015, 3, 24)
+
+        attributes = model.get_attributes()
+        self.assertIs(datetime.datetime, type(attributes["created_at"]))
+        self.assertEqual(
+            datetime.datetime(2015, 3, 24, 12, 30, 15, 500), attributes["created_at"]
+        )
+        self.assertEqual(datetime.date(2015, 3, 24), attributes["updated_at"])
+        self.assertIsInstance(model.created_at, Pendulum)
+
     def test_insert_process(self):
         query = flexmock(Builder)
 
@@ -753,6 +788,36 @@ class OrmModelTestCase(OratorTestCase):
         self.assertEqual("24-03-15", d["created_at"])
         self.assertEqual("25-03-15", d["updated_at"])
 
+    def test_serialize_formats_date_strings_as_format_date(self):
+        model = Model()
+        dates = [
+            "2015-03-24",
+            "2015-03-24 12:34:56",
+            "2015-03-24T12:34:56",
+            "2015-03-24 12:34:56.000000",
+            "2015-03-24 12:34:56.5",
+            "2015-03-24 12:34:56.123456",
+            "2015-03-24T12:34:56+02:00",
+        ]
+
+        for date in dates:
+            model.set_raw_attributes({"created_at": date})
+
+            self.assertEqual(model._format_date(date), model.serialize()["created_at"])
+
+    def test_serialize_uses_overridden_serialization_hooks(self):
+        class Stub(Model):
+            def attributes_to_dict(self):
+                attributes = super(Stub, self).attributes_to_dict()
+                attributes["extra"] = True
+
+                return attributes
+
+        model = Stub()
+        model.set_raw_attributes({"name": "john"})
+
+        self.assertEqual({"name": "john", "extra": True}, model.serialize())
+
     def test_visible_creates_dict_whitelist(self):
         model = OrmModelStub()
         model.set_visible(["name"])
@@ -1041,6 +1106,105 @@ class OrmModelTestCase(OratorTestCase):
 
         self.assertEqual("stub", model.get_morph_name())
 
+    def test_events_without_listeners_are_not_dispatched(self):
+        flexmock(Event).should_receive("fire").never()
+        model = OrmModelEventsStub()
+
+        self.assertTrue(model._fire_model_event("saving"))
+
+    def test_event_listeners_table_is_rebuilt_when_listeners_change(self):
+        model = OrmModelEventsStub()
+        fired = []
+
+        OrmModelEventsStub.saving(lambda m: fired.append(("saving", m)))
+        self.assertTrue(model._fire_model_event("saving"))
+        self.assertTrue(model._fire_model_event("saved"))
+
+        OrmModelEventsStub.saved(lambda m: False)
+        self.assertFalse(model._fire_model_event("saved"))
+
+        OrmModelEventsStub.flush_event_listeners()
+        self.assertTrue(model._fire_model_event("saving"))
+        self.assertTrue(model._fire_model_event("saved"))
+
+        self.assertEqual([("saving", model)], fired)
+
+    def test_batch_events(self):
+        fired = []
+
+        class Observer(object):
+            def created(self, model):
+                fired.append(("created", model))
+
+            def created_batch(self, models):
+                fired.append(("created_batch", models.all()))
+
+        OrmModelEventsStub.observe(Observer())
+        OrmModelEventsStub.listen_batch("deleted", lambda models: False)
+
+        model1 = OrmModelEventsStub()
+        model2 = OrmModelEventsStub()
+
+        with OrmModelEventsStub.batch_events():
+            model1._fire_model_event("created")
+            model2._fire_model_event("created")
+            model1._fire_model_event("updated")
+
+            self.assertEqual([("created", model1), ("created", model2)], fired)
+
+        self.assertEqual(
+            [
+                ("created", model1),
+                ("created", model2),
+                ("created_batch", [model1, model2]),
+            ],
+            fired,
+        )
+
+        self.assertFalse(OrmModelEventsStub.fire_batch_event("deleted", [model1]))
+        self.assertTrue(OrmModelEventsStub.fire_batch_event("updated", [model1]))
+
+        OrmModelEventsStub.flush_event_listeners()
+
+    def test_event_listeners_table_is_rebuilt_when_the_dispatcher_changes(self):
+        model = OrmModelEventsStub()
+        events = mock.MagicMock()
+        events.fire.return_value = False
+
+        self.assertTrue(model._fire_model_event("saving"))
+
+        OrmModelEventsStub.__dispatcher__ = events
+        try:
+            self.assertFalse(model._fire_model_event("saving"))
+        finally:
+            del OrmModelEventsStub.__dispatcher__
+
+        events.fire.assert_called_once_with("saving: OrmModelEventsStub", model)
+
+    def test_batch_events_are_local_to_threads(self):
+        fired = []
+
+        OrmModelEventsStub.listen_batch(
+            "created", lambda models: fired.append(models.all())
+        )
+
+        model1 = OrmModelEventsStub()
+        model2 = OrmModelEventsStub()
+
+        with OrmModelEventsStub.batch_events():
+            model1._fire_model_event("created")
+
+            thread = threading.Thread(
+                target=lambda: model2._fire_model_event("created")
+            )
+            thread.start()
+            thread.join()
+
+        self.assertEqual([[model1]], fired)
+
+        OrmModelEventsStub.flush_event_listeners()
+
+
 
 class OrmModelStub(Model):
 
@@ -1075,6 +1239,11 @@ class OrmModelStub(Model):
         return []
 
 
+class OrmModelDatesStub(Model):
+
+    __table__ = "stub"
+
+
 class OrmModelHydrateRawStub(Model):
     @classmethod
     def hydrate(cls, items, connection=None):
@@ -1178,3 +1347,8 @@ class OrmModelUpdatedAt(Model):
 class OrmModelDefaultAttributes(Model):
 
     __attributes__ = {"foo": "bar"}
+
+
+class OrmModelEventsStub(Model):
+
+    pass
@@ -92,6 +92,43 @@ class ModelGlobalScopesTestCase(OratorTestCase):
             query.get_bindings(),
         )
 
+    def test_query_template_is_rebuilt_when_a_global_scope_is_added(self):
+        class TemplateModel(Model):
+
+            __table__ = "table"
+
+        template = TemplateModel._get_query_template()
+
+        self.assertIs(template, TemplateModel._get_query_template())
+        self.assertEqual('SELECT * FROM "table"', TemplateModel.query().to_sql())
+
+        TemplateModel.add_global_scope("active", lambda q: q.where("active", 1))
+
+        self.assertIsNot(template, TemplateModel._get_query_template())
+        self.assertEqual(
+            'SELECT * FROM "table" WHERE "active" = ?', TemplateModel.query().to_sql()
+        )
+
+    def test_query_template_is_rebuilt_when_eager_loads_change(self):
+        class TemplateModel(Model):
+
+            __table__ = "table"
+
+            __attributes__ = {"active": True}
+
+        first = TemplateModel.query().get_model()
+        second = TemplateModel.query().get_model()
+        first.active = False
+
+        self.assertIsNot(first, second)
+        self.assertTrue(second.active)
+        self.assertFalse(second.exists)
+        self.assertEqual({}, TemplateModel.query().get_eager_loads())
+
+        TemplateModel._with = ["foo"]
+
+        self.assertEqual(["foo"], list(TemplateModel.query().get_eager_loads()))
+
 
 class CallableGlobalScopesModel(Model):
 
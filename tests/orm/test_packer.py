@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+import datetime
+from unittest import skipIf
+
+from .. import OratorTestCase
+from orator import Model
+from orator.orm import Collection
+from orator.orm.packer import ModelPacker
+from orator.utils import fast_pack
+
+
+class ModelPackerTestCase(OratorTestCase):
+    def tearDown(self):
+        fast_pack.use_backend("pickle")
+
+        super(ModelPackerTestCase, self).tearDown()
+
+    def test_collections_round_trip(self):
+        created_at = datetime.datetime(2018, 1, 1, 12, 30)
+        users = PackedUserCollection(
+            [
+                self._model(
+                    PackedUser, {"id": 1, "name": "foo", "created_at": created_at}
+                ),
+                self._model(PackedUser, {"id": 2, "name": "bar", "created_at": None}),
+            ]
+        )
+        users[1].set_exists(False)
+
+        loaded = Collection.loads(users.dumps())
+
+        self.assertIsInstance(loaded, PackedUserCollection)
+        self.assertEqual(2, len(loaded))
+        self.assertIsInstance(loaded[0], PackedUser)
+        self.assertEqual(
+            {"id": 1, "name": "foo", "created_at": created_at},
+            loaded[0].get_attributes(),
+        )
+        self.assertEqual(loaded[0].get_attributes(), loaded[0].get_original())
+        self.assertFalse(loaded[0].is_dirty())
+        self.assertTrue(loaded[0].exists)
+        self.assertFalse(loaded[1].exists)
+
+    def test_relations_are_packed_recursively(self):
+        posts = Collection(
+            [
+                self._model(PackedPost, {"id": 1, "user_id": 1}),
+                self._model(PackedPost, {"id": 2, "user_id": 1}),
+            ]
+        )
+        posts[0].set_relation("user", self._model(PackedUser, {"id": 1}))
+
+        user = self._model(PackedUser, {"id": 1, "name": "foo"})
+        user.set_relation("posts", posts)
+        user.set_relation("profile", None)
+        user.set_relation("empty", Collection([]))
+
+        loaded = Collection.loads(Collection([user]).dumps())[0]
+
+        self.assertEqual(["empty", "posts", "profile"], sorted(loaded.get_relations()))
+        self.assertIsNone(loaded.get_relation("profile"))
+        self.assertEqual(0, len(loaded.get_relation("empty")))
+        self.assertIsInstance(loaded.get_relation("posts"), Collection)
+        self.assertEqual([1, 2], [p.id for p in loaded.get_relation("posts")])
+        self.assertEqual(
+            {"id": 1},
+            loaded.get_relation("posts")[0].get_relation("user").get_attributes(),
+        )
+
+    def test_models_with_the_same_columns_share_a_schema(self):
+        users = Collection(
+            [
+                self._model(PackedUser, {"id": 1, "name": "foo"}),
+                self._model(PackedUser, {"id": 2, "name": "bar"}),
+                self._model(PackedUser, {"id": 3}),
+                self._model(PackedPost, {"id": 1, "user_id": 1}),
+            ]
+        )
+
+        _, classes, schemas, _, rows = ModelPacker().pack(users)
+
+        self.assertEqual(
+            ((1, ("id", "name")), (1, ("id",)), (2, ("id", "user_id"))), schemas
+        )
+        self.assertEqual((1, "foo"), rows[0][1])
+        self.assertEqual([0, 0, 1, 2], [row[0] for row in rows])
+        self.assertEqual(
+            (
+                "orator.orm.collection:Collection",
+                "tests.orm.test_packer:PackedUser",
+                "tests.orm.test_packer:PackedPost",
+            ),
+            classes,
+        )
+
+    def test_packed_data_is_smaller_than_pickles(self):
+        users = Collection(
+            [
+                self._model(PackedUser, {"id": i, "name": "user %d" % i})
+                for i in range(100)
+            ]
+        )
+
+        self.assertLess(
+            len(users.dumps()), len(pickle.dumps(users, pickle.HIGHEST_PROTOCOL))
+        )
+
+    def test_unsupported_format_raises_an_error(self):
+        state = (0, (), (), 0, ())
+
+        self.assertRaises(ValueError, ModelPacker().unpack, state)
+
+    def test_unsupported_backend_raises_an_error(self):
+        self.assertRaises(ValueError, fast_pack.use_backend, "foo")
+
+    @skipIf(fast_pack.msgpack is None, "msgpack is not installed")
+    def test_msgpack_backend(self):
+        created_at = datetime.datetime(2018, 1, 1, 12, 30)
+        users = Collection(
+            [self._model(PackedUser, {"id": 1, "created_at": created_at})]
+        )
+
+        fast_pack.use_backend("msgpack")
+        data = users.dumps()
+
+        fast_pack.use_backend("pickle")
+        loaded = Collection.loads(data)
+
+        self.assertNotEqual(b"\x80", data[:1])
+        self.assertEqual(
+            {"id": 1, "created_at": created_at}, loaded[0].get_attributes()
+        )
+
+    def _model(self, klass, attributes):
+        model = klass()
+        model.set_raw_attributes(attributes, True)
+        model.set_exists(True)
+
+        return model
+
+
+class PackedUserCollection(Collection):
+
+    pass
+
+
+class PackedUser(Model):
+
+    __table__ = "packed_users"
+
+
+class PackedPost(Model):
+
+    __table__ = "packed_posts"
@@ -28,3 +28,15 @@ class LengthAwarePaginatorTestCase(OratorTestCase):
         self.assertEqual(2, p.current_page)
         self.assertEqual(3, p.last_page)
         self.assertEqual(5, p.total)
+
+    def test_approximate_total_does_not_hide_requested_page(self):
+        p = LengthAwarePaginator(["item5"], 3, 2, 3, approximate=True)
+
+        self.assertTrue(p.approximate)
+        self.assertEqual(3, p.current_page)
+        self.assertEqual(3, p.last_page)
+
+        p = LengthAwarePaginator(["item5"], 3, 2, 3)
+
+        self.assertFalse(p.approximate)
+        self.assertEqual(2, p.current_page)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+from .. import OratorTestCase
+from orator import DatabaseManager
+from orator.exceptions.query import QueryBudgetExceeded
+
+
+class QueryBudgetTestCase(OratorTestCase):
+
+    databases = {
+        "default": "test",
+        "test": {"driver": "sqlite", "database": ":memory:"},
+        "other": {"driver": "sqlite", "database": ":memory:"},
+    }
+
+    def setUp(self):
+        self.db = DatabaseManager(self.databases)
+
+        with self.db.connection().get_schema_builder().create("users") as table:
+            table.increments("id")
+            table.string("name")
+
+        self.db.table("users").insert([{"name": "foo"}, {"name": "bar"}])
+
+    def test_queries_within_the_budget(self):
+        with self.db.query_budget(max_queries=2, max_time_ms=10000) as budget:
+            self.load_user(1)
+            self.load_user(2)
+
+        self.assertEqual(2, budget.count())
+        self.assertEqual(2, budget.count("test"))
+        self.assertEqual([], budget.duplicates())
+        self.assertFalse(budget.is_exceeded())
+
+    def test_exceeded_budget_reports_the_call_sites(self):
+        with self.assertRaises(QueryBudgetExceeded) as e:
+            with self.db.query_budget(max_queries=2):
+                for _ in range(3):
+                    self.load_user(1)
+
+        report = str(e.exception)
+
+        self.assertIn("Query budget: 3 queries (max 2)", report)
+        self.assertIn("  test: 3", report)
+        self.assertIn(
+            '  3x [test] SELECT * FROM "users" WHERE "id" = ? LIMIT 1 ([1])', report
+        )
+        self.assertIn("test_budget.py", report)
+        self.assertIn("in load_user", report)
+
+    def test_duplicates_can_be_forbidden(self):
+        budget = self.db.query_budget(allow_duplicates=False)
+
+        with budget:
+            self.load_user(1)
+            self.load_user(2)
+
+        self.assertFalse(budget.is_exceeded())
+
+        with self.assertRaises(QueryBudgetExceeded) as e:
+            with budget:
+                self.load_user(1)
+                self.load_user(1)
+
+        self.assertIn("Duplicated queries:", str(e.exception))
+
+    def test_time_budget(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            with self.db.query_budget(max_time_ms=0) as budget:
+                self.load_user(1)
+
+        self.assertGreater(budget.total_time(), 0)
+
+    def test_connections_opened_inside_the_budget_are_watched(self):
+        with self.db.query_budget() as budget:
+            self.db.connection("other").select("SELECT 1")
+            self.db.connection("other").select("SELECT 1")
+
+        self.assertEqual(2, budget.count("other"))
+        self.assertEqual(1, len(budget.duplicates()))
+        self.assertEqual([], self.db._query_budgets)
+
+        self.db.connection("other").select("SELECT 1")
+        self.assertEqual(2, budget.count())
+
+    def test_connection_budget_as_decorator(self):
+        connection = self.db.connection()
+
+        @connection.query_budget(max_queries=1)
+        def load():
+            return self.load_user(1)
+
+        # Each call has its own budget
+        self.assertEqual("foo", load()["name"])
+        self.assertEqual("foo", load()["name"])
+
+        @connection.query_budget(max_queries=1)
+        def load_twice():
+            self.load_user(1)
+            self.load_user(2)
+
+        self.assertRaises(QueryBudgetExceeded, load_twice)
+
+    def load_user(self, id):
+        return self.db.table("users").where("id", id).first()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+from .. import OratorTestCase
+from orator import DatabaseManager
+
+
+class CounterBufferTestCase(OratorTestCase):
+
+    databases = {"test": {"driver": "sqlite", "database": ":memory:"}}
+
+    def setUp(self):
+        self.db = DatabaseManager(self.databases)
+
+        with self.db.connection().get_schema_builder().create("posts") as table:
+            table.increments("id")
+            table.integer("views").default(0)
+
+        self.db.table("posts").insert([{"views": 0} for _ in range(3)])
+
+        self.queries = []
+        self.db.connection().listen(
+            lambda query, bindings, time_: self.queries.append(query)
+        )
+
+    def test_increments_are_aggregated(self):
+        counters = self.db.counters("posts", "views", interval=None, max_keys=None)
+
+        self.assertIs(counters, self.db.counters("posts", "views"))
+
+        for _ in range(10):
+            counters.increment(1)
+            counters.increment(2, 3)
+
+        counters.decrement(3)
+        counters.decrement(3, -1)
+
+        self.assertEqual([], self.queries)
+        self.assertEqual({1: 10, 2: 30, 3: 0}, counters.pending())
+
+        flushes = []
+        counters.listen(flushes.append)
+        flush = counters.flush()
+
+        self.assertEqual(1, len(self.queries))
+        self.assertEqual([flush], flushes)
+        self.assertEqual(2, flush.keys)
+        self.assertEqual(22, flush.increments)
+        self.assertEqual(2, flush.affected)
+        self.assertEqual(
+            [10, 30, 0], self.db.table("posts").order_by("id").lists("views")
+        )
+        self.assertIsNone(counters.flush())
+
+    def test_buffer_is_flushed_when_full(self):
+        counters = self.db.counters("posts", "views", interval=None, max_keys=2)
+
+        self.assertIsNone(counters.increment(1))
+        self.assertIsNone(counters.increment(1))
+        self.assertEqual(2, counters.increment(2).keys)
+        self.assertEqual({}, counters.pending())
+        self.assertEqual(
+            [2, 1, 0], self.db.table("posts").order_by("id").lists("views")
+        )
+
+    def test_buffer_is_flushed_after_interval(self):
+        counters = self.db.counters("posts", "views", interval=0, max_keys=None)
+
+        self.assertIsNotNone(counters.increment(1))
+        self.assertEqual(1, self.db.table("posts").where("id", 1).pluck("views"))
+
+    def test_failed_flush_keeps_increments(self):
+        counters = self.db.counters("posts", "unknown", interval=None, max_keys=None)
+        counters.increment(1)
+
+        self.assertRaises(Exception, counters.flush)
+        self.assertEqual({1: 1}, counters.pending())
+
+        counters.decrement(1)
+        self.assertIsNone(counters.close())
+
+    def test_disconnect_flushes_counters(self):
+        counters = self.db.counters("posts", "views", interval=None, max_keys=None)
+        counters.increment(1)
+
+        self.db.connection().disconnect()
+
+        self.assertEqual({}, counters.pending())
+
+    def test_disconnect_closes_the_connection_when_a_flush_fails(self):
+        connection = self.db.connection()
+        counters = self.db.counters("posts", "unknown", interval=None, max_keys=None)
+        counters.increment(1)
+
+        self.assertRaises(Exception, connection.disconnect)
+        self.assertIsNone(connection.get_connection())
+        self.assertIsNone(connection.get_read_connection())
+        self.assertEqual({1: 1}, counters.pending())
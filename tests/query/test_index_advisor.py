@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+from .. import OratorTestCase
+from orator import DatabaseManager
+from orator.query.advisor import IndexAdvisor
+from orator.schema import Blueprint
+
+
+class IndexAdvisorTestCase(OratorTestCase):
+
+    databases = {"test": {"driver": "sqlite", "database": ":memory:"}}
+
+    def setUp(self):
+        self.db = DatabaseManager(self.databases)
+
+        with self.db.connection().get_schema_builder().create("users") as table:
+            table.increments("id")
+            table.string("email")
+            table.integer("votes")
+
+        self.db.table("users").insert(
+            [{"email": "john%d@doe.com" % i, "votes": i} for i in range(20)]
+        )
+
+    def test_suggestions_for_full_scans_on_large_tables(self):
+        advisor = IndexAdvisor(self.db.connection(), min_rows=10)
+
+        with advisor.watch():
+            self.db.table("users").where("email", "john@doe.com").get()
+            self.db.table("users").where("votes", ">", 3).where("email", "foo").get()
+            self.db.table("users").where("votes", ">", 3).where("email", "bar").get()
+            self.db.table("users").where("id", 3).get()
+
+        self.db.table("users").where("votes", 1).get()
+
+        suggestions = advisor.suggestions()
+
+        self.assertEqual(2, len(suggestions))
+        self.assertEqual("users", suggestions[0].table)
+        self.assertEqual(["email", "votes"], suggestions[0].columns)
+        self.assertEqual(2, suggestions[0].occurrences)
+        self.assertEqual(20, suggestions[0].rows)
+        self.assertEqual(["email"], suggestions[1].columns)
+        self.assertEqual("table.index(['email', 'votes'])", suggestions[0].definition())
+
+        blueprint = Blueprint("users")
+        suggestions[0].apply(blueprint)
+        self.assertEqual(["email", "votes"], blueprint.get_commands()[0].columns)
+
+    def test_small_tables_are_ignored(self):
+        advisor = IndexAdvisor(self.db.connection(), min_rows=100)
+        advisor.add('SELECT * FROM "users" WHERE "email" = ?', ["foo"])
+
+        self.assertEqual(1, len(advisor.plans()))
+        self.assertEqual([], advisor.full_scans())
+        self.assertEqual([], advisor.suggestions())
+
+    def test_index_scans_are_ignored(self):
+        with self.db.connection().get_schema_builder().table("users") as table:
+            table.index("email")
+
+        advisor = IndexAdvisor(self.db.connection(), min_rows=10)
+        advisor.add('SELECT * FROM "users" WHERE "email" = ?', ["foo"])
+
+        self.assertEqual([], advisor.suggestions())
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
 import re
+import datetime
+import simplejson as json
+from pendulum import Pendulum
 
 from .. import OratorTestCase
 from .. import mock
@@ -8,6 +11,7 @@ from .. import mock
 from ..utils import MockConnection, MockProcessor
 
 from orator.exceptions import ArgumentError
+from orator.exceptions.query import QueryException
 from orator.query.grammars import (
     QueryGrammar,
     PostgresQueryGrammar,
@@ -15,6 +19,10 @@ from orator.query.grammars import (
     MySQLQueryGrammar,
 )
 from orator.query.builder import QueryBuilder
+from orator.query.processors import QueryProcessor
+from orator.query.processors.sqlite_processor import SQLiteQueryProcessor
+from orator.query.processors.postgres_processor import PostgresQueryProcessor
+from orator.query.processors.mysql_processor import MySQLQueryProcessor
 from orator.query.expression import QueryExpression
 from orator.query.join_clause import JoinClause
 from orator.support import Collection
@@ -1212,6 +1220,80 @@ class QueryBuilderTestCase(OratorTestCase):
         )
         self.assertTrue(result)
 
+    def test_upsert_method(self):
+        builder = self.get_postgres_builder()
+        query = (
+            'INSERT INTO "users" ("email", "name") VALUES (%s, %s), (%s, %s) '
+            'ON CONFLICT ("email") DO UPDATE SET "name" = EXCLUDED."name"'
+        )
+        builder.get_connection().insert.return_value = True
+        result = builder.from_("users").upsert(
+            ["email"],
+            ["name"],
+            [{"email": "foo", "name": "john"}, {"email": "bar", "name": "jane"}],
+        )
+        builder.get_connection().insert.assert_called_once_with(
+            query, ["foo", "john", "bar", "jane"]
+        )
+        self.assertTrue(result)
+
+    def test_upsert_method_without_updated_columns(self):
+        builder = self.get_postgres_builder()
+        query = (
+            'INSERT INTO "users" ("email") VALUES (%s) '
+            'ON CONFLICT ("email") DO NOTHING'
+        )
+        builder.from_("users").upsert(["email"], [], email="foo")
+        builder.get_connection().insert.assert_called_once_with(query, ["foo"])
+
+    def test_mysql_upsert_method(self):
+        builder = self.get_mysql_builder()
+        query = (
+            "INSERT INTO `users` (`email`, `name`) VALUES (%s, %s) "
+            "ON DUPLICATE KEY UPDATE `name` = VALUES(`name`)"
+        )
+        builder.from_("users").upsert(["email"], ["name"], email="foo", name="john")
+        builder.get_connection().insert.assert_called_once_with(query, ["foo", "john"])
+
+        builder = self.get_mysql_builder()
+        query = (
+            "INSERT INTO `users` (`email`) VALUES (%s) "
+            "ON DUPLICATE KEY UPDATE `email` = `email`"
+        )
+        builder.from_("users").upsert(["email"], [], email="foo")
+        builder.get_connection().insert.assert_called_once_with(query, ["foo"])
+
+    def test_sqlite_upsert_method(self):
+        builder = self.get_sqlite_builder()
+        query = (
+            'INSERT INTO "users" ("email", "name") VALUES (?, ?), (?, ?) '
+            'ON CONFLICT ("email") DO UPDATE SET "name" = EXCLUDED."name"'
+        )
+        builder.from_("users").upsert(
+            ["email"],
+            ["name"],
+            [{"email": "foo", "name": "john"}, {"email": "bar", "name": "jane"}],
+        )
+        builder.get_connection().insert.assert_called_once_with(
+            query, ["foo", "john", "bar", "jane"]
+        )
+
+    def test_upsert_is_chunked_by_the_parameters_limit(self):
+        builder = self.get_sqlite_builder()
+        builder.get_grammar().max_parameters = 4
+        builder.get_connection().transaction = mock.MagicMock()
+        builder.from_("users").upsert(
+            ["email"],
+            ["name"],
+            [{"email": "foo%d" % i, "name": "john"} for i in range(5)],
+        )
+
+        calls = builder.get_connection().insert.call_args_list
+        self.assertEqual(3, len(calls))
+        self.assertEqual(["foo0", "john", "foo1", "john"], calls[0][0][1])
+        self.assertEqual(["foo4", "john"], calls[2][0][1])
+        builder.get_connection().transaction.assert_called_once_with()
+
     def test_insert_get_id_method(self):
         builder = self.get_builder()
         builder.get_processor().process_insert_get_id.return_value = 1
@@ -1278,6 +1360,43 @@ class QueryBuilderTestCase(OratorTestCase):
         builder.get_connection().update.assert_called_with(query, ["foo", "bar", 1])
         self.assertEqual(1, result)
 
+    def test_increment_many(self):
+        builder = self.get_builder()
+        builder.get_connection().update.return_value = 2
+        result = (
+            builder.from_("posts")
+            .where("published", True)
+            .increment_many("views", {1: 5, 2: -1})
+        )
+        builder.get_connection().update.assert_called_with(
+            'UPDATE "posts" SET "views" = "views" + '
+            'CASE "id" WHEN ? THEN ? WHEN ? THEN ? END '
+            'WHERE "published" = ? AND "id" IN (?, ?)',
+            [1, 5, 2, -1, True, 1, 2],
+        )
+        self.assertEqual(2, result)
+
+        builder = self.get_postgres_builder()
+        builder.from_("posts").increment_many("views", {1: 5, 2: -1})
+        builder.get_connection().update.assert_called_with(
+            'UPDATE "posts" SET "views" = "posts"."views" + "counters"."amount" '
+            'FROM (VALUES (%s, %s), (%s, %s)) AS "counters" ("key", "amount") '
+            'WHERE "posts"."id" = "counters"."key" AND ("id" IN (%s, %s))',
+            [1, 5, 2, -1, 1, 2],
+        )
+
+        builder = self.get_postgres_builder()
+        builder.from_("posts").increment_many("views", {"a": 1}, key="slug")
+        builder.get_connection().update.assert_called_with(
+            'UPDATE "posts" SET "views" = "views" + CASE "slug" WHEN %s THEN %s END '
+            'WHERE "slug" IN (%s)',
+            ["a", 1, "a"],
+        )
+
+        builder = self.get_builder()
+        self.assertEqual(0, builder.from_("posts").increment_many("views", {}))
+        self.assertFalse(builder.get_connection().update.called)
+
     def test_update_with_dictionaries(self):
         builder = self.get_builder()
         query = 'UPDATE "users" SET "email" = ?, "name" = ? WHERE "id" = ?'
@@ -1310,6 +1429,25 @@ class QueryBuilderTestCase(OratorTestCase):
             'SELECT * FROM "" WHERE strftime(\'%Y-%m-%d\', "date") = ?',
         )
 
+    def test_date_bindings(self):
+        builder = self.get_builder()
+        builder.where("created_at", ">", Pendulum(2018, 10, 20, 12, 30))
+        builder.where("day", datetime.date(2018, 10, 20))
+
+        self.assertEqual(
+            ["2018-10-20 12:30:00.000000", "2018-10-20 00:00:00.000000"],
+            builder.get_bindings(),
+        )
+
+        builder._grammar.set_native_dates(True)
+        bindings = builder.get_bindings()
+
+        self.assertEqual(
+            [datetime.datetime(2018, 10, 20, 12, 30), datetime.date(2018, 10, 20)],
+            bindings,
+        )
+        self.assertIs(datetime.datetime, type(bindings[0]))
+
     def test_update_with_joins(self):
         builder = self.get_builder()
         query = (
@@ -1556,6 +1694,236 @@ class QueryBuilderTestCase(OratorTestCase):
         )
         self.assertEqual(["baz"], builder.get_bindings())
 
+    def test_explain(self):
+        builder = self.get_builder()
+        builder.get_connection().select = mock.MagicMock(return_value=[])
+        builder.get_processor().process_explain = mock.MagicMock(return_value="plan")
+        builder.select("*").from_("users").where("email", "foo")
+
+        self.assertEqual("plan", builder.explain())
+        builder.get_connection().select.assert_called_once_with(
+            'EXPLAIN SELECT * FROM "users" WHERE "email" = ?', ["foo"], True
+        )
+        builder.get_processor().process_explain.assert_called_once_with(
+            builder, 'SELECT * FROM "users" WHERE "email" = ?', ["foo"], []
+        )
+
+    def test_explain_per_grammar(self):
+        builder = self.get_sqlite_builder()
+        builder.get_connection().select = mock.MagicMock(return_value=[])
+        builder.from_("users").explain()
+        builder.get_connection().select.assert_called_once_with(
+            'EXPLAIN QUERY PLAN SELECT * FROM "users"', [], True
+        )
+
+        builder = self.get_mysql_builder()
+        builder.get_connection().select = mock.MagicMock(return_value=[])
+        builder.from_("users").explain()
+        builder.get_connection().select.assert_called_once_with(
+            "EXPLAIN FORMAT=JSON SELECT * FROM `users`", [], True
+        )
+
+        builder = self.get_postgres_builder()
+        builder.get_connection().select = mock.MagicMock(return_value=[])
+        builder.from_("users").explain(analyze=True)
+        builder.get_connection().select.assert_called_once_with(
+            'EXPLAIN (ANALYZE, FORMAT JSON) SELECT * FROM "users"', [], True
+        )
+
+    def test_paginate_with_estimated_total(self):
+        builder = self.get_postgres_builder()
+        builder.get_connection().select = mock.MagicMock(
+            side_effect=[[{"estimate": 1000}], [{"id": 1}]]
+        )
+        builder.get_processor().process_table_row_estimate = (
+            QueryProcessor().process_table_row_estimate
+        )
+
+        paginator = builder.from_("users").paginate(15, 2, total="estimate")
+
+        self.assertEqual(1000, paginator.total)
+        self.assertTrue(paginator.approximate)
+        self.assertEqual(
+            mock.call(
+                "SELECT reltuples::bigint AS estimate FROM pg_class "
+                "WHERE oid = %s::regclass",
+                ["users"],
+            ),
+            builder.get_connection().select.call_args_list[0],
+        )
+
+    def test_estimated_total_falls_back_on_count(self):
+        builder = self.get_sqlite_builder()
+        builder.get_connection().select = mock.MagicMock(
+            side_effect=QueryException("", [], Exception("no such table"))
+        )
+        builder.count = mock.MagicMock(return_value=42)
+
+        self.assertEqual(
+            (42, False), builder.from_("users").get_total_for_pagination("estimate")
+        )
+
+        # SQLite has no planner estimates for filtered queries
+        builder.get_connection().select.reset_mock()
+        builder.where("votes", ">", 10).get_total_for_pagination("estimate")
+        self.assertFalse(builder.get_connection().select.called)
+
+    def test_cached_total_is_reused(self):
+        QueryBuilder.flush_count_cache()
+
+        builder = self.get_builder()
+        builder.get_connection().get_name = mock.MagicMock(return_value="default")
+        builder.count = mock.MagicMock(return_value=42)
+        builder.from_("users").where("votes", ">", 10)
+
+        self.assertEqual((42, False), builder.get_total_for_pagination("cached"))
+        self.assertEqual((42, True), builder.get_total_for_pagination("cached"))
+        builder.count.assert_called_once_with()
+
+        builder.where("votes", "<", 20)
+        self.assertEqual((42, False), builder.get_total_for_pagination("cached", 60))
+        self.assertEqual(2, builder.count.call_count)
+
+        QueryBuilder.flush_count_cache()
+
+    def test_expired_cached_totals_pruned_by_another_thread_are_ignored(self):
+        class PrunedCache(dict):
+            def items(self):
+                items = list(dict.items(self))
+
+                # Another thread prunes the expired totals meanwhile
+                self.clear()
+
+                return items
+
+        builder = self.get_builder()
+        builder.get_connection().get_name = mock.MagicMock(return_value="default")
+        builder.count = mock.MagicMock(return_value=42)
+        builder.from_("users")
+
+        with mock.patch.object(
+            QueryBuilder, "_count_cache", PrunedCache(expired=(1, 0))
+        ):
+            self.assertEqual((42, False), builder.get_total_for_pagination("cached"))
+
+    def test_sqlite_explain_plan_is_normalized(self):
+        results = [
+            {"id": 2, "parent": 0, "notused": 0, "detail": "SCAN TABLE users"},
+            {
+                "id": 4,
+                "parent": 0,
+                "notused": 0,
+                "detail": "SEARCH posts USING INDEX posts_user_id_index (user_id=?)",
+            },
+            {
+                "id": 8,
+                "parent": 0,
+                "notused": 0,
+                "detail": "USE TEMP B-TREE FOR ORDER BY",
+            },
+        ]
+
+        plan = SQLiteQueryProcessor().process_explain(None, "SELECT", [], results)
+
+        self.assertEqual(3, len(plan.nodes))
+        self.assertEqual(["users", "posts"], plan.tables())
+        self.assertEqual("full", plan.nodes[0].scan_type)
+        self.assertEqual("index", plan.nodes[1].scan_type)
+        self.assertEqual("posts_user_id_index", plan.nodes[1].index)
+        self.assertEqual("other", plan.nodes[2].scan_type)
+        self.assertEqual([plan.nodes[0]], plan.full_scans())
+        self.assertTrue(plan.uses_index("posts_user_id_index"))
+
+    def test_postgres_explain_plan_is_normalized(self):
+        results = [
+            [
+                [
+                    {
+                        "Plan": {
+                            "Node Type": "Nested Loop",
+                            "Total Cost": 42.5,
+                            "Plan Rows": 10,
+                            "Plans": [
+                                {
+                                    "Node Type": "Seq Scan",
+                                    "Relation Name": "users",
+                                    "Total Cost": 20.0,
+                                    "Plan Rows": 1000,
+                                    "Filter": "(votes > 3)",
+                                },
+                                {
+                                    "Node Type": "Index Only Scan",
+                                    "Relation Name": "posts",
+                                    "Index Name": "posts_user_id_index",
+                                    "Total Cost": 2.1,
+                                    "Plan Rows": 1,
+                                },
+                            ],
+                        }
+                    }
+                ]
+            ]
+        ]
+
+        plan = PostgresQueryProcessor().process_explain(None, "SELECT", [], results)
+
+        self.assertEqual(42.5, plan.cost)
+        self.assertEqual("Nested Loop", plan.root.operation)
+        users, posts = plan.root.children
+        self.assertEqual("full", users.scan_type)
+        self.assertEqual(1000, users.rows)
+        self.assertEqual("(votes > 3)", users.detail)
+        self.assertEqual("covering", posts.scan_type)
+        self.assertEqual("posts_user_id_index", posts.index)
+
+    def test_mysql_explain_plan_is_normalized(self):
+        results = [
+            {
+                "EXPLAIN": json.dumps(
+                    {
+                        "query_block": {
+                            "select_id": 1,
+                            "cost_info": {"query_cost": "12.40"},
+                            "ordering_operation": {
+                                "using_filesort": True,
+                                "nested_loop": [
+                                    {
+                                        "table": {
+                                            "table_name": "users",
+                                            "access_type": "ALL",
+                                            "rows_examined_per_scan": 100,
+                                            "cost_info": {"prefix_cost": "10.25"},
+                                            "attached_condition": "(`users`.`votes` > 3)",
+                                        }
+                                    },
+                                    {
+                                        "table": {
+                                            "table_name": "posts",
+                                            "access_type": "ref",
+                                            "key": "posts_user_id_index",
+                                            "rows_examined_per_scan": 1,
+                                        }
+                                    },
+                                ],
+                            },
+                        }
+                    }
+                )
+            }
+        ]
+
+        plan = MySQLQueryProcessor().process_explain(None, "SELECT", [], results)
+
+        self.assertEqual(12.4, plan.cost)
+        self.assertEqual("ordering_operation", plan.root.children[0].operation)
+        users, posts = plan.root.children[0].children
+        self.assertEqual("full", users.scan_type)
+        self.assertEqual(100, users.rows)
+        self.assertEqual(10.25, users.cost)
+        self.assertEqual("index", posts.scan_type)
+        self.assertEqual("posts_user_id_index", posts.index)
+        self.assertEqual(["users", "posts"], plan.tables())
+
     def test_binding_order(self):
         expected_sql = (
             'SELECT * FROM "users" '
@@ -1618,6 +1986,42 @@ class QueryBuilderTestCase(OratorTestCase):
         self.assertEqual(expected_sql, builder.to_sql())
         self.assertEqual(expected_bindings, builder.get_bindings())
 
+    def test_chunk_by_id(self):
+        builder = self.get_builder()
+        builder.get_connection().select.side_effect = [
+            [{"id": 1}, {"id": 3}],
+            [{"id": 4}],
+        ]
+        builder.get_processor().process_select = mock.MagicMock(
+            side_effect=lambda builder_, results_: results_
+        )
+
+        chunks = list(
+            builder.from_("users")
+            .where("votes", ">", 10)
+            .order_by("name")
+            .chunk_by_id(2, max_id=10)
+        )
+
+        self.assertEqual([[{"id": 1}, {"id": 3}], [{"id": 4}]], chunks)
+        self.assertEqual(
+            [
+                mock.call(
+                    'SELECT * FROM "users" WHERE "votes" > ? AND "id" <= ? '
+                    'ORDER BY "id" ASC LIMIT 2',
+                    [10, 10],
+                    True,
+                ),
+                mock.call(
+                    'SELECT * FROM "users" WHERE "votes" > ? AND "id" <= ? '
+                    'AND "id" > ? ORDER BY "id" ASC LIMIT 2',
+                    [10, 10, 3],
+                    True,
+                ),
+            ],
+            builder.get_connection().select.call_args_list,
+        )
+
     def test_chunk(self):
         builder = self.get_builder()
         results = [{"foo": "bar"}, {"foo": "baz"}, {"foo": "bam"}, {"foo": "boom"}]
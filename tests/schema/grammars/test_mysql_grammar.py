@@ -4,6 +4,7 @@ from flexmock import flexmock, flexmock_teardown
 from orator.connections import Connection
 from orator.schema.grammars import MySQLSchemaGrammar
 from orator.schema.blueprint import Blueprint
+from orator.query.expression import QueryExpression
 from orator.connectors import MySQLConnector
 from ... import OratorTestCase
 
@@ -216,6 +217,25 @@ class MySQLSchemaGrammarTestCase(OratorTestCase):
             "ALTER TABLE `users` ADD INDEX baz(`foo`, `bar`)", statements[0]
         )
 
+    def test_adding_index_online(self):
+        blueprint = Blueprint("users")
+        blueprint.index(
+            ["foo", QueryExpression("lower(bar)")], "baz", using="btree", concurrently=True
+        )
+        blueprint.unique("foo", "bar", algorithm="copy", lock="shared")
+        statements = blueprint.to_sql(self.get_connection(), self.get_grammar())
+
+        self.assertEqual(2, len(statements))
+        self.assertEqual(
+            "ALTER TABLE `users` ADD INDEX baz USING BTREE(`foo`, (lower(bar))), "
+            "ALGORITHM=INPLACE, LOCK=NONE",
+            statements[0],
+        )
+        self.assertEqual(
+            "ALTER TABLE `users` ADD UNIQUE bar(`foo`), ALGORITHM=COPY, LOCK=SHARED",
+            statements[1],
+        )
+
     def test_adding_incrementing_id(self):
         blueprint = Blueprint("users")
         blueprint.increments("id")
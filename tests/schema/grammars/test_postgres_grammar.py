@@ -4,6 +4,7 @@ from flexmock import flexmock, flexmock_teardown
 from orator.connections import Connection
 from orator.schema.grammars import PostgresSchemaGrammar
 from orator.schema.blueprint import Blueprint
+from orator.query.expression import QueryExpression
 from ... import OratorTestCase
 
 
@@ -165,6 +166,50 @@ class PostgresSchemaGrammarTestCase(OratorTestCase):
         self.assertEqual(1, len(statements))
         self.assertEqual('CREATE INDEX baz ON "users" ("foo", "bar")', statements[0])
 
+    def test_adding_partial_covering_index(self):
+        blueprint = Blueprint("users")
+        blueprint.index(
+            "email",
+            "active_email",
+            where="deleted_at IS NULL",
+            include=["name", "votes"],
+            using="btree",
+        )
+        statements = blueprint.to_sql(self.get_connection(), self.get_grammar())
+
+        self.assertEqual(1, len(statements))
+        self.assertEqual(
+            'CREATE INDEX active_email ON "users" USING btree ("email") '
+            'INCLUDE ("name", "votes") WHERE deleted_at IS NULL',
+            statements[0],
+        )
+
+    def test_adding_index_concurrently(self):
+        blueprint = Blueprint("users")
+        blueprint.index("email", concurrently=True)
+        blueprint.drop_index("users_name_index", concurrently=True)
+        statements = blueprint.to_sql(self.get_connection(), self.get_grammar())
+
+        self.assertEqual(2, len(statements))
+        self.assertEqual(
+            'CREATE INDEX CONCURRENTLY users_email_index ON "users" ("email")',
+            statements[0],
+        )
+        self.assertEqual(
+            "DROP INDEX CONCURRENTLY users_name_index", statements[1]
+        )
+
+    def test_adding_expression_unique_index(self):
+        blueprint = Blueprint("users")
+        blueprint.unique(QueryExpression("lower(email)"))
+        statements = blueprint.to_sql(self.get_connection(), self.get_grammar())
+
+        self.assertEqual(1, len(statements))
+        self.assertEqual(
+            'CREATE UNIQUE INDEX users_lower_email_unique ON "users" (lower(email))',
+            statements[0],
+        )
+
     def test_adding_incrementing_id(self):
         blueprint = Blueprint("users")
         blueprint.increments("id")
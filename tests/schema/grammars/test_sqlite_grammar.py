@@ -4,6 +4,7 @@ from flexmock import flexmock, flexmock_teardown
 from orator.connections import Connection
 from orator.schema.grammars import SQLiteSchemaGrammar
 from orator.schema.blueprint import Blueprint
+from orator.query.expression import QueryExpression
 from ... import OratorTestCase
 
 
@@ -107,6 +108,20 @@ class SqliteSchemaGrammarTestCase(OratorTestCase):
         self.assertEqual(1, len(statements))
         self.assertEqual('CREATE INDEX bar ON "users" ("foo")', statements[0])
 
+    def test_adding_partial_expression_index(self):
+        blueprint = Blueprint("users")
+        blueprint.index(
+            QueryExpression("lower(email)"), where="deleted_at IS NULL", include="name"
+        )
+        statements = blueprint.to_sql(self.get_connection(), self.get_grammar())
+
+        self.assertEqual(1, len(statements))
+        self.assertEqual(
+            'CREATE INDEX users_lower_email_index ON "users" (lower(email)) '
+            "WHERE deleted_at IS NULL",
+            statements[0],
+        )
+
     def test_adding_incrementing_id(self):
         blueprint = Blueprint("users")
         blueprint.increments("id")
@@ -2,7 +2,7 @@
 
 from ... import OratorTestCase
 from . import IntegrationTestCase, User, Post
-from orator import Model
+from orator import Model, QueryExpression
 from orator.connections import SQLiteConnection
 from orator.connectors.sqlite_connector import SQLiteConnector
 
@@ -33,6 +33,24 @@ class SchemaBuilderSQLiteIntegrationTestCase(IntegrationTestCase, OratorTestCase
 
         self.assertEqual(len(old_foreign_keys), len(foreign_keys))
 
+    def test_partial_and_expression_indexes_survive_table_changes(self):
+        with self.schema().table("users") as table:
+            table.index("votes", "users_active_votes", where="votes > 0")
+            table.index(QueryExpression("lower(email)"))
+
+        with self.schema().table("users") as table:
+            table.rename_column("updated_at", "modified_at")
+
+        indexes = self.connection().get_schema_manager().list_table_indexes("users")
+
+        index = indexes["users_active_votes"]
+        self.assertEqual(["votes"], index.get_columns())
+        self.assertEqual("votes > 0", index.get_option("where"))
+
+        index = indexes["users_lower_email_index"]
+        self.assertEqual(["lower(email)"], index.get_columns())
+        self.assertFalse(index.has_option("where"))
+
 
 class SchemaBuilderSQLiteIntegrationCascadingTestCase(OratorTestCase):
     @classmethod
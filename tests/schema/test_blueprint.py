@@ -44,3 +44,13 @@ class SchemaBuilderTestCase(OratorTestCase):
         blueprint.drop_index(["foo"])
         commands = blueprint.get_commands()
         self.assertEqual("users_foo_index", commands[0].index)
+
+    def test_unique_index_options(self):
+        blueprint = Blueprint("users")
+        blueprint.unique("email", where="deleted_at IS NULL", include="name")
+        command = blueprint.get_commands()[0]
+        self.assertEqual("deleted_at IS NULL", command.where)
+        self.assertEqual(["name"], command.include)
+        self.assertNotIn("using", command.get_attributes())
+
+        self.assertRaises(TypeError, blueprint.unique, "email", whre="deleted_at")
@@ -32,6 +32,39 @@ class SeederTestCase(OratorTestCase):
 
         seeder.call(child)
 
+    def test_call_sorts_seeders_by_foreign_keys(self):
+        db = DatabaseManager({"sqlite": {"driver": "sqlite", "database": ":memory:"}})
+
+        with db.connection().get_schema_builder().create("users") as table:
+            table.increments("id")
+
+        with db.connection().get_schema_builder().create("posts") as table:
+            table.increments("id")
+            table.integer("user_id")
+            table.foreign("user_id").references("id").on("users")
+
+        calls = []
+
+        class PostsSeeder(Seeder):
+            tables = ["posts"]
+
+            def run(self):
+                calls.append("posts")
+
+        class UsersSeeder(Seeder):
+            tables = ["users"]
+
+            def run(self):
+                calls.append("users")
+
+        class OtherSeeder(Seeder):
+            def run(self):
+                calls.append("other")
+
+        Seeder(db).call([OtherSeeder, PostsSeeder, UsersSeeder])
+
+        self.assertEqual(["other", "users", "posts"], calls)
+
 
 class Command(BaseCommand):
 
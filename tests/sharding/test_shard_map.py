@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+from .. import OratorTestCase
+from orator.exceptions import ArgumentError
+from orator.sharding import HashShardMap, RangeShardMap
+
+
+class ShardMapTestCase(OratorTestCase):
+    def test_hash_shard_map_is_stable(self):
+        shard_map = HashShardMap(["a", "b", "c"])
+
+        shards = [shard_map.get_shard(value) for value in range(300)]
+
+        self.assertEqual(shards, [shard_map.get_shard(value) for value in range(300)])
+        self.assertEqual({"a", "b", "c"}, set(shards))
+        self.assertEqual(shard_map.get_shard(42), shard_map.get_shard("42"))
+
+    def test_range_shard_map(self):
+        shard_map = RangeShardMap([(100, "a"), (200, "b"), (None, "c")])
+
+        self.assertEqual(["a", "b", "c"], shard_map.get_shards())
+        self.assertEqual("a", shard_map.get_shard(-5))
+        self.assertEqual("a", shard_map.get_shard(99))
+        self.assertEqual("b", shard_map.get_shard(100))
+        self.assertEqual("c", shard_map.get_shard(10 ** 6))
+
+    def test_bounded_range_shard_map(self):
+        shard_map = RangeShardMap([("m", "a"), ("z", "b")])
+
+        self.assertEqual("a", shard_map.get_shard("foo"))
+        self.assertEqual("b", shard_map.get_shard("qux"))
+        self.assertRaises(ArgumentError, shard_map.get_shard, "zzz")
+
+    def test_invalid_shard_maps(self):
+        self.assertRaises(ArgumentError, HashShardMap, [])
+        self.assertRaises(ArgumentError, RangeShardMap, [(200, "a"), (100, "b")])
+        self.assertRaises(ArgumentError, RangeShardMap, [(None, "a"), (100, "b")])
+        self.assertRaises(ArgumentError, HashShardMap(["a"]).get_shard, None)
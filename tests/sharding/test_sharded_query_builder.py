@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import threading
+
+from .. import OratorTestCase
+from orator import DatabaseManager, Model
+from orator.exceptions import ArgumentError
+from orator.sharding import RangeShardMap, ShardedQueryBuilder
+
+
+class ShardedQueryBuilderTestCase(OratorTestCase):
+
+    shards = ["shard_1", "shard_2", "shard_3"]
+
+    check_same_thread = True
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+        config = {}
+        for shard in self.shards:
+            config[shard] = {
+                "driver": "sqlite",
+                "database": os.path.join(self.directory, "%s.db" % shard),
+                "check_same_thread": self.check_same_thread,
+            }
+
+        self.db = DatabaseManager(config)
+        self.db.set_shard_map(
+            "posts",
+            RangeShardMap([(10, "shard_1"), (20, "shard_2"), (None, "shard_3")]),
+        )
+
+        self.queries = dict((shard, []) for shard in self.shards)
+        self.threads = set()
+
+        for shard in self.shards:
+            connection = self.db.connection(shard)
+
+            with connection.get_schema_builder().create("posts") as table:
+                table.integer("id")
+                table.integer("user_id")
+                table.string("title")
+                table.integer("views").nullable()
+
+            connection.listen(
+                lambda query, bindings, time_, shard=shard: self.record(shard, query)
+            )
+
+        self.query().insert(
+            [
+                {"id": 1, "user_id": 1, "title": "a", "views": 5},
+                {"id": 2, "user_id": 15, "title": "b", "views": 10},
+                {"id": 3, "user_id": 25, "title": "c", "views": None},
+                {"id": 4, "user_id": 2, "title": "d", "views": 30},
+                {"id": 5, "user_id": 16, "title": "e", "views": 1},
+                {"id": 6, "user_id": 30, "title": "f", "views": 20},
+            ]
+        )
+
+        self.reset_queries()
+
+        Model.set_connection_resolver(self.db)
+
+    def tearDown(self):
+        for shard in self.shards:
+            self.db.purge(shard)
+
+        shutil.rmtree(self.directory)
+
+        super(ShardedQueryBuilderTestCase, self).tearDown()
+
+    def test_inserts_are_routed_to_the_shards(self):
+        ids = [
+            [row["id"] for row in self.db.connection(shard).table("posts").get()]
+            for shard in self.shards
+        ]
+
+        self.assertEqual([[1, 4], [2, 5], [3, 6]], ids)
+        self.assertRaises(ArgumentError, self.query().insert, {"id": 7})
+
+    def test_queries_constrained_on_the_shard_key_use_one_shard(self):
+        posts = self.query().where("user_id", 15).get()
+
+        self.assertEqual([2], [post["id"] for post in posts])
+        self.assertEqual([0, 1, 0], self.query_counts())
+
+        self.reset_queries()
+        self.query().where("posts.user_id", "=", 16).where("views", ">", 0).first()
+
+        self.assertEqual([0, 1, 0], self.query_counts())
+
+        self.reset_queries()
+        posts = self.query().where_in("user_id", [1, 25]).order_by("id").get()
+
+        self.assertEqual([1, 3], [post["id"] for post in posts])
+        self.assertEqual([1, 0, 1], self.query_counts())
+
+    def test_unconstrained_queries_scatter_across_all_shards(self):
+        posts = self.query().or_where("user_id", 15).or_where("views", 30).get()
+
+        self.assertEqual([2, 4], sorted(post["id"] for post in posts))
+        self.assertEqual([1, 1, 1], self.query_counts())
+        self.assertEqual(
+            not self.check_same_thread,
+            threading.current_thread().name not in self.threads,
+        )
+
+    def test_results_are_merged_following_the_orders(self):
+        posts = self.query().order_by("views", "desc").get()
+
+        self.assertEqual([4, 6, 2, 1, 5, 3], [post["id"] for post in posts])
+
+        posts = self.query().order_by("posts.title").skip(1).take(3).get()
+
+        self.assertEqual(["b", "c", "d"], [post["title"] for post in posts])
+
+    def test_aggregates_are_combined(self):
+        self.assertEqual(6, self.query().count())
+        self.assertEqual(66, self.query().sum("views"))
+        self.assertEqual(1, self.query().min("views"))
+        self.assertEqual(30, self.query().max("views"))
+        self.assertEqual(13.2, self.query().avg("views"))
+        self.assertEqual(2, self.query().where("views", ">", 10).count())
+        self.assertIsNone(self.query().where("views", ">", 100).max("views"))
+
+    def test_updates_and_deletes_are_sent_to_the_targeted_shards(self):
+        self.assertEqual(6, self.query().update(views=0))
+        self.assertEqual(1, self.query().where("user_id", 30).update(views=3))
+        self.assertEqual(3, self.query().sum("views"))
+
+        self.reset_queries()
+        self.assertEqual(2, self.query().where_in("user_id", [1, 2]).delete())
+        self.assertEqual([1, 0, 0], self.query_counts())
+        self.assertEqual(4, self.query().count())
+
+    def test_chunks_stream_the_rows_of_all_the_shards(self):
+        chunks = list(self.query().chunk(4))
+
+        self.assertEqual([4, 2], [len(chunk) for chunk in chunks])
+        self.assertEqual(
+            [1, 2, 3, 4, 5, 6], sorted(row["id"] for chunk in chunks for row in chunk)
+        )
+
+        chunks = list(self.query().order_by("views", "desc").skip(1).take(4).chunk(3))
+
+        self.assertEqual(
+            [[6, 2, 1], [5]], [[row["id"] for row in chunk] for chunk in chunks]
+        )
+
+        chunks = list(self.query().where("user_id", 15).chunk(4))
+
+        self.assertEqual([[2]], [[row["id"] for row in chunk] for chunk in chunks])
+
+        chunks = list(ShardedPost.order_by("id").chunk(5))
+
+        self.assertEqual(
+            [[1, 2, 3, 4, 5], [6]], [[post.id for post in chunk] for chunk in chunks]
+        )
+
+    def test_only_queries_targeting_a_single_shard_can_be_explained(self):
+        self.assertRaises(NotImplementedError, self.query().explain)
+
+        self.reset_queries()
+        plan = self.query().where("user_id", 15).explain()
+
+        self.assertIsNotNone(plan.root)
+        self.assertEqual([0, 1, 0], self.query_counts())
+
+    def test_estimated_counts_add_up_the_statistics_of_the_shards(self):
+        self.assertIsNone(self.query().estimate_count())
+
+        for shard in self.shards:
+            self.db.connection(shard).statement("ANALYZE")
+
+        self.assertEqual(6, self.query().estimate_count())
+        self.assertIsNone(self.query().where("views", ">", 1).estimate_count())
+
+    def test_sharded_models(self):
+        posts = ShardedPost.order_by("id").get()
+
+        self.assertEqual([1, 2, 3, 4, 5, 6], [post.id for post in posts])
+
+        post = ShardedPost.create(id=7, user_id=11, title="g")
+        self.assertEqual(3, self.db.connection("shard_2").table("posts").count())
+
+        self.reset_queries()
+        post = ShardedPost.where("user_id", 11).first()
+        post.title = "h"
+        post.save()
+
+        self.assertEqual([0, 2, 0], self.query_counts())
+        self.assertEqual("h", ShardedPost.where("id", 7).first().title)
+
+        self.reset_queries()
+        post.delete()
+
+        self.assertEqual([0, 1, 0], self.query_counts())
+        self.assertEqual(6, ShardedPost.count())
+
+    def test_sharded_models_boot_without_default_connection(self):
+        # Defined here so that the class is booted with a shard-only configuration
+        class BootedShardedPost(Model):
+
+            __table__ = "posts"
+
+            __connection__ = "posts"
+
+            __shard_key__ = "user_id"
+
+            __timestamps__ = False
+
+            __fillable__ = ["id", "user_id", "title"]
+
+        BootedShardedPost.create(id=8, user_id=21, title="i")
+
+        self.assertEqual(7, BootedShardedPost.count())
+
+    def query(self):
+        return ShardedQueryBuilder(self.db, "posts", "user_id").from_("posts")
+
+    def record(self, shard, query):
+        self.queries[shard].append(query)
+        self.threads.add(threading.current_thread().name)
+
+    def query_counts(self):
+        return [len(self.queries[shard]) for shard in self.shards]
+
+    def reset_queries(self):
+        for shard in self.shards:
+            del self.queries[shard][:]
+
+        self.threads.clear()
+
+
+class ParallelShardedQueryBuilderTestCase(ShardedQueryBuilderTestCase):
+
+    check_same_thread = False
+
+
+class ShardedPost(Model):
+
+    __table__ = "posts"
+
+    __connection__ = "posts"
+
+    __shard_key__ = "user_id"
+
+    __timestamps__ = False
+
+    __fillable__ = ["id", "user_id", "title"]
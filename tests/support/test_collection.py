@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import simplejson as json
+
 from .. import OratorTestCase
 from orator.support.collection import Collection
+from orator.utils import fast_json
 
 
 class CollectionTestCase(OratorTestCase):
@@ -256,3 +259,21 @@ class CollectionTestCase(OratorTestCase):
 
         c = Collection([1, [2, 3], 4])
         self.assertEqual([1, 2, 3, 4], c.flatten().all())
+
+    def test_iter_json_streams_a_json_array(self):
+        c = Collection([{"foo": "bar"}, 1, [2, 3], None, "baz"])
+
+        chunks = list(c.iter_json(chunk_size=2))
+
+        self.assertEqual(5, len(chunks))
+        self.assertEqual(c.serialize(), json.loads("".join(chunks)))
+
+    def test_iter_json_with_empty_collection(self):
+        self.assertEqual("[]", "".join(Collection().iter_json()))
+
+    def test_to_json_uses_simplejson_by_default(self):
+        c = Collection([{"id": 2, "name": u"é"}])
+
+        self.assertIsNone(fast_json.backend)
+        self.assertEqual('[{"id": 2, "name": "\\u00e9"}]', c.to_json())
+        self.assertRaises(ValueError, fast_json.use_backend, "foo")
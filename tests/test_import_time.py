@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import subprocess
+from unittest import skipIf
+
+from . import OratorTestCase
+from orator.utils.lazy import LAZY_MODULES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The modules that must only be imported on first use
+HEAVY_MODULES = [
+    "orator.orm",
+    "orator.connections.connection",
+    "pendulum",
+    "blinker",
+    "backpack",
+    "inflection",
+    "lazy_object_proxy",
+    "faker",
+    "psycopg2",
+    "MySQLdb",
+    "pymysql",
+    "yaml",
+    "pygments",
+]
+
+
+@skipIf(not LAZY_MODULES, "Modules are imported eagerly before Python 3.7")
+class ImportTimeTestCase(OratorTestCase):
+
+    # The import time budgets, in seconds
+    PACKAGE_BUDGET = 0.1
+    CLI_BUDGET = 0.3
+
+    def test_import_orator_is_lazy(self):
+        loaded, _ = self._import("import orator")
+
+        self.assertEqual([], [m for m in HEAVY_MODULES if m in loaded])
+
+    def test_import_cli_is_lazy(self):
+        loaded, _ = self._import("from orator.commands.application import application")
+
+        self.assertEqual([], [m for m in HEAVY_MODULES if m in loaded])
+        self.assertNotIn("orator.commands.migrations", loaded)
+
+    def test_attributes_are_imported_on_first_access(self):
+        loaded, _ = self._import("from orator import Model")
+
+        self.assertIn("orator.orm.model", loaded)
+        self.assertNotIn("faker", loaded)
+
+    def test_only_the_used_driver_is_imported(self):
+        loaded, _ = self._import(
+            "from orator import DatabaseManager; "
+            "DatabaseManager({'sqlite': {'driver': 'sqlite', 'database': ':memory:'}})"
+            ".connection().select('SELECT 1')"
+        )
+
+        self.assertIn("orator.connectors.sqlite_connector", loaded)
+        self.assertNotIn("orator.connectors.postgres_connector", loaded)
+        self.assertNotIn("orator.connectors.mysql_connector", loaded)
+
+    def test_import_orator_is_within_budget(self):
+        self.assertLess(self._best_time("import orator"), self.PACKAGE_BUDGET)
+
+    def test_import_cli_is_within_budget(self):
+        self.assertLess(
+            self._best_time("from orator.commands.application import application"),
+            self.CLI_BUDGET,
+        )
+
+    def _best_time(self, statement, repeat=3):
+        return min(self._import(statement)[1] for _ in range(repeat))
+
+    def _import(self, statement):
+        """
+        Run an import statement in a fresh interpreter.
+
+        :return: The loaded modules and the duration of the statement
+        :rtype: tuple
+        """
+        script = (
+            "import sys, json, timeit\n"
+            "start = timeit.default_timer()\n"
+            "%s\n"
+            "duration = timeit.default_timer() - start\n"
+            "print(json.dumps([sorted(sys.modules), duration]))\n"
+        ) % statement
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [ROOT] + [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p]
+        )
+
+        output = subprocess.check_output([sys.executable, "-c", script], env=env)
+        loaded, duration = json.loads(output.decode())
+
+        return set(loaded), duration